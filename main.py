@@ -12,12 +12,18 @@ Usage:
     python main.py generate R001 --artifacts-dir ./custom_artifacts
     python main.py generate R001 --session-id custom123
 
+    # Batch generate mode (one session per restaurant, run concurrently)
+    python main.py generate --batch R001,R002,R003 --concurrency 4
+    python main.py generate --all
+    python main.py generate --from-file restaurants.txt
+
     # Evaluate mode
     python main.py evaluate --session-id abc123def456
 
 Features:
 - Dual mode operation with mode-specific system prompts
 - Automatic session initialization for generate mode
+- Concurrent batch generation across a restaurant portfolio
 - Evaluation capabilities for existing sessions
 - Structured output with session tracking
 - Error handling and cleanup
@@ -28,7 +34,11 @@ Version: 2.0
 
 import argparse
 import anyio
+import dataclasses
+import hashlib
 import json
+import os
+import sqlite3
 import sys
 from abc import ABC, abstractmethod
 from pathlib import Path
@@ -38,7 +48,9 @@ from claude_code_sdk import ClaudeCodeOptions, Message, query
 from tools.utils.initialize_session import (
     create_session_context,
     generate_session_id,
+    latest_session,
     read_session_context,
+    update_session_status,
 )
 
 # Mode-specific prompt whitelists
@@ -57,6 +69,15 @@ EVALUATE_MODE_PROMPTS = [
     "evaluation/evaluate-solution.md",
 ]
 
+# Restaurant sessions analyzed at once in batch generate mode
+DEFAULT_BATCH_CONCURRENCY = 4
+
+# Serialized run-log bytes held in memory before they are written out
+RUN_LOG_BUFFER_BYTES = 64 * 1024
+
+# Rough characters-per-token ratio for English prose, used for prompt size metadata
+CHARS_PER_TOKEN = 4
+
 
 class ModeCommand(ABC):
     """Abstract base class for mode-specific commands."""
@@ -79,10 +100,20 @@ class ModeCommand(ABC):
         """Get the mode name for logging."""
         pass
 
+    def get_static_prompt_sections(self) -> str:
+        """Mode-specific static text appended after the base prompts (none by default)."""
+        return ""
+
     def enhance_system_prompt(self, base_prompt: str, session_context: dict) -> str:
-        """Enhance the system prompt with session context (default implementation)."""
+        """
+        Append the mode's static sections and then the session context to the base prompt.
+
+        Static content comes first and per-session context last, so every session
+        of a mode shares the same prompt prefix.
+        """
+        stable_prefix = base_prompt + self.get_static_prompt_sections()
         if not session_context:
-            return base_prompt
+            return stable_prefix
 
         session_context = f"""
 # Session Context
@@ -95,10 +126,8 @@ You need to maintain session state across interactions.
 
 ## Instructions
 Use the session context for any run-time information. 
----
-
 """
-        return session_context + base_prompt
+        return stable_prefix + "\n\n---\n" + session_context
 
 
 class GenerateCommand(ModeCommand):
@@ -117,6 +146,7 @@ class GenerateCommand(ModeCommand):
         self.artifacts_dir = artifacts_dir
         self.session_id = session_id
         self.no_session = no_session
+        self.session_context = None
 
     def get_user_prompt(self) -> str:
         return (
@@ -142,6 +172,7 @@ class GenerateCommand(ModeCommand):
             )
         else:
             print("⚠️  Skipping session initialization (--no-session flag)")
+        self.session_context = session_context
 
         # Step 2: Load system prompts for generate mode
         system_prompt = load_system_prompts(GENERATE_MODE_PROMPTS)
@@ -149,9 +180,20 @@ class GenerateCommand(ModeCommand):
         # Step 3: Run Claude analysis
         output_file = None
         if session_context and "artifacts_directory" in session_context:
-            output_file = f"{session_context['artifacts_directory']}/logs/run_log.json"
+            output_file = f"{session_context['artifacts_directory']}/logs/run_log.jsonl"
 
-        result = await run_claude(self, session_context, system_prompt, output_file)
+        if not session_context:
+            return await run_claude(self, session_context, system_prompt, output_file)
+
+        # Track progress in the session registry
+        session_id = session_context["session_id"]
+        update_session_status(session_id, "running", self.artifacts_dir)
+        try:
+            result = await run_claude(self, session_context, system_prompt, output_file)
+        except BaseException:
+            update_session_status(session_id, "failed", self.artifacts_dir)
+            raise
+        update_session_status(session_id, "completed", self.artifacts_dir)
 
         return result
 
@@ -159,9 +201,10 @@ class GenerateCommand(ModeCommand):
 class EvaluateCommand(ModeCommand):
     """Command for evaluate mode."""
 
-    def __init__(self, session_id: str, **kwargs):
+    def __init__(self, session_id: str, artifacts_dir: str = "./.artifacts", **kwargs):
         super().__init__(**kwargs)
         self.session_id = session_id
+        self.artifacts_dir = artifacts_dir
 
     def get_user_prompt(self) -> str:
         return f"Evaluate the solution document for session {self.session_id}"
@@ -172,43 +215,212 @@ class EvaluateCommand(ModeCommand):
     def get_mode_name(self) -> str:
         return "evaluate"
 
-    def enhance_system_prompt(self, base_prompt: str, session_context: dict) -> str:
-        """Enhance system prompt with inspection prompts for evaluate mode."""
-        # First apply the default session context enhancement
-        enhanced_prompt = super().enhance_system_prompt(base_prompt, session_context)
-
-        # Add inspection prompts specific to evaluate mode
+    def get_static_prompt_sections(self) -> str:
+        """Inspection prompts specific to evaluate mode."""
         inspection_prompts = f"""
     # The following prompts are used by the main agent to generate the output:
     {", ".join(GENERATE_MODE_PROMPTS)}. They will be found in the following directory: {Path("prompts")}
     """
 
-        return enhanced_prompt + "\n\n" + inspection_prompts
+        return "\n\n" + inspection_prompts
 
     async def execute(self):
         """Execute the evaluate mode logic."""
         print(f"📊 Starting evaluation mode for session: {self.session_id}")
 
-        # Check if session artifacts exist
-        artifacts_dir = Path(".artifacts") / self.session_id
-        if not artifacts_dir.exists():
+        # Look the session up in the registry
+        try:
+            session_context = read_session_context(self.session_id, self.artifacts_dir)
+        except FileNotFoundError:
             raise FileNotFoundError(
                 f"Session artifacts not found for session {self.session_id}"
             )
 
-        # Create session info for evaluation
-        session_context = read_session_context(self.session_id)
-
         # Load evaluation system prompts
         system_prompt = load_system_prompts(EVALUATE_MODE_PROMPTS)
 
         # Run Claude analysis in evaluate mode
-        output_file = f"{session_context['artifacts_directory']}/logs/eval_log.json"
+        output_file = f"{session_context['artifacts_directory']}/logs/eval_log.jsonl"
         result = await run_claude(self, session_context, system_prompt, output_file)
 
         return result
 
 
+async def run_generate_batch(
+    restaurant_ids,
+    artifacts_dir="./.artifacts",
+    concurrency=DEFAULT_BATCH_CONCURRENCY,
+    no_session=False,
+):
+    """
+    Run generate mode for many restaurants concurrently.
+
+    Every restaurant gets its own GenerateCommand and therefore its own session;
+    at most `concurrency` sessions run at once. A failing restaurant is recorded
+    and does not cancel the others.
+
+    Args:
+        restaurant_ids (list): Restaurant IDs to analyze
+        artifacts_dir (str): Directory for artifacts storage
+        concurrency (int): Maximum number of sessions running at once
+        no_session (bool): Skip session initialization
+
+    Returns:
+        list: One dict per restaurant (in input order) with restaurant_id,
+            session_id, status ("completed" or "failed") and error
+    """
+    print(
+        f"🚀 Starting batch generate mode for {len(restaurant_ids)} restaurants "
+        f"(concurrency: {concurrency})"
+    )
+
+    limiter = anyio.CapacityLimiter(concurrency)
+    results = {}
+
+    async def run_one(restaurant_id):
+        async with limiter:
+            command = GenerateCommand(
+                restaurant_id=restaurant_id,
+                artifacts_dir=artifacts_dir,
+                no_session=no_session,
+            )
+            result = {"restaurant_id": restaurant_id, "session_id": None, "error": None}
+            try:
+                await command.execute()
+                result["status"] = "completed"
+            except Exception as e:
+                print(f"❌ {restaurant_id}: {str(e)}")
+                result["status"] = "failed"
+                result["error"] = str(e)
+
+            if command.session_context:
+                result["session_id"] = command.session_context["session_id"]
+            results[restaurant_id] = result
+
+    async with anyio.create_task_group() as task_group:
+        for restaurant_id in restaurant_ids:
+            task_group.start_soon(run_one, restaurant_id)
+
+    return [results[restaurant_id] for restaurant_id in restaurant_ids]
+
+
+def parse_restaurant_ids(values):
+    """
+    Split comma- or whitespace-separated restaurant IDs, dropping blanks,
+    comments (# ...) and duplicates while keeping the first-seen order.
+    """
+    restaurant_ids = []
+    for value in values:
+        value = value.split("#", 1)[0]
+        restaurant_ids.extend(value.replace(",", " ").split())
+    return list(dict.fromkeys(restaurant_ids))
+
+
+def default_database_path():
+    """SQLite database path from DATABASE_URL (sqlite:<path>), or the repo default."""
+    db_url = os.getenv("DATABASE_URL", "sqlite:.db/swiggy_dineout.db")
+    return db_url.removeprefix("sqlite:")
+
+
+def load_portfolio_restaurant_ids(db_path):
+    """
+    Read every restaurant ID from the restaurant_master table.
+
+    Raises:
+        FileNotFoundError: If the database file does not exist
+    """
+    if not Path(db_path).exists():
+        raise FileNotFoundError(f"Database not found: {db_path}")
+
+    with sqlite3.connect(db_path) as conn:
+        rows = conn.execute(
+            "SELECT restaurant_id FROM restaurant_master ORDER BY restaurant_id"
+        ).fetchall()
+    return [row[0] for row in rows]
+
+
+def resolve_batch_restaurant_ids(args):
+    """Restaurant IDs selected by --batch, --from-file or --all (None if no batch option was given)."""
+    if args.batch:
+        return parse_restaurant_ids([args.batch])
+    if args.from_file:
+        with open(args.from_file, "r", encoding="utf-8") as f:
+            return parse_restaurant_ids(f.readlines())
+    if args.all:
+        return load_portfolio_restaurant_ids(args.db_path)
+    return None
+
+
+def serialize_message(message):
+    """Serialize one SDK message as a single JSON line (dataclass messages keep their type name)."""
+    if dataclasses.is_dataclass(message) and not isinstance(message, type):
+        payload = {"type": type(message).__name__, **dataclasses.asdict(message)}
+    else:
+        payload = message
+    return json.dumps(payload, default=str)
+
+
+class RunLogWriter:
+    """
+    Append-only JSONL transcript of a Claude run.
+
+    Each message is serialized to one line as it arrives and held in a buffer of
+    at most `buffer_limit` bytes before it is written, so memory stays bounded
+    and a crash loses at most one buffer. The log is written once; every path in
+    `link_paths` is a hard link to it (a symlink where hard links are not possible).
+    """
+
+    def __init__(self, path, link_paths=(), buffer_limit=RUN_LOG_BUFFER_BYTES):
+        self.path = Path(path)
+        self.link_paths = [Path(link_path) for link_path in link_paths]
+        self.buffer_limit = buffer_limit
+        self.message_count = 0
+        self._buffer = []
+        self._buffered_bytes = 0
+        self._file = None
+
+    def __enter__(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "w", encoding="utf-8")
+        for link_path in self.link_paths:
+            self._link(link_path)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    def _link(self, link_path):
+        link_path.parent.mkdir(parents=True, exist_ok=True)
+        link_path.unlink(missing_ok=True)
+        try:
+            link_path.hardlink_to(self.path)
+        except OSError:
+            link_path.symlink_to(self.path.resolve())
+
+    def write(self, message):
+        """Buffer one message, writing the buffer out once it exceeds the limit."""
+        line = serialize_message(message) + "\n"
+        self._buffer.append(line)
+        self._buffered_bytes += len(line)
+        self.message_count += 1
+        if self._buffered_bytes >= self.buffer_limit:
+            self.flush()
+
+    def flush(self):
+        """Write buffered messages to disk."""
+        if self._buffer:
+            self._file.writelines(self._buffer)
+            self._buffer.clear()
+            self._buffered_bytes = 0
+        self._file.flush()
+
+    def close(self):
+        if self._file and not self._file.closed:
+            self.flush()
+            self._file.close()
+
+
 def initialize_session(restaurant_id, artifacts_dir="./.artifacts", session_id=None):
     """
     Initialize a new analysis session for the restaurant.
@@ -245,27 +457,74 @@ def initialize_session(restaurant_id, artifacts_dir="./.artifacts", session_id=N
         raise
 
 
-def load_system_prompts(prompt_files):
+@dataclasses.dataclass(frozen=True)
+class PromptBundle:
+    """Pre-joined system prompt text identified by the content hashes of its files."""
+
+    text: str
+    content_hash: str
+    files: tuple  # (filename, sha256 of content) per loaded prompt, in load order
+    token_estimate: int
+
+
+# Prompt file list -> (file stat signature, PromptBundle)
+_PROMPT_BUNDLE_CACHE = {}
+
+
+def estimate_tokens(text):
+    """Approximate token count of a prompt (no tokenizer dependency)."""
+    return -(-len(text) // CHARS_PER_TOKEN)
+
+
+def _prompt_files_signature(prompts_dir, prompt_files):
+    """Cheap change detector for the prompt files: (name, mtime, size), or None if missing."""
+    signature = []
+    for prompt_filename in prompt_files:
+        try:
+            stat = (prompts_dir / prompt_filename).stat()
+            signature.append((prompt_filename, stat.st_mtime_ns, stat.st_size))
+        except FileNotFoundError:
+            signature.append((prompt_filename, None, None))
+    return tuple(signature)
+
+
+def load_prompt_bundle(prompt_files):
     """
-    Load and concatenate system prompts from the specified list of markdown files.
+    Load the system prompt bundle for a list of markdown files, reusing a cached one.
+
+    Files are only re-read when their mtime or size changes, and a re-read that
+    yields the same content hashes keeps the cached bundle, so batch runs pay
+    the load cost once per process.
 
     Args:
         prompt_files (list): List of markdown file names to load
 
     Returns:
-        str: Combined system prompt content
+        PromptBundle: Joined prompt text, content hash and token estimate
 
     Raises:
         FileNotFoundError: If prompts directory doesn't exist
         ValueError: If no valid prompts found
     """
-    print(f"📄 Loading {len(prompt_files)} system prompt files...")
-
     prompts_dir = Path("prompts")
     if not prompts_dir.exists():
         raise FileNotFoundError("Prompts directory not found")
 
+    cache_key = tuple(prompt_files)
+    signature = _prompt_files_signature(prompts_dir, prompt_files)
+    cached = _PROMPT_BUNDLE_CACHE.get(cache_key)
+    if cached and cached[0] == signature:
+        bundle = cached[1]
+        print(
+            f"♻️  Using cached prompt bundle {bundle.content_hash[:12]} "
+            f"({len(bundle.files)} files, ~{bundle.token_estimate} tokens)"
+        )
+        return bundle
+
+    print(f"📄 Loading {len(prompt_files)} system prompt files...")
+
     combined_prompts = []
+    file_hashes = []
     loaded_count = 0
 
     for prompt_filename in prompt_files:
@@ -282,6 +541,9 @@ def load_system_prompts(prompt_files):
                     # Use the filename without extension as the header
                     header = Path(prompt_filename).stem
                     combined_prompts.append(f"# {header}\n\n{content}")
+                    file_hashes.append(
+                        (prompt_filename, hashlib.sha256(content.encode("utf-8")).hexdigest())
+                    )
                     print(f"  ✓ Loaded: {prompt_filename}")
                     loaded_count += 1
         except Exception as e:
@@ -290,10 +552,45 @@ def load_system_prompts(prompt_files):
     if not combined_prompts:
         raise ValueError("No valid prompt content loaded")
 
-    system_prompt = "\n\n---\n\n".join(combined_prompts)
-    print(f"✅ Loaded {loaded_count} prompt files ({len(system_prompt)} characters)")
+    content_hash = hashlib.sha256(
+        "\n".join(f"{name}:{digest}" for name, digest in file_hashes).encode("utf-8")
+    ).hexdigest()
+
+    if cached and cached[1].content_hash == content_hash:
+        bundle = cached[1]
+    else:
+        system_prompt = "\n\n---\n\n".join(combined_prompts)
+        bundle = PromptBundle(
+            text=system_prompt,
+            content_hash=content_hash,
+            files=tuple(file_hashes),
+            token_estimate=estimate_tokens(system_prompt),
+        )
+    _PROMPT_BUNDLE_CACHE[cache_key] = (signature, bundle)
+
+    print(
+        f"✅ Loaded {loaded_count} prompt files ({len(bundle.text)} characters, "
+        f"~{bundle.token_estimate} tokens, bundle {content_hash[:12]})"
+    )
+
+    return bundle
 
-    return system_prompt
+
+def load_system_prompts(prompt_files):
+    """
+    Load and concatenate system prompts from the specified list of markdown files.
+
+    Args:
+        prompt_files (list): List of markdown file names to load
+
+    Returns:
+        str: Combined system prompt content (from the cached prompt bundle)
+
+    Raises:
+        FileNotFoundError: If prompts directory doesn't exist
+        ValueError: If no valid prompts found
+    """
+    return load_prompt_bundle(prompt_files).text
 
 
 async def run_claude(
@@ -312,7 +609,8 @@ async def run_claude(
         output_file (str): Optional path to save artifacts output file
 
     Returns:
-        dict: Analysis result with output and metadata
+        dict: Final result text ("stdout"), path of the JSONL run log,
+            message count and return code
 
     Raises:
         Exception: If Claude analysis fails
@@ -327,6 +625,10 @@ async def run_claude(
     enhanced_system_prompt = command.enhance_system_prompt(
         system_prompt, session_context
     )
+    print(
+        f"🧱 System prompt: ~{estimate_tokens(enhanced_system_prompt)} tokens "
+        f"(~{estimate_tokens(system_prompt)} shared across sessions)"
+    )
 
     # print(f"System Prompt: {enhanced_system_prompt}")
 
@@ -337,9 +639,9 @@ async def run_claude(
 
         # Determine log filename
         if session_context and "session_id" in session_context:
-            log_filename = f"{session_context['session_id']}_{mode_name}.log"
+            log_filename = f"{session_context['session_id']}_{mode_name}.jsonl"
         else:
-            log_filename = f"{log_prefix}_{mode_name}.log"
+            log_filename = f"{log_prefix}_{mode_name}.jsonl"
 
         log_file_path = logs_dir / log_filename
 
@@ -364,43 +666,35 @@ async def run_claude(
             permission_mode="bypassPermissions",
         )
 
-        # Collect all messages from the SDK
-        messages: list[Message] = []
-        output_content = []
+        # Stream every SDK message to the log as it arrives; the artifacts copy is a link
+        link_paths = [output_file] if output_file else []
+        final_result = ""
 
-        async for message in query(prompt=user_prompt, options=options):
-            messages.append(message)
+        with RunLogWriter(log_file_path, link_paths) as run_log:
+            message: Message
+            async for message in query(prompt=user_prompt, options=options):
+                run_log.write(message)
 
-            # Log the message as JSON for compatibility
-            message_json = json.dumps(message, default=str, indent=2)
-            output_content.append(message_json)
+                # The closing result message carries the final answer text
+                if getattr(message, "result", None):
+                    final_result = message.result
 
-            # Print progress for assistant messages
-            if hasattr(message, "type") and message.get("type") == "assistant":
-                print("📝 Received assistant response...")
-
-        # Combine all output
-        full_output = "\n".join(output_content)
-
-        # Save to log file
-        with open(log_file_path, "w", encoding="utf-8") as log_file:
-            log_file.write(full_output)
+                # Print progress for assistant messages
+                if isinstance(message, dict) and message.get("type") == "assistant":
+                    print("📝 Received assistant response...")
 
         print("✅ Analysis completed successfully")
-        print(f"📄 Full output logged to: {log_file_path}")
-
-        # Save output to artifacts directory if specified
+        print(f"📄 Full output logged to: {log_file_path} ({run_log.message_count} messages)")
         if output_file:
-            # Ensure the directory exists
-            output_path = Path(output_file)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-
-            with open(output_file, "w", encoding="utf-8") as f:
-                f.write(full_output)
-            print(f"💾 Output also saved to: {output_file}")
+            print(f"💾 Output also linked at: {output_file}")
 
         # Return result in similar format to subprocess.CompletedProcess
-        return {"stdout": full_output, "messages": messages, "returncode": 0}
+        return {
+            "stdout": final_result,
+            "log_file": str(log_file_path),
+            "message_count": run_log.message_count,
+            "returncode": 0,
+        }
 
     except Exception as e:
         print(f"❌ Error during analysis: {str(e)}")
@@ -420,8 +714,14 @@ Examples:
     python main.py generate R001 --session-id custom123
     python main.py generate R001 --no-session
     
+    # Batch generate mode
+    python main.py generate --batch R001,R002,R003 --concurrency 4
+    python main.py generate --all
+    python main.py generate --from-file restaurants.txt
+    
     # Evaluate mode
     python main.py evaluate --session-id abc123def456
+    python main.py evaluate --latest R001
         """,
     )
 
@@ -432,7 +732,31 @@ Examples:
         "generate", help="Generate improvement recommendations for a restaurant"
     )
     generate_parser.add_argument(
-        "restaurant_id", help="Restaurant ID (e.g., R001, R002, etc.)"
+        "restaurant_id", nargs="?", help="Restaurant ID (e.g., R001, R002, etc.)"
+    )
+    batch_group = generate_parser.add_mutually_exclusive_group()
+    batch_group.add_argument(
+        "--batch", help="Comma-separated restaurant IDs to analyze concurrently"
+    )
+    batch_group.add_argument(
+        "--all",
+        action="store_true",
+        help="Analyze every restaurant in the database's restaurant_master table",
+    )
+    batch_group.add_argument(
+        "--from-file",
+        help="File with restaurant IDs (one per line or comma-separated, # comments)",
+    )
+    generate_parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_BATCH_CONCURRENCY,
+        help=f"Restaurant sessions run at once in batch mode (default: {DEFAULT_BATCH_CONCURRENCY})",
+    )
+    generate_parser.add_argument(
+        "--db-path",
+        default=default_database_path(),
+        help="SQLite database used by --all (default: from DATABASE_URL)",
     )
     generate_parser.add_argument(
         "--artifacts-dir",
@@ -452,8 +776,17 @@ Examples:
     evaluate_parser = subparsers.add_parser(
         "evaluate", help="Evaluate existing session results against PRD criteria"
     )
+    session_group = evaluate_parser.add_mutually_exclusive_group(required=True)
+    session_group.add_argument("--session-id", help="Session ID to evaluate")
+    session_group.add_argument(
+        "--latest",
+        metavar="RESTAURANT_ID",
+        help="Evaluate the latest completed session for this restaurant",
+    )
     evaluate_parser.add_argument(
-        "--session-id", required=True, help="Session ID to evaluate (required)"
+        "--artifacts-dir",
+        default="./.artifacts",
+        help="Directory for artifact storage (default: ./.artifacts)",
     )
 
     args = parser.parse_args()
@@ -468,8 +801,50 @@ Examples:
             parser.print_help()
             sys.exit(1)
 
+    is_batch = False
+    if args.mode == "generate":
+        is_batch = args.batch or args.from_file or args.all
+        if is_batch and args.restaurant_id:
+            generate_parser.error("pass either a restaurant ID or a batch option, not both")
+        if not is_batch and not args.restaurant_id:
+            generate_parser.error("a restaurant ID or one of --batch, --all, --from-file is required")
+        if is_batch and args.session_id:
+            generate_parser.error("--session-id cannot be used in batch mode; each restaurant gets its own session")
+        if args.concurrency < 1:
+            generate_parser.error("--concurrency must be at least 1")
+
     try:
-        if args.mode == "generate":
+        if args.mode == "generate" and is_batch:
+            batch_ids = resolve_batch_restaurant_ids(args)
+            if not batch_ids:
+                raise ValueError("No restaurant IDs selected for batch mode")
+
+            results = await run_generate_batch(
+                batch_ids,
+                artifacts_dir=args.artifacts_dir,
+                concurrency=args.concurrency,
+                no_session=args.no_session,
+            )
+
+            # Display per-restaurant summary
+            print("\n" + "=" * 80)
+            print("📊 BATCH GENERATION RESULTS")
+            print("=" * 80)
+            for result in results:
+                status = "✅" if result["status"] == "completed" else "❌"
+                session = result["session_id"] or "-"
+                error = f"  {result['error']}" if result["error"] else ""
+                print(f"{status} {result['restaurant_id']:<10} session: {session}{error}")
+
+            failed = [r for r in results if r["status"] == "failed"]
+            print(
+                f"\n📈 {len(results) - len(failed)}/{len(results)} briefings generated"
+            )
+            if failed:
+                sys.exit(1)
+            print("\n✅ Batch generation completed successfully!")
+
+        elif args.mode == "generate":
             # Generate mode execution
             command = GenerateCommand(
                 restaurant_id=args.restaurant_id,
@@ -495,7 +870,17 @@ Examples:
 
         elif args.mode == "evaluate":
             # Evaluate mode execution
-            command = EvaluateCommand(session_id=args.session_id)
+            if args.latest:
+                session = latest_session(args.latest, args.artifacts_dir, status="completed")
+                if not session:
+                    raise FileNotFoundError(
+                        f"No completed session found for restaurant {args.latest}"
+                    )
+                args.session_id = session["session_id"]
+
+            command = EvaluateCommand(
+                session_id=args.session_id, artifacts_dir=args.artifacts_dir
+            )
             result = await command.execute()
 
             # Display results
@@ -0,0 +1,32 @@
+"""
+Shared test helpers.
+
+Tools are standalone scripts rather than an importable package, so tests load them
+by path.
+"""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+
+def load_tool(relative_path: str):
+    """Import a tool script (e.g. "tools/utils/init_database.py") as a module, once per session"""
+    name = Path(relative_path).stem
+    if name not in sys.modules:
+        spec = importlib.util.spec_from_file_location(name, PROJECT_ROOT / relative_path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        spec.loader.exec_module(module)
+    return sys.modules[name]
+
+
+@pytest.fixture
+def rng():
+    """Seeded generator so failures reproduce"""
+    return np.random.default_rng(20250630)
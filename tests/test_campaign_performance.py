@@ -0,0 +1,97 @@
+"""
+Campaign performance engine on a hand-built portfolio: marginal ROI and budget actions.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from conftest import load_tool
+
+campaign_performance = load_tool("tools/analysis/campaign_performance.py")
+
+PEER_AVG_ROI = 3.0
+
+
+def _campaigns(rng):
+    """
+    Restaurants with a known budget action, with total_investment set so
+    fund consumption is 90% unless stated:
+
+        R001  ROI 4 that keeps scaling with spend          -> increase
+        R002  ROI 2.5, within the underperformance margin  -> maintain
+        R003  ROI 2, far below peers                       -> decrease
+        R004  ROI 4, but revenue falls as spend rises      -> maintain
+        R005  ROI 4 on near-identical spends (no slope)    -> increase
+        R006  ROI 4 from a single campaign (no slope)      -> increase
+        R007  ROI 4 with only half of the funds consumed   -> maintain
+    """
+    spends = {
+        "R001": [1000, 2000, 3000, 4000], "R002": [1500, 2500, 3500], "R003": [800, 1600, 2400],
+        "R004": [1000, 2000, 3000], "R005": [1000, 1010, 1005], "R006": [2000], "R007": [1000, 3000]
+    }
+    revenues = {
+        "R001": 4 * np.array(spends["R001"]) + rng.normal(0, 200, 4),
+        "R002": 2.5 * np.array(spends["R002"]) + rng.normal(0, 200, 3),
+        "R003": 2.0 * np.array(spends["R003"]) + rng.normal(0, 100, 3),
+        "R004": np.array([9000, 8000, 7000]),
+        "R005": np.array([3800, 4100, 4160]),
+        "R006": np.array([8000]),
+        "R007": np.array([4000, 12000])
+    }
+    rows = []
+    for restaurant_id, restaurant_spends in spends.items():
+        consumption = 0.5 if restaurant_id == "R007" else 0.9
+        for number, (spend, revenue) in enumerate(zip(restaurant_spends, revenues[restaurant_id]), start=1):
+            rows.append({
+                "campaign_id": f"{restaurant_id}-C{number}", "restaurant_id": restaurant_id,
+                "locality": "Koramangala", "cuisine": "Indian", "campaign_category": "Discount",
+                "campaign_start": "2025-06-01", "campaign_end": "2025-06-30",
+                "impressions": 10000, "clicks": 500, "conversions": 40,
+                "spend": float(spend), "revenue_generated": float(revenue),
+                "total_investment": spend / consumption,
+                "peer_avg_roi": PEER_AVG_ROI, "peer_avg_conversion_rate": 0.08
+            })
+    return pd.DataFrame(rows)
+
+
+def _restaurants(rng):
+    campaigns = _campaigns(rng)
+    restaurants = campaign_performance.compute_campaign_performance(campaigns)["restaurants"]
+    return campaigns, restaurants.set_index("restaurant_id")
+
+
+def test_marginal_roi_matches_polyfit(rng):
+    campaigns, restaurants = _restaurants(rng)
+
+    for restaurant_id in ["R001", "R002", "R003", "R004", "R007"]:
+        own = campaigns[campaigns["restaurant_id"] == restaurant_id]
+        expected = np.polyfit(own["spend"], own["revenue_generated"], 1)[0]
+        assert restaurants.loc[restaurant_id, "marginal_roi"] == pytest.approx(expected, rel=1e-9), restaurant_id
+
+
+def test_marginal_roi_is_null_without_spend_variation(rng):
+    _, restaurants = _restaurants(rng)
+
+    assert np.isnan(restaurants.loc["R005", "marginal_roi"])
+    assert np.isnan(restaurants.loc["R006", "marginal_roi"])
+
+
+def test_budget_actions(rng):
+    _, restaurants = _restaurants(rng)
+
+    assert restaurants["budget_action"].to_dict() == {
+        "R001": "increase", "R002": "maintain", "R003": "decrease", "R004": "maintain",
+        "R005": "increase", "R006": "increase", "R007": "maintain"
+    }
+
+
+def test_negative_marginal_roi_blocks_increase(rng):
+    _, restaurants = _restaurants(rng)
+    declining = restaurants.loc["R004"]
+
+    # Above peers with most funds consumed, which alone would mean "increase"
+    assert declining["roi"] >= PEER_AVG_ROI
+    assert declining["fund_consumption"] >= campaign_performance.HIGH_FUND_CONSUMPTION
+    assert declining["marginal_roi"] < 0
+    assert declining["budget_action"] == "maintain"
@@ -0,0 +1,35 @@
+"""
+Hour-of-week heatmap kernel, checked cell by cell against NumPy.
+"""
+
+import numpy as np
+
+from conftest import load_tool
+
+capacity_heatmap = load_tool("tools/analysis/capacity_heatmap.py")
+
+
+def test_heatmaps_match_per_cell_reference(rng):
+    restaurants, rows = 3, 4000
+    positions = rng.integers(0, restaurants, rows)
+    # A few busy cells so runs of equal keys are long, plus scattered single observations
+    cells = np.where(rng.random(rows) < 0.7, rng.integers(0, 5, rows), rng.integers(0, capacity_heatmap.CELLS, rows))
+    utilization = rng.random(rows) * 100
+    overbooking = rng.integers(0, 2, rows).astype(float)
+    service_delay = rng.exponential(8, rows)
+
+    heatmaps = capacity_heatmap.compute_heatmaps(positions, cells, utilization, overbooking, service_delay, restaurants)
+
+    for restaurant in range(restaurants):
+        for cell in range(capacity_heatmap.CELLS):
+            day, hour = divmod(cell, capacity_heatmap.HOURS_PER_DAY)
+            selected = (positions == restaurant) & (cells == cell)
+            assert heatmaps["observations"][restaurant, day, hour] == selected.sum()
+            if not selected.any():
+                assert all(np.isnan(heatmaps[name][restaurant, day, hour]) for name in capacity_heatmap.HEATMAP_MATRICES[1:])
+                continue
+            np.testing.assert_allclose(heatmaps["utilization_mean"][restaurant, day, hour], utilization[selected].mean())
+            np.testing.assert_allclose(heatmaps["utilization_p90"][restaurant, day, hour],
+                                       np.percentile(utilization[selected], capacity_heatmap.UTILIZATION_PERCENTILE))
+            np.testing.assert_allclose(heatmaps["overbooking_rate"][restaurant, day, hour], overbooking[selected].mean())
+            np.testing.assert_allclose(heatmaps["service_delay_mean"][restaurant, day, hour], service_delay[selected].mean())
@@ -0,0 +1,60 @@
+"""
+SQL aggregate builders of get_trends, checked against NumPy on an in-memory database.
+"""
+
+import sqlite3
+
+import numpy as np
+import pytest
+
+from conftest import load_tool
+
+get_trends = load_tool("tools/evaluation/get_trends.py")
+
+
+@pytest.fixture
+def conn():
+    connection = sqlite3.connect(":memory:")
+    yield connection
+    connection.close()
+
+
+@pytest.mark.parametrize("missing", [0.0, 0.3])
+def test_slope_matches_polyfit(conn, rng, missing):
+    x = np.arange(40)
+    values = 2.5 * x + rng.normal(0, 4, len(x))
+    present = rng.random(len(x)) >= missing
+    conn.execute("CREATE TABLE series (x INTEGER, value REAL)")
+    conn.executemany("INSERT INTO series VALUES (?, ?)",
+                     [(int(position), float(value) if keep else None) for position, value, keep in zip(x, values, present)])
+
+    slope = conn.execute(f"SELECT {get_trends._slope_sql('value')} FROM series").fetchone()[0]
+
+    assert slope == pytest.approx(np.polyfit(x[present], values[present], 1)[0], rel=1e-9)
+
+
+def test_slope_is_null_without_spread(conn):
+    conn.execute("CREATE TABLE series (x INTEGER, value REAL)")
+    conn.executemany("INSERT INTO series VALUES (?, ?)", [(0, 70.0), (1, None), (2, None)])
+
+    assert conn.execute(f"SELECT {get_trends._slope_sql('value')} FROM series").fetchone()[0] is None
+
+
+@pytest.mark.parametrize("count", [1, 2, 7, 10, 101])
+def test_percentiles_match_inverted_cdf(conn, rng, count):
+    scores = np.round(rng.uniform(40, 100, count), 1)
+    conn.execute("CREATE TABLE scores (evaluation_score REAL)")
+    conn.executemany("INSERT INTO scores VALUES (?)", [(float(score),) for score in scores])
+
+    row = conn.execute(f"""
+        WITH series AS (
+            SELECT evaluation_score,
+                   ROW_NUMBER() OVER (ORDER BY evaluation_score) AS score_rank,
+                   COUNT(*) OVER () AS n
+            FROM scores
+        )
+        SELECT COUNT(*){get_trends._percentile_sql()} FROM series
+    """).fetchone()
+
+    expected = [np.percentile(scores, p, method="inverted_cdf") for p in get_trends.PERCENTILES]
+    assert list(row[1:]) == pytest.approx(expected)
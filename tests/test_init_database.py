@@ -0,0 +1,69 @@
+"""
+End-to-end guarantees of init_database: seeded builds are reproducible, and appended
+days derive the same rollups and revenue volatility as a full rebuild.
+"""
+
+import shutil
+import sqlite3
+from datetime import date
+
+import pytest
+
+from conftest import load_tool
+
+init_database = load_tool("tools/utils/init_database.py")
+
+SEED = 7
+END_DATE = date(2025, 6, 30)
+
+# Tables derived from the raw daily and hourly data
+DERIVED_TABLES = ["restaurant_kpi_rollups", "restaurant_hour_of_week_profile",
+                  "revenue_volatility_tracking", "revenue_volatility_state"]
+
+
+def _build(path, **options):
+    options = {"seed": SEED, "end_date": END_DATE, **options}
+    init_database.DatabaseInitializer(str(path), **options).initialize_database()
+    return path.read_bytes()
+
+
+def _rows(path, table):
+    """Every row of a table except its surrogate id, in a stable order and with floats rounded"""
+    conn = sqlite3.connect(path)
+    try:
+        columns = [row[1] for row in conn.execute(f"PRAGMA table_info({table})") if row[1] != "id"]
+        rows = conn.execute(f"SELECT {', '.join(columns)} FROM {table}").fetchall()
+    finally:
+        conn.close()
+    return sorted(tuple(round(value, 6) if isinstance(value, float) else value for value in row) for row in rows)
+
+
+@pytest.mark.parametrize("engine, restaurants", [("python", None), ("numpy", 20)])
+def test_seeded_builds_are_byte_identical(tmp_path, engine, restaurants):
+    first = _build(tmp_path / "first.db", engine=engine, num_restaurants=restaurants)
+    second = _build(tmp_path / "second.db", engine=engine, num_restaurants=restaurants)
+    parallel = _build(tmp_path / "parallel.db", engine=engine, num_restaurants=restaurants, workers=2)
+
+    assert first == second
+    assert first == parallel
+
+
+def test_append_matches_full_rebuild_of_derived_tables(tmp_path):
+    appended = tmp_path / "appended.db"
+    _build(appended, end_date=date(2025, 6, 20))
+    init_database.DatabaseInitializer(str(appended), end_date=END_DATE).append_database()
+
+    rebuilt = tmp_path / "rebuilt.db"
+    shutil.copy(appended, rebuilt)
+    initializer = init_database.DatabaseInitializer(str(rebuilt))
+    initializer.connect()
+    try:
+        initializer.build_rollups()
+        initializer.build_revenue_volatility(rebuild=True)
+        initializer.conn.commit()
+    finally:
+        initializer.close()
+
+    assert _rows(appended, "revenue_volatility_tracking")[-1][1] == END_DATE.isoformat()
+    for table in DERIVED_TABLES:
+        assert _rows(appended, table) == _rows(rebuilt, table), table
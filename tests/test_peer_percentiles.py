@@ -0,0 +1,112 @@
+"""
+Peer percentile engine, checked against SciPy and direct per-group statistics.
+"""
+
+import sqlite3
+
+import numpy as np
+import pandas as pd
+import pytest
+from scipy.stats import percentileofscore
+
+from conftest import load_tool
+
+peer_percentiles = load_tool("tools/analysis/peer_percentiles.py")
+
+# (locality, cuisine, capacity_range, restaurants): the Koramangala Medium group is large
+# enough on its own, Koramangala Large falls back to locality x cuisine, Indiranagar and HSR
+# Chinese fall back to cuisine, and Whitefield Italian falls back to the whole market
+GROUPS = [
+    ("Koramangala", "Indian", "Medium (31-80)", 6),
+    ("Koramangala", "Indian", "Large (81+)", 2),
+    ("Indiranagar", "Chinese", "Small (1-30)", 3),
+    ("Indiranagar", "Chinese", "Medium (31-80)", 1),
+    ("HSR Layout", "Chinese", "Small (1-30)", 2),
+    ("Whitefield", "Italian", "Large (81+)", 2),
+]
+
+EXPECTED_LEVELS = {
+    ("Koramangala", "Medium (31-80)"): "locality_cuisine_capacity",
+    ("Koramangala", "Large (81+)"): "locality_cuisine",
+    ("Indiranagar", "Small (1-30)"): "cuisine",
+    ("Indiranagar", "Medium (31-80)"): "cuisine",
+    ("HSR Layout", "Small (1-30)"): "cuisine",
+    ("Whitefield", "Large (81+)"): "market",
+}
+
+
+def _frame(rng):
+    """Hand-built dimensions with ties, a constant dimension within a group and missing ROI"""
+    rows = [(locality, cuisine, capacity_range)
+            for locality, cuisine, capacity_range, count in GROUPS for _ in range(count)]
+    frame = pd.DataFrame(rows, columns=["locality", "cuisine", "capacity_range"])
+    frame.insert(0, "restaurant_id", [f"R{number:03d}" for number in range(1, len(frame) + 1)])
+    frame["seating_capacity"] = 50
+    frame["avg_daily_bookings"] = rng.integers(10, 14, len(frame)).astype(float)
+    frame["avg_daily_revenue"] = np.round(rng.normal(25000, 4000, len(frame)), 2)
+    frame["revenue_per_cover"] = np.round(rng.uniform(400, 700, len(frame)), 2)
+    frame["avg_rating"] = np.round(rng.uniform(3.8, 4.2, len(frame)), 1)
+    frame["campaign_roi"] = np.round(rng.uniform(1, 5, len(frame)), 2)
+    koramangala_medium = (frame["locality"] == "Koramangala") & (frame["capacity_range"] == "Medium (31-80)")
+    frame.loc[koramangala_medium, "avg_rating"] = 4.2
+    frame.loc[[1, 9], "campaign_roi"] = np.nan
+    frame["market"] = "All restaurants"
+    frame["as_of_date"] = "2025-06-30"
+    return frame
+
+
+def _peers(frame, row, level):
+    """Rows in the restaurant's peer group at the given level"""
+    columns = dict(peer_percentiles.PEER_GROUP_LEVELS)[level]
+    return frame[(frame[columns] == row[columns]).all(axis=1)]
+
+
+def test_peer_group_level_falls_back_to_coarser_groups(rng):
+    frame = _frame(rng)
+    result = peer_percentiles.compute_peer_percentiles(frame)
+
+    for (_, row), (_, ranked) in zip(frame.iterrows(), result.iterrows()):
+        level = EXPECTED_LEVELS[(row["locality"], row["capacity_range"])]
+        assert ranked["peer_group_level"] == level, row["restaurant_id"]
+        assert ranked["peer_group_size"] == len(_peers(frame, row, level))
+
+
+@pytest.mark.parametrize("dimension", peer_percentiles.DIMENSIONS)
+def test_percentiles_and_zscores_match_reference(rng, dimension):
+    frame = _frame(rng)
+    result = peer_percentiles.compute_peer_percentiles(frame)
+
+    for (_, row), (_, ranked) in zip(frame.iterrows(), result.iterrows()):
+        values = _peers(frame, row, ranked["peer_group_level"])[dimension].to_numpy()
+        values = values[~np.isnan(values)]
+        value = row[dimension]
+        if np.isnan(value):
+            assert np.isnan(ranked[f"{dimension}_percentile"])
+            assert np.isnan(ranked[f"{dimension}_zscore"])
+            continue
+
+        assert ranked[f"{dimension}_percentile"] == pytest.approx(
+            round(percentileofscore(values, value, kind="weak"), 2))
+        if values.std() == 0:
+            assert np.isnan(ranked[f"{dimension}_zscore"])
+        else:
+            assert ranked[f"{dimension}_zscore"] == pytest.approx(
+                round((value - values.mean()) / values.std(), 4), abs=1e-4)
+
+
+def test_empty_metrics_clear_cached_rankings(rng, tmp_path):
+    db_path = tmp_path / "empty.db"
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("CREATE TABLE restaurant_metrics (restaurant_id TEXT, date DATE)")
+        peer_percentiles.initialize_percentile_table(conn)
+        peer_percentiles.save_peer_percentiles(conn, peer_percentiles.compute_peer_percentiles(_frame(rng)),
+                                               peer_percentiles.DEFAULT_WINDOW_DAYS,
+                                               peer_percentiles.DEFAULT_MIN_PEER_GROUP_SIZE)
+
+        assert peer_percentiles.load_restaurant_dimensions(conn).empty
+
+    summary = peer_percentiles.build_peer_percentiles(str(db_path))
+
+    assert summary == {"as_of_date": None, "restaurants": 0, "source": "no metrics", "seconds": 0.0}
+    with sqlite3.connect(db_path) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM restaurant_peer_percentiles").fetchone()[0] == 0
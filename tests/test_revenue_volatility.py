@@ -0,0 +1,120 @@
+"""
+Revenue volatility kernels of init_database, checked against direct NumPy references.
+"""
+
+import numpy as np
+import pytest
+
+from conftest import load_tool
+
+init_database = load_tool("tools/utils/init_database.py")
+
+
+def _revenue_grid(rng, restaurants=6, days=75, missing=0.1):
+    """Noisy daily revenue with spikes, drops and missing days"""
+    revenue = rng.normal(10000, 1500, size=(restaurants, days))
+    revenue[rng.random(revenue.shape) < 0.04] *= 3
+    revenue[rng.random(revenue.shape) < 0.04] *= 0.2
+    revenue[rng.random(revenue.shape) < missing] = np.nan
+    return revenue
+
+
+def _full_build(revenue):
+    restaurants = revenue.shape[0]
+    return init_database.compute_revenue_volatility(
+        revenue, np.ones(revenue.shape, dtype=bool), np.full(restaurants, np.nan),
+        np.zeros(restaurants), np.full(revenue.shape, np.nan)
+    )
+
+
+def test_window_median_matches_nanmedian(rng):
+    windows = rng.normal(size=(40, 9, 30))
+    windows[rng.random(windows.shape) < 0.3] = np.nan
+    windows[0, 0] = np.nan
+
+    median, count = init_database._window_median(windows)
+
+    with pytest.warns(RuntimeWarning, match="All-NaN"):
+        expected = np.nanmedian(windows, axis=-1)
+    np.testing.assert_allclose(median, expected, equal_nan=True)
+    np.testing.assert_array_equal(count, (~np.isnan(windows)).sum(axis=-1))
+
+
+@pytest.mark.parametrize("window", [1, 3, 7, 40])
+def test_rolling_sum_matches_trailing_window(rng, window):
+    values = rng.integers(0, 5, size=(4, 30)).astype(bool)
+
+    expected = np.array([[values[row, max(day - window + 1, 0):day + 1].sum() for day in range(values.shape[1])]
+                         for row in range(values.shape[0])])
+    np.testing.assert_array_equal(init_database._rolling_sum(values, window), expected)
+
+
+def test_trends_match_polyfit_over_window(rng):
+    result = _full_build(_revenue_grid(rng))
+    index = result["volatility_index"]
+
+    for window in init_database.VOLATILITY_TREND_WINDOWS:
+        trend = result[f"volatility_trend_{window}d"]
+        for row in range(index.shape[0]):
+            for day in range(index.shape[1]):
+                values = np.concatenate([np.full(window - 1, np.nan), index[row]])[day:day + window]
+                x = np.flatnonzero(~np.isnan(values))
+                expected = 0.0
+                if len(x) >= init_database.VOLATILITY_TREND_MIN_DAYS and np.ptp(x) > 0:
+                    expected = np.polyfit(x, values[x], 1)[0]
+                assert trend[row, day] == pytest.approx(expected, abs=1e-9)
+
+
+def test_anomalies_match_robust_zscore(rng):
+    revenue = _revenue_grid(rng)
+    categories = _full_build(revenue)["anomaly_category"]
+
+    zscores = np.full(revenue.shape, np.nan)
+    for row in range(revenue.shape[0]):
+        for day in range(revenue.shape[1]):
+            history = revenue[row, max(day - init_database.ANOMALY_WINDOW_DAYS, 0):day]
+            history = history[~np.isnan(history)]
+            if len(history) < init_database.ANOMALY_MIN_HISTORY_DAYS:
+                continue
+            median = np.median(history)
+            mad = np.median(np.abs(history - median))
+            if mad > 0:
+                zscores[row, day] = 0.6745 * (revenue[row, day] - median) / mad
+
+    moderate = np.abs(zscores) >= init_database.IRREGULAR_Z_THRESHOLD
+    for row in range(revenue.shape[0]):
+        for day in range(revenue.shape[1]):
+            recent = moderate[row, max(day - init_database.IRREGULAR_WINDOW_DAYS + 1, 0):day + 1].sum()
+            if zscores[row, day] <= -init_database.ANOMALY_Z_THRESHOLD:
+                expected = "Sudden_Drop"
+            elif zscores[row, day] >= init_database.ANOMALY_Z_THRESHOLD:
+                expected = "Revenue_Spike"
+            elif moderate[row, day] and recent >= init_database.IRREGULAR_MIN_DAYS:
+                expected = "Irregular_Pattern"
+            else:
+                expected = "None"
+            assert categories[row, day] == expected, (row, day)
+    assert (categories != "None").any()
+
+
+@pytest.mark.parametrize("split", [1, 20, 74])
+def test_incremental_update_matches_full_build(rng, split):
+    revenue = _revenue_grid(rng)
+    full = _full_build(revenue)
+
+    # Days before the split, then the rest continuing from the stored state
+    first = _full_build(revenue[:, :split])
+    volatility_index = np.full(revenue.shape, np.nan)
+    volatility_index[:, :split] = first["volatility_index"]
+    new_days = np.zeros(revenue.shape, dtype=bool)
+    new_days[:, split:] = True
+    second = init_database.compute_revenue_volatility(revenue, new_days, first["ewma_mean"],
+                                                      first["ewma_variance"], volatility_index)
+
+    np.testing.assert_array_equal(second["volatility_index"], full["volatility_index"])
+    np.testing.assert_array_equal(second["anomaly_category"][:, split:], full["anomaly_category"][:, split:])
+    for window in init_database.VOLATILITY_TREND_WINDOWS:
+        key = f"volatility_trend_{window}d"
+        np.testing.assert_allclose(second[key][:, split:], full[key][:, split:], rtol=0, atol=1e-12)
+    np.testing.assert_array_equal(second["ewma_mean"], full["ewma_mean"])
+    np.testing.assert_array_equal(second["ewma_variance"], full["ewma_variance"])
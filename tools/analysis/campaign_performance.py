@@ -0,0 +1,427 @@
+#!/usr/bin/env python3
+"""
+Campaign Performance Engine
+
+Computes the campaign funnel and return metrics for every campaign and restaurant in one
+vectorized pandas pass over ads_data: CTR (clicks / impressions), CVR (conversions /
+clicks), ROI (revenue_generated / spend, the definition behind peer_benchmarks.avg_roi),
+net ROI on total investment, cost per conversion, fund consumption and unspent funds.
+Restaurants also get a marginal ROI (least-squares slope of revenue_generated on spend
+across their campaigns, when the spends vary enough to fit one), a comparison with their locality/cuisine peers and a budget
+action for portfolio-wide reallocation.
+
+Results are materialized in campaign_performance and restaurant_campaign_performance and
+rebuilt when ads_data or peer_benchmarks change.
+
+Usage:
+    uv run tools/analysis/campaign_performance.py [RESTAURANT_ID] [--top N] [--refresh] [--json] [--db-path PATH]
+
+Author: Swiggy Dineout Challenge
+Version: 1.0
+"""
+
+import sqlite3
+import json
+import argparse
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+import numpy as np
+import pandas as pd
+
+# Project root and default database path
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+DEFAULT_DB_PATH = PROJECT_ROOT / ".db" / "swiggy_dineout.db"
+
+# Bump when metrics change so materialized results are rebuilt
+ENGINE_VERSION = 2
+
+# Budget actions: increase when ROI is at least the peer average, the funds are nearly
+# consumed and extra spend still returns at least MIN_MARGINAL_ROI (or no slope could be
+# fitted); decrease when ROI trails the peer average by more than the margin
+HIGH_FUND_CONSUMPTION = 0.8
+MIN_MARGINAL_ROI = 1.0
+UNDERPERFORMANCE_MARGIN = 0.25
+BUDGET_ACTIONS = ["increase", "maintain", "decrease"]
+
+# Marginal ROI needs campaigns whose spends differ; below this coefficient of variation the
+# slope is noise
+MIN_SPEND_VARIATION = 0.1
+
+# Restaurants listed per budget action in the portfolio summary
+DEFAULT_TOP = 5
+
+FUNNEL_TOTALS = ["impressions", "clicks", "conversions", "spend", "revenue_generated", "total_investment"]
+
+
+def _safe_ratio(numerator: pd.Series, denominator: pd.Series) -> pd.Series:
+    """Element-wise ratio with NaN where the denominator is zero"""
+    return numerator / denominator.where(denominator != 0)
+
+
+def _add_funnel_metrics(frame: pd.DataFrame) -> pd.DataFrame:
+    """Add the funnel and return columns computed from FUNNEL_TOTALS"""
+    frame["ctr"] = _safe_ratio(frame["clicks"], frame["impressions"])
+    frame["cvr"] = _safe_ratio(frame["conversions"], frame["clicks"])
+    frame["roi"] = _safe_ratio(frame["revenue_generated"], frame["spend"])
+    frame["net_roi"] = _safe_ratio(frame["revenue_generated"] - frame["total_investment"], frame["total_investment"])
+    frame["cost_per_conversion"] = _safe_ratio(frame["spend"], frame["conversions"])
+    frame["fund_consumption"] = _safe_ratio(frame["spend"], frame["total_investment"])
+    frame["unspent_funds"] = (frame["total_investment"] - frame["spend"]).clip(lower=0)
+    frame["roi_gap_pct"] = 100 * _safe_ratio(frame["roi"] - frame["peer_avg_roi"], frame["peer_avg_roi"])
+    frame["cvr_gap_pct"] = 100 * _safe_ratio(frame["cvr"] - frame["peer_avg_conversion_rate"], frame["peer_avg_conversion_rate"])
+    return frame
+
+
+def load_campaigns(conn: sqlite3.Connection) -> pd.DataFrame:
+    """Every campaign with its restaurant's market and the market's peer benchmarks"""
+    return pd.read_sql_query("""
+        SELECT
+            a.campaign_id, a.restaurant_id, m.locality, m.cuisine, a.campaign_category,
+            a.campaign_start, a.campaign_end,
+            a.impressions, a.clicks, a.conversions, a.spend, a.revenue_generated, a.total_investment,
+            p.avg_roi AS peer_avg_roi, p.avg_conversion_rate AS peer_avg_conversion_rate
+        FROM ads_data a
+        JOIN restaurant_master m ON m.restaurant_id = a.restaurant_id
+        LEFT JOIN peer_benchmarks p ON p.locality = m.locality AND p.cuisine = m.cuisine
+        ORDER BY a.restaurant_id, a.campaign_id
+    """, conn)
+
+
+def compute_campaign_performance(campaigns: pd.DataFrame) -> Dict[str, pd.DataFrame]:
+    """
+    Campaign- and restaurant-level funnel metrics for the whole portfolio.
+
+    Campaign metrics are column arithmetic over all rows. Restaurant totals, and the
+    sums behind each restaurant's marginal ROI slope, come from one groupby. Ranks
+    order campaigns by ROI within their restaurant and restaurants by ROI within
+    their locality/cuisine.
+
+    Args:
+        campaigns (pd.DataFrame): Output of load_campaigns
+
+    Returns:
+        Dict[str, pd.DataFrame]: "campaigns" and "restaurants" frames, one row per
+            campaign and per restaurant with campaigns
+    """
+    campaigns = _add_funnel_metrics(campaigns.copy())
+    campaigns["roi_rank"] = campaigns.groupby("restaurant_id")["roi"].rank(ascending=False, method="min")
+
+    # Marginal ROI: slope of revenue on spend, from per-restaurant sums
+    campaigns["spend_revenue"] = campaigns["spend"] * campaigns["revenue_generated"]
+    campaigns["spend_squared"] = campaigns["spend"] ** 2
+    grouped = campaigns.groupby("restaurant_id", sort=True)
+    restaurants = grouped[FUNNEL_TOTALS + ["spend_revenue", "spend_squared"]].sum()
+    restaurants["campaigns"] = grouped.size()
+    restaurants[["locality", "cuisine", "peer_avg_roi", "peer_avg_conversion_rate"]] = grouped[
+        ["locality", "cuisine", "peer_avg_roi", "peer_avg_conversion_rate"]
+    ].first()
+    restaurants["best_campaign_id"] = campaigns.loc[campaigns["roi"].fillna(-np.inf).groupby(campaigns["restaurant_id"]).idxmax(),
+                                                    ["restaurant_id", "campaign_id"]].set_index("restaurant_id")["campaign_id"]
+    campaigns = campaigns.drop(columns=["spend_revenue", "spend_squared"])
+
+    n = restaurants["campaigns"]
+    denominator = n * restaurants["spend_squared"] - restaurants["spend"] ** 2
+    varied = denominator >= (MIN_SPEND_VARIATION * restaurants["spend"]) ** 2
+    restaurants["marginal_roi"] = _safe_ratio(n * restaurants["spend_revenue"] - restaurants["spend"] * restaurants["revenue_generated"],
+                                              denominator.where(varied & (n > 1)))
+    restaurants = _add_funnel_metrics(restaurants.drop(columns=["spend_revenue", "spend_squared"]).reset_index())
+    restaurants["peer_roi_rank"] = restaurants.groupby(["locality", "cuisine"])["roi"].rank(ascending=False, method="min")
+    restaurants["peer_group_size"] = restaurants.groupby(["locality", "cuisine"])["restaurant_id"].transform("size")
+
+    above_peers = restaurants["roi"] >= restaurants["peer_avg_roi"]
+    funds_consumed = restaurants["fund_consumption"] >= HIGH_FUND_CONSUMPTION
+    scales = restaurants["marginal_roi"].isna() | (restaurants["marginal_roi"] >= MIN_MARGINAL_ROI)
+    trailing_peers = restaurants["roi"] < restaurants["peer_avg_roi"] * (1 - UNDERPERFORMANCE_MARGIN)
+    restaurants["budget_action"] = np.select(
+        [above_peers & funds_consumed & scales, trailing_peers],
+        ["increase", "decrease"], "maintain"
+    )
+    return {"campaigns": campaigns, "restaurants": restaurants}
+
+
+# Materialized columns: (name, SQL type, decimals); None keeps the value as is
+CAMPAIGN_COLUMNS = [
+    ("campaign_id", "TEXT NOT NULL", None), ("restaurant_id", "TEXT NOT NULL", None),
+    ("locality", "TEXT", None), ("cuisine", "TEXT", None), ("campaign_category", "TEXT", None),
+    ("campaign_start", "DATE", None), ("campaign_end", "DATE", None),
+    ("impressions", "INTEGER", None), ("clicks", "INTEGER", None), ("conversions", "INTEGER", None),
+    ("spend", "REAL", 2), ("revenue_generated", "REAL", 2), ("total_investment", "REAL", 2),
+    ("ctr", "REAL", 4), ("cvr", "REAL", 4), ("roi", "REAL", 2), ("net_roi", "REAL", 2),
+    ("cost_per_conversion", "REAL", 2), ("fund_consumption", "REAL", 4), ("unspent_funds", "REAL", 2),
+    ("peer_avg_roi", "REAL", 2), ("peer_avg_conversion_rate", "REAL", 4),
+    ("roi_gap_pct", "REAL", 2), ("cvr_gap_pct", "REAL", 2), ("roi_rank", "INTEGER", 0)
+]
+RESTAURANT_COLUMNS = [
+    ("restaurant_id", "TEXT PRIMARY KEY", None), ("locality", "TEXT", None), ("cuisine", "TEXT", None),
+    ("campaigns", "INTEGER", None), ("best_campaign_id", "TEXT", None),
+    ("impressions", "INTEGER", None), ("clicks", "INTEGER", None), ("conversions", "INTEGER", None),
+    ("spend", "REAL", 2), ("revenue_generated", "REAL", 2), ("total_investment", "REAL", 2),
+    ("ctr", "REAL", 4), ("cvr", "REAL", 4), ("roi", "REAL", 2), ("net_roi", "REAL", 2), ("marginal_roi", "REAL", 2),
+    ("cost_per_conversion", "REAL", 2), ("fund_consumption", "REAL", 4), ("unspent_funds", "REAL", 2),
+    ("peer_avg_roi", "REAL", 2), ("peer_avg_conversion_rate", "REAL", 4),
+    ("roi_gap_pct", "REAL", 2), ("cvr_gap_pct", "REAL", 2),
+    ("peer_roi_rank", "INTEGER", 0), ("peer_group_size", "INTEGER", None), ("budget_action", "TEXT", None)
+]
+
+
+def initialize_campaign_tables(conn: sqlite3.Connection) -> None:
+    """Create the campaign_performance and restaurant_campaign_performance tables (idempotent)."""
+    campaign_columns = ",\n".join(f"            {name} {sql_type}" for name, sql_type, _ in CAMPAIGN_COLUMNS)
+    restaurant_columns = ",\n".join(f"            {name} {sql_type}" for name, sql_type, _ in RESTAURANT_COLUMNS)
+    conn.executescript(f"""
+        CREATE TABLE IF NOT EXISTS campaign_performance (
+{campaign_columns},
+            source_signature TEXT NOT NULL,
+            PRIMARY KEY (restaurant_id, campaign_id)
+        );
+        CREATE TABLE IF NOT EXISTS restaurant_campaign_performance (
+{restaurant_columns},
+            source_signature TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_campaign_performance_category ON campaign_performance(campaign_category, roi);
+        CREATE INDEX IF NOT EXISTS idx_restaurant_campaign_performance_action
+            ON restaurant_campaign_performance(budget_action, marginal_roi, unspent_funds);
+        CREATE INDEX IF NOT EXISTS idx_restaurant_campaign_performance_market
+            ON restaurant_campaign_performance(locality, cuisine, roi);
+    """)
+
+
+def source_signature(conn: sqlite3.Connection) -> str:
+    """Fingerprint of ads_data, peer_benchmarks and the budget thresholds; any change to them triggers a rebuild"""
+    ads = conn.execute("""
+        SELECT COUNT(*), TOTAL(spend), TOTAL(revenue_generated), TOTAL(total_investment),
+               TOTAL(impressions + clicks + conversions)
+        FROM ads_data
+    """).fetchone()
+    peers = conn.execute("SELECT COUNT(*), TOTAL(avg_roi), TOTAL(avg_conversion_rate) FROM peer_benchmarks").fetchone()
+    thresholds = (HIGH_FUND_CONSUMPTION, MIN_MARGINAL_ROI, UNDERPERFORMANCE_MARGIN, MIN_SPEND_VARIATION)
+    return f"v{ENGINE_VERSION}:" + ":".join(str(value) for value in ads + peers + thresholds)
+
+
+def _records(frame: pd.DataFrame, columns: List[tuple], signature: str):
+    """Rows for executemany with rounding applied and NaN as NULL, converted column by column"""
+    values = []
+    for name, sql_type, digits in columns:
+        series = frame[name]
+        if digits is None and not sql_type.startswith("INTEGER"):
+            values.append(series.tolist())
+            continue
+        numbers = series.to_numpy(dtype=float)
+        missing = np.flatnonzero(np.isnan(numbers))
+        if sql_type.startswith("INTEGER"):
+            column = np.nan_to_num(numbers).astype(np.int64).tolist()
+        else:
+            column = np.round(numbers, digits).tolist()
+        for index in missing.tolist():
+            column[index] = None
+        values.append(column)
+    values.append([signature] * len(frame))
+    return zip(*values)
+
+
+def build_campaign_performance(db_path: str = None, refresh: bool = False) -> Dict[str, Any]:
+    """
+    Compute and materialize campaign performance, unless the stored results match the data.
+
+    Args:
+        db_path (str): Path to SQLite database file. Default: ".db/swiggy_dineout.db"
+        refresh (bool): Rebuild even if the stored results are current
+
+    Returns:
+        Dict[str, Any]: campaigns and restaurants materialized, source ("cache" or
+            "computed") and the seconds spent computing
+    """
+    # Use default path if none provided
+    if db_path is None:
+        db_path = str(DEFAULT_DB_PATH)
+
+    with sqlite3.connect(db_path) as conn:
+        initialize_campaign_tables(conn)
+        signature = source_signature(conn)
+        stored = conn.execute("""
+            SELECT MIN(source_signature), MAX(source_signature), COUNT(*) FROM restaurant_campaign_performance
+        """).fetchone()
+
+        if not refresh and stored[2] and stored[0] == stored[1] == signature:
+            campaigns = conn.execute("SELECT COUNT(*) FROM campaign_performance").fetchone()[0]
+            return {"campaigns": campaigns, "restaurants": stored[2], "source": "cache", "seconds": 0.0}
+
+        started = datetime.now()
+        results = compute_campaign_performance(load_campaigns(conn))
+        seconds = (datetime.now() - started).total_seconds()
+
+        with conn:
+            for table, frame, columns in [("campaign_performance", results["campaigns"], CAMPAIGN_COLUMNS),
+                                          ("restaurant_campaign_performance", results["restaurants"], RESTAURANT_COLUMNS)]:
+                names = [name for name, _, _ in columns] + ["source_signature"]
+                conn.execute(f"DELETE FROM {table}")
+                conn.executemany(f"INSERT INTO {table} ({', '.join(names)}) VALUES ({', '.join('?' * len(names))})",
+                                 _records(frame, columns, signature))
+
+        return {"campaigns": len(results["campaigns"]), "restaurants": len(results["restaurants"]),
+                "source": "computed", "seconds": round(seconds, 3)}
+
+
+def get_restaurant_campaigns(restaurant_id: str, db_path: str = None, refresh: bool = False) -> Optional[Dict[str, Any]]:
+    """
+    A restaurant's campaign performance and its campaigns, materializing results first if stale.
+
+    Returns:
+        Dict[str, Any]: Restaurant totals, rates, marginal ROI, peer comparison and budget
+            action, plus "campaign_details" ordered by ROI; None if it has no campaigns
+
+    Example:
+        >>> performance = get_restaurant_campaigns("R001")
+        >>> performance["roi"], performance["peer_avg_roi"], performance["budget_action"]
+        (4.81, 3.7, 'maintain')
+    """
+    # Use default path if none provided
+    if db_path is None:
+        db_path = str(DEFAULT_DB_PATH)
+
+    build_campaign_performance(db_path, refresh)
+
+    with sqlite3.connect(db_path) as conn:
+        conn.row_factory = sqlite3.Row
+        row = conn.execute("SELECT * FROM restaurant_campaign_performance WHERE restaurant_id = ?", (restaurant_id,)).fetchone()
+        if not row:
+            return None
+        campaigns = conn.execute("""
+            SELECT * FROM campaign_performance WHERE restaurant_id = ? ORDER BY roi_rank, campaign_id
+        """, (restaurant_id,)).fetchall()
+
+    performance = {key: row[key] for key in row.keys() if key != "source_signature"}
+    performance["campaign_details"] = [
+        {key: campaign[key] for key in campaign.keys() if key not in ("source_signature", "restaurant_id", "locality", "cuisine")}
+        for campaign in campaigns
+    ]
+    return performance
+
+
+def get_budget_reallocation(db_path: str = None, top: int = DEFAULT_TOP, refresh: bool = False) -> Dict[str, Any]:
+    """
+    Portfolio totals and the restaurants to move budget to and from.
+
+    Increase candidates are ordered by marginal ROI (highest first), decrease candidates
+    by unspent funds (largest first), both read from the materialized table.
+    """
+    # Use default path if none provided
+    if db_path is None:
+        db_path = str(DEFAULT_DB_PATH)
+
+    build = build_campaign_performance(db_path, refresh)
+
+    with sqlite3.connect(db_path) as conn:
+        conn.row_factory = sqlite3.Row
+        totals = conn.execute("""
+            SELECT COUNT(*) AS restaurants, SUM(campaigns) AS campaigns, SUM(spend) AS spend,
+                   SUM(revenue_generated) AS revenue_generated, SUM(total_investment) AS total_investment,
+                   SUM(unspent_funds) AS unspent_funds
+            FROM restaurant_campaign_performance
+        """).fetchone()
+        actions = dict(conn.execute("SELECT budget_action, COUNT(*) FROM restaurant_campaign_performance GROUP BY budget_action").fetchall())
+        candidate_columns = "restaurant_id, locality, cuisine, roi, marginal_roi, peer_avg_roi, fund_consumption, unspent_funds"
+        increase = conn.execute(f"""
+            SELECT {candidate_columns} FROM restaurant_campaign_performance
+            WHERE budget_action = 'increase' ORDER BY marginal_roi IS NULL, marginal_roi DESC LIMIT ?
+        """, (top,)).fetchall()
+        decrease = conn.execute(f"""
+            SELECT {candidate_columns} FROM restaurant_campaign_performance
+            WHERE budget_action = 'decrease' ORDER BY unspent_funds DESC LIMIT ?
+        """, (top,)).fetchall()
+
+    spend = totals["spend"] or 0
+    return {
+        "source": build["source"],
+        "restaurants": totals["restaurants"],
+        "campaigns": totals["campaigns"] or 0,
+        "spend": round(spend, 2),
+        "revenue_generated": round(totals["revenue_generated"] or 0, 2),
+        "roi": round(totals["revenue_generated"] / spend, 2) if spend else None,
+        "fund_consumption": round(spend / totals["total_investment"], 4) if totals["total_investment"] else None,
+        "unspent_funds": round(totals["unspent_funds"] or 0, 2),
+        "budget_actions": {action: actions.get(action, 0) for action in BUDGET_ACTIONS},
+        "increase_candidates": [dict(row) for row in increase],
+        "decrease_candidates": [dict(row) for row in decrease]
+    }
+
+
+def _format_value(value: Optional[float], suffix: str = "") -> str:
+    """Format an optional number for console output"""
+    return "-" if value is None else f"{value:,.2f}{suffix}"
+
+
+if __name__ == "__main__":
+    """Command-line interface for the campaign performance engine."""
+    parser = argparse.ArgumentParser(description="Campaign funnel and ROI analytics with peer comparison and budget actions")
+    parser.add_argument("restaurant_id", nargs="?", help="Restaurant to show (default: portfolio budget reallocation)")
+    parser.add_argument("--db-path", default=str(DEFAULT_DB_PATH), help="Database file path")
+    parser.add_argument("--top", type=int, default=DEFAULT_TOP,
+                        help=f"Restaurants listed per budget action (default: {DEFAULT_TOP})")
+    parser.add_argument("--refresh", action="store_true", help="Recompute even if the materialized results are current")
+    parser.add_argument("--json", action="store_true", help="Output results in JSON format")
+
+    args = parser.parse_args()
+
+    if args.top < 1:
+        parser.error("--top must be at least 1")
+
+    try:
+        if not args.restaurant_id:
+            portfolio = get_budget_reallocation(args.db_path, args.top, args.refresh)
+            if args.json:
+                print(json.dumps(portfolio, indent=2))
+            else:
+                print("💰 CAMPAIGN PORTFOLIO")
+                print("=" * 50)
+                print(f"📊 {portfolio['campaigns']} campaigns across {portfolio['restaurants']} restaurants "
+                      f"({'cached' if portfolio['source'] == 'cache' else 'recomputed'})")
+                print(f"💸 Spend: {_format_value(portfolio['spend'])}  Revenue: {_format_value(portfolio['revenue_generated'])}  "
+                      f"ROI: {_format_value(portfolio['roi'], 'x')}")
+                print(f"🏦 Fund consumption: {_format_value(None if portfolio['fund_consumption'] is None else 100 * portfolio['fund_consumption'], '%')}  "
+                      f"Unspent: {_format_value(portfolio['unspent_funds'])}")
+                print(f"🎯 Budget actions: " + ", ".join(f"{action} {count}" for action, count in portfolio["budget_actions"].items()))
+                for title, key in [("⬆️  Increase budget (highest marginal ROI)", "increase_candidates"),
+                                   ("⬇️  Decrease budget (largest unspent funds)", "decrease_candidates")]:
+                    print(f"\n{title}:")
+                    for row in portfolio[key]:
+                        print(f"  {row['restaurant_id']:<8} ROI {_format_value(row['roi'], 'x'):>8}  "
+                              f"marginal {_format_value(row['marginal_roi'], 'x'):>8}  peer {_format_value(row['peer_avg_roi'], 'x'):>7}  "
+                              f"unspent {_format_value(row['unspent_funds']):>10}")
+        else:
+            performance = get_restaurant_campaigns(args.restaurant_id, args.db_path, args.refresh)
+            if performance is None:
+                print(f"❌ Restaurant {args.restaurant_id} has no campaigns")
+                exit(1)
+
+            if args.json:
+                print(json.dumps(performance, indent=2))
+            else:
+                print(f"💰 CAMPAIGN PERFORMANCE: {performance['restaurant_id']}")
+                print("=" * 50)
+                print(f"📍 Market: {performance['locality']} / {performance['cuisine']} "
+                      f"(ROI rank {performance['peer_roi_rank']} of {performance['peer_group_size']})")
+                print(f"🔻 Funnel: {performance['impressions']:,} impressions → {performance['clicks']:,} clicks → "
+                      f"{performance['conversions']:,} conversions")
+                print(f"📈 CTR {_format_value(None if performance['ctr'] is None else 100 * performance['ctr'], '%')}  "
+                      f"CVR {_format_value(None if performance['cvr'] is None else 100 * performance['cvr'], '%')}  "
+                      f"ROI {_format_value(performance['roi'], 'x')} (peer {_format_value(performance['peer_avg_roi'], 'x')}, "
+                      f"gap {_format_value(performance['roi_gap_pct'], '%')})")
+                print(f"📐 Marginal ROI: {_format_value(performance['marginal_roi'], 'x')}  Net ROI: {_format_value(performance['net_roi'], 'x')}")
+                print(f"🏦 Fund consumption: {_format_value(None if performance['fund_consumption'] is None else 100 * performance['fund_consumption'], '%')}  "
+                      f"Unspent: {_format_value(performance['unspent_funds'])}")
+                print(f"🎯 Budget action: {performance['budget_action']}")
+                print(f"\n{'CAMPAIGN':<16}{'CATEGORY':<18}{'CTR':>8}{'CVR':>8}{'ROI':>8}{'CONSUMED':>10}")
+                print("-" * 68)
+                for campaign in performance["campaign_details"]:
+                    ctr = "-" if campaign["ctr"] is None else f"{100 * campaign['ctr']:.1f}%"
+                    cvr = "-" if campaign["cvr"] is None else f"{100 * campaign['cvr']:.1f}%"
+                    roi = "-" if campaign["roi"] is None else f"{campaign['roi']:.2f}x"
+                    consumed = "-" if campaign["fund_consumption"] is None else f"{100 * campaign['fund_consumption']:.0f}%"
+                    print(f"{campaign['campaign_id']:<16}{campaign['campaign_category']:<18}{ctr:>8}{cvr:>8}{roi:>8}{consumed:>10}")
+
+    except Exception as e:
+        print(f"❌ Error computing campaign performance: {str(e)}")
+        exit(1)
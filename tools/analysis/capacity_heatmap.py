@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+"""
+Capacity Heatmap Builder
+
+Precomputes a compact 7 x 24 hour-of-week matrix per restaurant from operational_metrics:
+mean and 90th percentile capacity utilization, overbooking rate (incidents per observed
+slot-hour) and mean service delay. The hourly rows of every restaurant are aggregated in
+one vectorized NumPy pass and each matrix is stored as a float32 BLOB in the
+restaurant_capacity_heatmaps table, so peak and underutilized slot questions become a
+single-row read and dashboards can render heatmaps without touching the raw rows.
+
+Matrices are rebuilt when operational_metrics gets a new latest date. Rows are days of
+the week (0 = Sunday, like restaurant_hour_of_week_profile) and columns are hours 0-23;
+cells without observations are NaN (null in JSON).
+
+Usage:
+    uv run tools/analysis/capacity_heatmap.py [RESTAURANT_ID] [--window-days N] [--refresh] [--json] [--db-path PATH]
+
+Author: Swiggy Dineout Challenge
+Version: 1.0
+"""
+
+import sqlite3
+import json
+import argparse
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+import numpy as np
+
+# Project root and default database path
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+DEFAULT_DB_PATH = PROJECT_ROOT / ".db" / "swiggy_dineout.db"
+
+# Days of operational_metrics (ending at the latest date) summarized in the matrices
+DEFAULT_WINDOW_DAYS = 90
+
+# Bump when the matrices change meaning so cached heatmaps are rebuilt
+HEATMAP_VERSION = 1
+
+# Matrix layout: day of week (0 = Sunday, as strftime('%w')) x hour slot
+DAYS_PER_WEEK = 7
+HOURS_PER_DAY = 24
+CELLS = DAYS_PER_WEEK * HOURS_PER_DAY
+DAY_LABELS = ["Sun", "Mon", "Tue", "Wed", "Thu", "Fri", "Sat"]
+
+# Stored matrices, in BLOB column order
+HEATMAP_MATRICES = ["observations", "utilization_mean", "utilization_p90", "overbooking_rate", "service_delay_mean"]
+BLOB_DTYPE = "<f4"
+UTILIZATION_PERCENTILE = 90
+
+# Peak and underutilized slots listed per restaurant
+SLOT_HIGHLIGHTS = 5
+
+# Restaurants whose hourly rows are held in memory at once
+HEATMAP_BATCH_SIZE = 1024
+
+
+def compute_heatmaps(restaurant_positions: np.ndarray, cells: np.ndarray, utilization: np.ndarray,
+                     overbooking: np.ndarray, service_delay: np.ndarray, restaurant_count: int) -> Dict[str, np.ndarray]:
+    """
+    Hour-of-week matrices for a batch of restaurants from their hourly rows.
+
+    Every row is keyed by (restaurant position, day_of_week * 24 + hour); sums and counts
+    per key are bincounts reshaped to (restaurants, 7, 24). The utilization percentile
+    sorts rows by key then value and interpolates linearly inside each key's run, like
+    numpy.percentile.
+
+    Args:
+        restaurant_positions (np.ndarray): Row's restaurant index within the batch
+        cells (np.ndarray): Row's day_of_week * 24 + hour_slot
+        utilization, overbooking, service_delay (np.ndarray): Row values
+        restaurant_count (int): Restaurants in the batch
+
+    Returns:
+        Dict[str, np.ndarray]: One (restaurants, 7, 24) float array per HEATMAP_MATRICES entry
+    """
+    keys = restaurant_positions * CELLS + cells
+    size = restaurant_count * CELLS
+    counts = np.bincount(keys, minlength=size)
+    observed = counts > 0
+
+    def cell_mean(values: np.ndarray) -> np.ndarray:
+        sums = np.bincount(keys, weights=values, minlength=size)
+        return np.divide(sums, counts, out=np.full(size, np.nan), where=observed)
+
+    order = np.lexsort((utilization, keys))
+    ordered = utilization[order]
+    starts = np.cumsum(counts) - counts
+    rank = (counts - 1).clip(min=0) * (UTILIZATION_PERCENTILE / 100)
+    low = starts + np.floor(rank).astype(np.int64)
+    high = starts + np.ceil(rank).astype(np.int64)
+    percentile = np.full(size, np.nan)
+    percentile[observed] = ordered[low[observed]] + (ordered[high[observed]] - ordered[low[observed]]) * (rank[observed] % 1)
+
+    shape = (restaurant_count, DAYS_PER_WEEK, HOURS_PER_DAY)
+    return {
+        "observations": counts.astype(float).reshape(shape),
+        "utilization_mean": cell_mean(utilization).reshape(shape),
+        "utilization_p90": percentile.reshape(shape),
+        "overbooking_rate": cell_mean(overbooking).reshape(shape),
+        "service_delay_mean": cell_mean(service_delay).reshape(shape)
+    }
+
+
+def build_capacity_heatmaps(db_path: str = None, window_days: int = DEFAULT_WINDOW_DAYS,
+                            refresh: bool = False) -> Dict[str, Any]:
+    """
+    Build the heatmaps of every restaurant, unless the cached ones match the data.
+
+    The cache is current when it was built by this version, for the same window,
+    as of the latest operational_metrics date.
+
+    Args:
+        db_path (str): Path to SQLite database file. Default: ".db/swiggy_dineout.db"
+        window_days (int): Days of hourly rows summarized. Default: 90
+        refresh (bool): Rebuild even if the cache is current
+
+    Returns:
+        Dict[str, Any]: data_watermark, restaurants with a heatmap, source ("cache" or
+            "computed") and the seconds spent building
+    """
+    # Use default path if none provided
+    if db_path is None:
+        db_path = str(DEFAULT_DB_PATH)
+
+    with sqlite3.connect(db_path) as conn:
+        initialize_heatmap_table(conn)
+        watermark = conn.execute("SELECT MAX(date) FROM operational_metrics").fetchone()[0]
+        cached = conn.execute("""
+            SELECT MIN(data_watermark), MAX(data_watermark), COUNT(*) FROM restaurant_capacity_heatmaps
+            WHERE window_days = ? AND heatmap_version = ?
+        """, (window_days, HEATMAP_VERSION)).fetchone()
+
+        if not refresh and cached[2] and cached[0] == cached[1] == watermark:
+            return {"data_watermark": watermark, "restaurants": cached[2], "source": "cache", "seconds": 0.0}
+
+        started = datetime.now()
+        restaurant_ids = [row[0] for row in conn.execute("SELECT restaurant_id FROM restaurant_master ORDER BY restaurant_id")]
+        conn.execute("CREATE TEMP TABLE IF NOT EXISTS heatmap_batch (restaurant_id TEXT PRIMARY KEY, position INTEGER)")
+
+        built = 0
+        with conn:
+            conn.execute("DELETE FROM restaurant_capacity_heatmaps")
+            if watermark is not None:
+                for start in range(0, len(restaurant_ids), HEATMAP_BATCH_SIZE):
+                    built += _build_heatmap_batch(conn, restaurant_ids[start:start + HEATMAP_BATCH_SIZE], watermark, window_days)
+
+        seconds = (datetime.now() - started).total_seconds()
+        return {"data_watermark": watermark, "restaurants": built, "source": "computed", "seconds": round(seconds, 3)}
+
+
+def _build_heatmap_batch(conn: sqlite3.Connection, restaurant_ids: List[str], watermark: str, window_days: int) -> int:
+    """Compute and store the heatmaps of one batch of restaurants, returning how many had hourly rows"""
+    conn.execute("DELETE FROM temp.heatmap_batch")
+    conn.executemany("INSERT INTO temp.heatmap_batch VALUES (?, ?)", ((rid, i) for i, rid in enumerate(restaurant_ids)))
+
+    # CROSS JOIN keeps the batch as the outer loop so each restaurant's rows are an index range
+    rows = conn.execute("""
+        SELECT b.position, CAST(strftime('%w', o.date) AS INTEGER) * 24 + o.hour_slot,
+               o.capacity_utilization, o.overbooking_incidents, o.service_delay_minutes
+        FROM temp.heatmap_batch b
+        CROSS JOIN operational_metrics o ON o.restaurant_id = b.restaurant_id
+            AND o.date > date(?, ?) AND o.date <= ?
+    """, (watermark, f"-{window_days} days", watermark)).fetchall()
+    if not rows:
+        return 0
+
+    rows = np.array(rows, dtype=float)
+    heatmaps = compute_heatmaps(rows[:, 0].astype(np.int64), rows[:, 1].astype(np.int64),
+                                rows[:, 2], rows[:, 3], rows[:, 4], len(restaurant_ids))
+
+    # Peak cell of each restaurant, for portfolio-wide queries without decoding BLOBs
+    utilization = heatmaps["utilization_mean"].reshape(len(restaurant_ids), CELLS)
+    has_rows = heatmaps["observations"].reshape(len(restaurant_ids), CELLS).any(axis=1)
+    peak_cells = np.argmax(np.nan_to_num(utilization, nan=-1.0), axis=1)
+
+    conn.executemany(f"""
+        INSERT INTO restaurant_capacity_heatmaps (
+            restaurant_id, data_watermark, window_days, heatmap_version,
+            peak_day_of_week, peak_hour_slot, peak_utilization, {', '.join(HEATMAP_MATRICES)}
+        ) VALUES ({', '.join('?' * (7 + len(HEATMAP_MATRICES)))})
+    """, (
+        (restaurant_ids[i], watermark, window_days, HEATMAP_VERSION,
+         int(peak_cells[i] // HOURS_PER_DAY), int(peak_cells[i] % HOURS_PER_DAY), round(float(utilization[i, peak_cells[i]]), 2),
+         *(heatmaps[name][i].astype(BLOB_DTYPE).tobytes() for name in HEATMAP_MATRICES))
+        for i in np.flatnonzero(has_rows)
+    ))
+    return int(has_rows.sum())
+
+
+def initialize_heatmap_table(conn: sqlite3.Connection) -> None:
+    """Create the restaurant_capacity_heatmaps table (idempotent)."""
+    matrix_columns = ",\n".join(f"            {name} BLOB NOT NULL" for name in HEATMAP_MATRICES)
+    conn.executescript(f"""
+        CREATE TABLE IF NOT EXISTS restaurant_capacity_heatmaps (
+            restaurant_id TEXT PRIMARY KEY,
+            data_watermark DATE NOT NULL,
+            window_days INTEGER NOT NULL,
+            heatmap_version INTEGER NOT NULL,
+            peak_day_of_week INTEGER CHECK(peak_day_of_week >= 0 AND peak_day_of_week <= 6),
+            peak_hour_slot INTEGER CHECK(peak_hour_slot >= 0 AND peak_hour_slot <= 23),
+            peak_utilization REAL,
+{matrix_columns},
+            built_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        );
+        CREATE INDEX IF NOT EXISTS idx_restaurant_capacity_heatmaps_peak
+            ON restaurant_capacity_heatmaps(peak_day_of_week, peak_hour_slot, peak_utilization);
+    """)
+
+
+def decode_matrix(blob: bytes) -> np.ndarray:
+    """A stored BLOB as a 7 x 24 float array."""
+    return np.frombuffer(blob, dtype=BLOB_DTYPE).astype(float).reshape(DAYS_PER_WEEK, HOURS_PER_DAY)
+
+
+def _slot_list(cells: np.ndarray, matrices: Dict[str, np.ndarray]) -> List[Dict[str, Any]]:
+    """Describe hour-of-week cells (flat indices) with their utilization"""
+    return [
+        {
+            "day_of_week": int(cell // HOURS_PER_DAY),
+            "day": DAY_LABELS[cell // HOURS_PER_DAY],
+            "hour_slot": int(cell % HOURS_PER_DAY),
+            "utilization_mean": round(float(matrices["utilization_mean"].flat[cell]), 2),
+            "utilization_p90": round(float(matrices["utilization_p90"].flat[cell]), 2)
+        }
+        for cell in cells
+    ]
+
+
+def _matrix_json(matrix: np.ndarray, digits: int) -> List[List[Optional[float]]]:
+    """A matrix as nested lists with NaN as None"""
+    return [[None if np.isnan(value) else round(float(value), digits) for value in row] for row in matrix]
+
+
+def get_capacity_heatmap(restaurant_id: str, db_path: str = None, window_days: int = DEFAULT_WINDOW_DAYS,
+                         refresh: bool = False) -> Optional[Dict[str, Any]]:
+    """
+    A restaurant's hour-of-week heatmap, building the heatmaps first if they are stale.
+
+    Returns:
+        Dict[str, Any]: Window, the 7 x 24 matrices (rows Sunday-Saturday, columns hours
+            0-23) and the peak and most underutilized observed slots, or None if the
+            restaurant has no hourly rows in the window
+
+    Example:
+        >>> heatmap = get_capacity_heatmap("R001")
+        >>> heatmap["matrices"]["utilization_mean"][6][20]   # Saturday 8 PM
+        91.4
+    """
+    # Use default path if none provided
+    if db_path is None:
+        db_path = str(DEFAULT_DB_PATH)
+
+    build = build_capacity_heatmaps(db_path, window_days, refresh)
+
+    with sqlite3.connect(db_path) as conn:
+        conn.row_factory = sqlite3.Row
+        row = conn.execute("SELECT * FROM restaurant_capacity_heatmaps WHERE restaurant_id = ?", (restaurant_id,)).fetchone()
+    if not row:
+        return None
+
+    matrices = {name: decode_matrix(row[name]) for name in HEATMAP_MATRICES}
+    observed = np.flatnonzero(matrices["observations"].ravel() > 0)
+    by_utilization = observed[np.argsort(-matrices["utilization_mean"].ravel()[observed], kind="stable")]
+
+    return {
+        "restaurant_id": row["restaurant_id"],
+        "data_watermark": row["data_watermark"],
+        "window_days": row["window_days"],
+        "source": build["source"],
+        "days": DAY_LABELS,
+        "hours": list(range(HOURS_PER_DAY)),
+        "observed_hours": sorted({int(cell % HOURS_PER_DAY) for cell in observed}),
+        "matrices": {
+            "observations": _matrix_json(matrices["observations"], 0),
+            "utilization_mean": _matrix_json(matrices["utilization_mean"], 2),
+            "utilization_p90": _matrix_json(matrices["utilization_p90"], 2),
+            "overbooking_rate": _matrix_json(matrices["overbooking_rate"], 4),
+            "service_delay_mean": _matrix_json(matrices["service_delay_mean"], 2)
+        },
+        "peak_slots": _slot_list(by_utilization[:SLOT_HIGHLIGHTS], matrices),
+        "underutilized_slots": _slot_list(by_utilization[::-1][:SLOT_HIGHLIGHTS], matrices)
+    }
+
+
+if __name__ == "__main__":
+    """Command-line interface for the capacity heatmap builder."""
+    parser = argparse.ArgumentParser(description="Build and show hour-of-week capacity heatmaps")
+    parser.add_argument("restaurant_id", nargs="?", help="Restaurant to show (default: build heatmaps for all)")
+    parser.add_argument("--db-path", default=str(DEFAULT_DB_PATH), help="Database file path")
+    parser.add_argument("--window-days", type=int, default=DEFAULT_WINDOW_DAYS,
+                        help=f"Days of hourly rows summarized (default: {DEFAULT_WINDOW_DAYS})")
+    parser.add_argument("--refresh", action="store_true", help="Rebuild the heatmaps even if the cache is current")
+    parser.add_argument("--json", action="store_true", help="Output results in JSON format")
+
+    args = parser.parse_args()
+
+    if args.window_days < 1:
+        parser.error("--window-days must be at least 1")
+
+    try:
+        if not args.restaurant_id:
+            summary = build_capacity_heatmaps(args.db_path, args.window_days, args.refresh)
+            if args.json:
+                print(json.dumps(summary, indent=2))
+            else:
+                print(f"✅ Capacity heatmaps {'up to date' if summary['source'] == 'cache' else 'built'}: "
+                      f"{summary['restaurants']} restaurants as of {summary['data_watermark']}")
+                if summary["source"] == "computed":
+                    print(f"⏱️  Computed in {summary['seconds']}s")
+        else:
+            heatmap = get_capacity_heatmap(args.restaurant_id, args.db_path, args.window_days, args.refresh)
+            if heatmap is None:
+                print(f"❌ Restaurant {args.restaurant_id} has no hourly operations in the last {args.window_days} days")
+                exit(1)
+
+            if args.json:
+                print(json.dumps(heatmap, indent=2))
+            else:
+                hours = heatmap["observed_hours"]
+                print(f"🗓️  CAPACITY HEATMAP: {heatmap['restaurant_id']}")
+                print("=" * 50)
+                print(f"📅 As of: {heatmap['data_watermark']} (last {heatmap['window_days']} days)")
+                print("\nMean capacity utilization (%)")
+                print("     " + "".join(f"{hour:>5}" for hour in hours))
+                for day, row in zip(heatmap["days"], heatmap["matrices"]["utilization_mean"]):
+                    print(f"{day:<5}" + "".join("    -" if row[hour] is None else f"{row[hour]:>5.0f}" for hour in hours))
+
+                print("\n🔥 Peak slots:")
+                for slot in heatmap["peak_slots"]:
+                    print(f"  {slot['day']} {slot['hour_slot']:02d}:00  mean {slot['utilization_mean']:.1f}%  p90 {slot['utilization_p90']:.1f}%")
+                print("\n🧊 Underutilized slots:")
+                for slot in heatmap["underutilized_slots"]:
+                    print(f"  {slot['day']} {slot['hour_slot']:02d}:00  mean {slot['utilization_mean']:.1f}%  p90 {slot['utilization_p90']:.1f}%")
+
+    except Exception as e:
+        print(f"❌ Error building capacity heatmaps: {str(e)}")
+        exit(1)
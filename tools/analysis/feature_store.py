@@ -0,0 +1,503 @@
+#!/usr/bin/env python3
+"""
+Restaurant Feature Store Tool
+
+Computes a restaurant's full feature vector once (profile, booking, revenue, campaign,
+peer, risk and operational features) so the parallel analysts read precomputed features
+instead of each re-running the same joins over restaurant_master, restaurant_metrics,
+ads_data and peer_benchmarks.
+
+Snapshots are keyed by (restaurant_id, data watermark, window) where the data watermark
+is the restaurant's latest restaurant_metrics date: they are stored in the
+restaurant_feature_snapshots table and, with --session-dir, exported to the session
+artifacts as feature_snapshot_{RESTAURANT_ID}_{YYYYMMDD}.json. New data (a later
+watermark) produces a new snapshot; unchanged data is served from the store.
+
+Usage:
+    uv run tools/analysis/feature_store.py R001 [--session-dir DIR] [--window-days N] [--refresh] [--json] [--db-path PATH]
+
+Author: Swiggy Dineout Challenge
+Version: 1.0
+"""
+
+import sqlite3
+import json
+import math
+import argparse
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+# Project root and default database path
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+DEFAULT_DB_PATH = PROJECT_ROOT / ".db" / "swiggy_dineout.db"
+
+# Days of history summarized by the windowed features (momentum compares with the window before)
+DEFAULT_WINDOW_DAYS = 30
+
+# Bump when the feature definitions change so older snapshots are recomputed
+FEATURE_VERSION = 2
+
+
+def get_restaurant_features(restaurant_id: str, db_path: str = None, session_dir: str = None,
+                            window_days: int = DEFAULT_WINDOW_DAYS, refresh: bool = False) -> Dict[str, Any]:
+    """
+    Return a restaurant's feature snapshot, computing and storing it only when needed.
+
+    Lookup order: the session artifacts export (with session_dir), then the
+    restaurant_feature_snapshots table, then a fresh computation. A fresh snapshot is
+    written to the table and, with session_dir, exported to the session.
+
+    Args:
+        restaurant_id (str): Restaurant to describe (e.g., "R001")
+        db_path (str): Path to SQLite database file. Default: ".db/swiggy_dineout.db"
+        session_dir (str, optional): Session artifacts directory to export the snapshot to
+        window_days (int): Days summarized by the windowed features. Default: 30
+        refresh (bool): Recompute even if a snapshot for the current watermark exists
+
+    Returns:
+        Dict[str, Any]: Snapshot with restaurant_id, data_watermark, window_days,
+            feature_version, computed_at, source ("session", "feature_store" or
+            "computed") and features (one section per analysis category)
+
+    Raises:
+        ValueError: If the restaurant is unknown or has no metrics
+        sqlite3.Error: If a database query fails
+
+    Example:
+        >>> snapshot = get_restaurant_features("R001", session_dir=".artifacts/abc12345")
+        >>> snapshot["features"]["booking_performance"]["avg_daily_bookings"]
+        15.4
+    """
+    # Use default path if none provided
+    if db_path is None:
+        db_path = str(DEFAULT_DB_PATH)
+
+    with sqlite3.connect(db_path) as conn:
+        conn.row_factory = sqlite3.Row
+        initialize_feature_store(conn)
+
+        watermark = get_data_watermark(conn, restaurant_id)
+        session_file = _session_snapshot_path(session_dir, restaurant_id, watermark) if session_dir else None
+
+        if not refresh:
+            if session_file and session_file.exists():
+                snapshot = json.loads(session_file.read_text())
+                if snapshot.get("feature_version") == FEATURE_VERSION and snapshot.get("window_days") == window_days:
+                    return {**snapshot, "source": "session"}
+
+            snapshot = load_snapshot(conn, restaurant_id, watermark, window_days)
+            if snapshot:
+                if session_file:
+                    _export_snapshot(session_file, snapshot)
+                return {**snapshot, "source": "feature_store"}
+
+        snapshot = {
+            "restaurant_id": restaurant_id,
+            "data_watermark": watermark,
+            "window_days": window_days,
+            "feature_version": FEATURE_VERSION,
+            "computed_at": datetime.now().isoformat(),
+            "features": compute_restaurant_features(conn, restaurant_id, watermark, window_days)
+        }
+        save_snapshot(conn, snapshot)
+
+    if session_file:
+        _export_snapshot(session_file, snapshot)
+    return {**snapshot, "source": "computed"}
+
+
+def initialize_feature_store(conn: sqlite3.Connection) -> None:
+    """Create the restaurant_feature_snapshots table (idempotent)."""
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS restaurant_feature_snapshots (
+            restaurant_id TEXT NOT NULL,
+            data_watermark DATE NOT NULL,
+            window_days INTEGER NOT NULL,
+            feature_version INTEGER NOT NULL,
+            computed_at TEXT NOT NULL,
+            features TEXT NOT NULL,
+            PRIMARY KEY (restaurant_id, data_watermark, window_days)
+        )
+    """)
+
+
+def get_data_watermark(conn: sqlite3.Connection, restaurant_id: str) -> str:
+    """
+    Latest restaurant_metrics date of a restaurant (an index seek on UNIQUE(restaurant_id, date)).
+
+    Raises:
+        ValueError: If the restaurant has no metrics
+    """
+    watermark = conn.execute(
+        "SELECT MAX(date) FROM restaurant_metrics WHERE restaurant_id = ?", (restaurant_id,)
+    ).fetchone()[0]
+    if watermark is None:
+        raise ValueError(f"No restaurant_metrics found for restaurant {restaurant_id}")
+    return watermark
+
+
+def load_snapshot(conn: sqlite3.Connection, restaurant_id: str, watermark: str,
+                  window_days: int) -> Optional[Dict[str, Any]]:
+    """Stored snapshot for the key, or None if missing or built by another feature version."""
+    row = conn.execute("""
+        SELECT * FROM restaurant_feature_snapshots
+        WHERE restaurant_id = ? AND data_watermark = ? AND window_days = ? AND feature_version = ?
+    """, (restaurant_id, watermark, window_days, FEATURE_VERSION)).fetchone()
+    if not row:
+        return None
+
+    return {
+        "restaurant_id": row["restaurant_id"],
+        "data_watermark": row["data_watermark"],
+        "window_days": row["window_days"],
+        "feature_version": row["feature_version"],
+        "computed_at": row["computed_at"],
+        "features": json.loads(row["features"])
+    }
+
+
+def save_snapshot(conn: sqlite3.Connection, snapshot: Dict[str, Any]) -> None:
+    """Insert or replace a snapshot in the feature store."""
+    conn.execute("""
+        INSERT OR REPLACE INTO restaurant_feature_snapshots (
+            restaurant_id, data_watermark, window_days, feature_version, computed_at, features
+        ) VALUES (?, ?, ?, ?, ?, ?)
+    """, (
+        snapshot["restaurant_id"],
+        snapshot["data_watermark"],
+        snapshot["window_days"],
+        snapshot["feature_version"],
+        snapshot["computed_at"],
+        json.dumps(snapshot["features"])
+    ))
+    conn.commit()
+
+
+def compute_restaurant_features(conn: sqlite3.Connection, restaurant_id: str, watermark: str,
+                                window_days: int = DEFAULT_WINDOW_DAYS) -> Dict[str, Dict[str, Any]]:
+    """
+    Compute the feature vector of a restaurant as of its data watermark.
+
+    Windowed features cover the `window_days` days ending at the watermark; momentum
+    compares them with the window before. Campaign features cover every campaign.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: Feature sections: profile, booking_performance,
+            revenue_profitability, campaign_roi, competitive_benchmarking,
+            risk_relationship, operational_excellence
+    """
+    profile_row = conn.execute("SELECT * FROM restaurant_master WHERE restaurant_id = ?", (restaurant_id,)).fetchone()
+    if not profile_row:
+        raise ValueError(f"Restaurant {restaurant_id} not found in restaurant_master")
+
+    end = date.fromisoformat(watermark)
+    window_start = (end - timedelta(days=window_days - 1)).isoformat()
+    previous_start = (end - timedelta(days=2 * window_days - 1)).isoformat()
+    window = (restaurant_id, window_start, watermark)
+
+    daily = [dict(row) for row in conn.execute("""
+        SELECT date, bookings, cancellations, covers, avg_spend_per_cover, revenue, avg_rating
+        FROM restaurant_metrics
+        WHERE restaurant_id = ? AND date BETWEEN ? AND ?
+        ORDER BY date
+    """, (restaurant_id, previous_start, watermark))]
+    current = [row for row in daily if row["date"] >= window_start]
+    previous = [row for row in daily if row["date"] < window_start]
+
+    operations = conn.execute("""
+        SELECT
+            AVG(capacity_utilization) AS avg_capacity_utilization,
+            SUM(overbooking_incidents) AS overbooking_incidents,
+            SUM(underbooking_slots) AS underbooking_slots,
+            SUM(online_bookings) AS online_bookings,
+            SUM(offline_bookings) AS offline_bookings,
+            AVG(service_delay_minutes) AS avg_service_delay_minutes
+        FROM operational_metrics
+        WHERE restaurant_id = ? AND date BETWEEN ? AND ?
+    """, window).fetchone()
+    slots = conn.execute("""
+        SELECT hour_slot, AVG(capacity_utilization) AS utilization
+        FROM operational_metrics
+        WHERE restaurant_id = ? AND date BETWEEN ? AND ?
+        GROUP BY hour_slot
+        ORDER BY utilization DESC, hour_slot
+    """, window).fetchall()
+
+    ads = conn.execute("""
+        SELECT
+            COUNT(*) AS campaigns,
+            SUM(CASE WHEN campaign_end >= ? THEN 1 ELSE 0 END) AS active_campaigns,
+            SUM(impressions) AS impressions,
+            SUM(clicks) AS clicks,
+            SUM(conversions) AS conversions,
+            SUM(spend) AS spend,
+            SUM(revenue_generated) AS revenue_generated,
+            SUM(total_investment) AS total_investment,
+            AVG(fund_consumption_rate) AS avg_fund_consumption_rate
+        FROM ads_data
+        WHERE restaurant_id = ?
+    """, (window_start, restaurant_id)).fetchone()
+
+    peers = conn.execute(
+        "SELECT * FROM peer_benchmarks WHERE locality = ? AND cuisine = ?",
+        (profile_row["locality"], profile_row["cuisine"])
+    ).fetchone()
+    # peer_benchmarks.avg_revenue is not a daily figure, so the revenue gap compares daily
+    # revenue with the locality x cuisine peers' own daily revenue over the same window
+    peer_daily = conn.execute("""
+        SELECT SUM(revenue) AS revenue, COUNT(*) AS restaurant_days
+        FROM restaurant_metrics
+        WHERE locality = ? AND cuisine = ? AND date BETWEEN ? AND ?
+    """, (profile_row["locality"], profile_row["cuisine"], window_start, watermark)).fetchone()
+    peer_avg_daily_revenue = _ratio(peer_daily["revenue"], peer_daily["restaurant_days"])
+    capacity_range = _capacity_range(profile_row["seating_capacity"])
+    market = conn.execute(
+        "SELECT * FROM competitive_intelligence WHERE locality = ? AND cuisine = ? AND capacity_range = ?",
+        (profile_row["locality"], profile_row["cuisine"], capacity_range)
+    ).fetchone()
+
+    service = conn.execute("""
+        SELECT
+            SUM(reviews_count) AS reviews,
+            AVG(avg_service_rating) AS avg_service_rating,
+            SUM(complaints_count) AS complaints,
+            AVG(resolution_time_hours) AS avg_resolution_time_hours
+        FROM service_quality_tracking
+        WHERE restaurant_id = ? AND date BETWEEN ? AND ?
+    """, window).fetchone()
+    volatility = conn.execute("""
+        SELECT
+            AVG(revenue_volatility_index) AS avg_volatility_index,
+            SUM(anomaly_detected) AS anomaly_days,
+            MAX(CASE WHEN date = ? THEN volatility_trend_7d END) AS volatility_trend_7d,
+            MAX(CASE WHEN date = ? THEN volatility_trend_30d END) AS volatility_trend_30d
+        FROM revenue_volatility_tracking
+        WHERE restaurant_id = ? AND date BETWEEN ? AND ?
+    """, (watermark, watermark) + window).fetchone()
+    settlements = conn.execute("""
+        SELECT SUM(outstanding_amount) AS outstanding_amount, AVG(processing_time_days) AS avg_processing_time_days
+        FROM financial_settlements
+        WHERE restaurant_id = ?
+    """, (restaurant_id,)).fetchone()
+    feedback = conn.execute("""
+        SELECT sales_team_rating, prr_score, nrr_score
+        FROM performance_feedback_loop
+        WHERE restaurant_id = ?
+        ORDER BY feedback_date DESC
+        LIMIT 1
+    """, (restaurant_id,)).fetchone()
+
+    days = len(current)
+    bookings = sum(row["bookings"] for row in current)
+    covers = sum(row["covers"] for row in current)
+    revenue = sum(row["revenue"] for row in current)
+    daily_revenue = [row["revenue"] for row in current]
+    avg_daily_bookings = _ratio(bookings, days)
+    avg_daily_revenue = _ratio(revenue, days)
+    ratings = [row["avg_rating"] for row in current if row["avg_rating"] is not None]
+    avg_rating = _ratio(sum(ratings), len(ratings))
+
+    channel_total = (operations["online_bookings"] or 0) + (operations["offline_bookings"] or 0)
+    conversion_rate = _ratio(ads["conversions"], ads["clicks"], 4)
+    roi = _ratio(ads["revenue_generated"], ads["spend"])
+    avg_spend_per_campaign = _ratio(ads["spend"], ads["campaigns"])
+
+    return {
+        "profile": {
+            "restaurant_name": profile_row["restaurant_name"],
+            "city": profile_row["city"],
+            "locality": profile_row["locality"],
+            "cuisine": profile_row["cuisine"],
+            "veg_nonveg_type": profile_row["veg_nonveg_type"],
+            "seating_capacity": profile_row["seating_capacity"],
+            "capacity_range": capacity_range,
+            "exclusivity_status": profile_row["exclusivity_status"],
+            "parent_type": profile_row["parent_type"],
+            "online_order_enabled": bool(profile_row["online_order_enabled"]),
+            "nps_score": profile_row["nps_score"],
+            "partnership_tenure_days": (end - date.fromisoformat(profile_row["onboarded_date"])).days
+        },
+        "booking_performance": {
+            "days_observed": days,
+            "total_bookings": bookings,
+            "avg_daily_bookings": avg_daily_bookings,
+            "cancellation_rate": _ratio(sum(row["cancellations"] for row in current), bookings, 4),
+            "total_covers": covers,
+            "bookings_momentum_pct": _change_pct(bookings, sum(row["bookings"] for row in previous), days, len(previous)),
+            "bookings_trend_slope": _slope([row["bookings"] for row in current]),
+            "avg_capacity_utilization": _round(operations["avg_capacity_utilization"]),
+            "peak_hour_slot": slots[0]["hour_slot"] if slots else None,
+            "lowest_utilization_hour_slot": slots[-1]["hour_slot"] if slots else None
+        },
+        "revenue_profitability": {
+            "total_revenue": _round(revenue),
+            "avg_daily_revenue": avg_daily_revenue,
+            "revenue_per_cover": _ratio(revenue, covers),
+            "revenue_momentum_pct": _change_pct(revenue, sum(row["revenue"] for row in previous), days, len(previous)),
+            "revenue_trend_slope": _slope(daily_revenue),
+            "revenue_coefficient_of_variation": _coefficient_of_variation(daily_revenue),
+            "online_booking_share": _ratio(operations["online_bookings"], channel_total, 4),
+            "avg_rating": avg_rating
+        },
+        "campaign_roi": {
+            "campaigns": ads["campaigns"],
+            "active_campaigns": ads["active_campaigns"] or 0,
+            "impressions": ads["impressions"] or 0,
+            "clicks": ads["clicks"] or 0,
+            "conversions": ads["conversions"] or 0,
+            "spend": _round(ads["spend"] or 0),
+            "revenue_generated": _round(ads["revenue_generated"] or 0),
+            "total_investment": _round(ads["total_investment"] or 0),
+            "ctr": _ratio(ads["clicks"], ads["impressions"], 4),
+            "conversion_rate": conversion_rate,
+            "roi": roi,
+            "avg_fund_consumption_rate": _round(ads["avg_fund_consumption_rate"], 3)
+        },
+        "competitive_benchmarking": {
+            "peer_avg_bookings": peers["avg_bookings"] if peers else None,
+            "peer_avg_revenue": peers["avg_revenue"] if peers else None,
+            "peer_avg_daily_revenue": peer_avg_daily_revenue,
+            "peer_avg_rating": peers["avg_rating"] if peers else None,
+            "peer_avg_conversion_rate": peers["avg_conversion_rate"] if peers else None,
+            "peer_avg_roi": peers["avg_roi"] if peers else None,
+            "peer_avg_ads_spend": peers["avg_ads_spend"] if peers else None,
+            "bookings_gap_pct": _gap_pct(avg_daily_bookings, peers["avg_bookings"] if peers else None),
+            "revenue_gap_pct": _gap_pct(avg_daily_revenue, peer_avg_daily_revenue),
+            "rating_gap_pct": _gap_pct(avg_rating, peers["avg_rating"] if peers else None),
+            "conversion_rate_gap_pct": _gap_pct(conversion_rate, peers["avg_conversion_rate"] if peers else None),
+            "roi_gap_pct": _gap_pct(roi, peers["avg_roi"] if peers else None),
+            "ads_spend_gap_pct": _gap_pct(avg_spend_per_campaign, peers["avg_ads_spend"] if peers else None),
+            "competitor_count": market["competitor_count"] if market else None,
+            "market_share_estimate": market["market_share_estimate"] if market else None,
+            "avg_competitor_rating": market["avg_competitor_rating"] if market else None,
+            "price_positioning": market["price_positioning"] if market else None,
+            "competitive_advantage_score": market["competitive_advantage_score"] if market else None
+        },
+        "risk_relationship": {
+            "avg_volatility_index": _round(volatility["avg_volatility_index"]),
+            "anomaly_days": volatility["anomaly_days"] or 0,
+            "volatility_trend_7d": volatility["volatility_trend_7d"],
+            "volatility_trend_30d": volatility["volatility_trend_30d"],
+            "outstanding_settlement_amount": _round(settlements["outstanding_amount"] or 0),
+            "avg_settlement_processing_days": _round(settlements["avg_processing_time_days"]),
+            "latest_sales_team_rating": feedback["sales_team_rating"] if feedback else None,
+            "latest_prr_score": feedback["prr_score"] if feedback else None,
+            "latest_nrr_score": feedback["nrr_score"] if feedback else None
+        },
+        "operational_excellence": {
+            "overbooking_incidents": operations["overbooking_incidents"] or 0,
+            "underbooking_slots": operations["underbooking_slots"] or 0,
+            "avg_service_delay_minutes": _round(operations["avg_service_delay_minutes"]),
+            "reviews": service["reviews"] or 0,
+            "complaints": service["complaints"] or 0,
+            "complaints_per_100_bookings": _ratio(100 * (service["complaints"] or 0), bookings),
+            "avg_service_rating": _round(service["avg_service_rating"]),
+            "avg_resolution_time_hours": _round(service["avg_resolution_time_hours"])
+        }
+    }
+
+
+def _session_snapshot_path(session_dir: str, restaurant_id: str, watermark: str) -> Path:
+    """Session export path, named per the artifacts protocol with the watermark date"""
+    return Path(session_dir) / f"feature_snapshot_{restaurant_id}_{watermark.replace('-', '')}.json"
+
+
+def _export_snapshot(session_file: Path, snapshot: Dict[str, Any]) -> None:
+    session_file.parent.mkdir(parents=True, exist_ok=True)
+    session_file.write_text(json.dumps(snapshot, indent=2))
+
+
+def _capacity_range(seating_capacity: int) -> str:
+    """competitive_intelligence capacity bucket of a seating capacity"""
+    if seating_capacity <= 30:
+        return "Small (1-30)"
+    if seating_capacity <= 80:
+        return "Medium (31-80)"
+    return "Large (81+)"
+
+
+def _round(value: Optional[float], digits: int = 2) -> Optional[float]:
+    return None if value is None else round(value, digits)
+
+
+def _ratio(numerator: Optional[float], denominator: Optional[float], digits: int = 2) -> Optional[float]:
+    if numerator is None or not denominator:
+        return None
+    return round(numerator / denominator, digits)
+
+
+def _gap_pct(value: Optional[float], benchmark: Optional[float]) -> Optional[float]:
+    """Percentage by which value is above (+) or below (-) the benchmark"""
+    if value is None or not benchmark:
+        return None
+    return round(100 * (value - benchmark) / benchmark, 2)
+
+
+def _change_pct(current_total: float, previous_total: float, current_days: int, previous_days: int) -> Optional[float]:
+    """Change of the daily average between the previous window and the current one"""
+    if not current_days or not previous_days or not previous_total:
+        return None
+    return _gap_pct(current_total / current_days, previous_total / previous_days)
+
+
+def _slope(values: List[float]) -> Optional[float]:
+    """Least-squares change per day of a daily series"""
+    n = len(values)
+    if n < 2:
+        return None
+    mean_x = (n - 1) / 2
+    mean_y = sum(values) / n
+    covariance = sum((x - mean_x) * (y - mean_y) for x, y in enumerate(values))
+    variance = sum((x - mean_x) ** 2 for x in range(n))
+    return round(covariance / variance, 4)
+
+
+def _coefficient_of_variation(values: List[float]) -> Optional[float]:
+    if len(values) < 2:
+        return None
+    mean = sum(values) / len(values)
+    if not mean:
+        return None
+    return round(math.sqrt(sum((value - mean) ** 2 for value in values) / len(values)) / mean, 4)
+
+
+if __name__ == "__main__":
+    """Command-line interface for the restaurant feature store."""
+    parser = argparse.ArgumentParser(description="Compute or read a restaurant's precomputed feature snapshot")
+    parser.add_argument("restaurant_id", help="Restaurant ID (e.g., R001)")
+    parser.add_argument("--db-path", default=str(DEFAULT_DB_PATH), help="Database file path")
+    parser.add_argument("--session-dir", help="Session artifacts directory to export the snapshot to (artifacts_directory)")
+    parser.add_argument("--window-days", type=int, default=DEFAULT_WINDOW_DAYS,
+                        help=f"Days summarized by the windowed features (default: {DEFAULT_WINDOW_DAYS})")
+    parser.add_argument("--refresh", action="store_true", help="Recompute even if a snapshot for the current data exists")
+    parser.add_argument("--json", action="store_true", help="Output the snapshot in JSON format")
+
+    args = parser.parse_args()
+
+    if args.window_days < 1:
+        parser.error("--window-days must be at least 1")
+
+    try:
+        snapshot = get_restaurant_features(args.restaurant_id, args.db_path, args.session_dir,
+                                           args.window_days, args.refresh)
+
+        if args.json:
+            print(json.dumps(snapshot, indent=2))
+        else:
+            print(f"🧮 FEATURE SNAPSHOT: {snapshot['restaurant_id']}")
+            print("=" * 50)
+            print(f"📅 Data watermark: {snapshot['data_watermark']} (last {snapshot['window_days']} days)")
+            print(f"🗂️  Source: {snapshot['source']} (computed at {snapshot['computed_at']})")
+            for section, features in snapshot["features"].items():
+                print(f"\n{section.replace('_', ' ').upper()}")
+                print("-" * 30)
+                for name, value in features.items():
+                    print(f"  {name}: {value}")
+            if args.session_dir:
+                path = _session_snapshot_path(args.session_dir, snapshot['restaurant_id'], snapshot['data_watermark'])
+                print(f"\n📄 Session export: {path}")
+
+    except Exception as e:
+        print(f"❌ Error building feature snapshot: {str(e)}")
+        exit(1)
@@ -0,0 +1,374 @@
+#!/usr/bin/env python3
+"""
+Peer Percentile Engine
+
+Ranks every restaurant against its peers across the five Competitive Benchmarking
+dimensions (daily bookings, daily revenue, revenue per cover, rating, campaign ROI) with
+percentiles and z-scores. peer_benchmarks only stores per-(locality, cuisine) averages;
+this tool computes the full peer distributions for all restaurants in one vectorized
+pandas pass and caches the result in the restaurant_peer_percentiles table.
+
+Peer groups are locality x cuisine x capacity range. When a group has fewer than
+--min-peer-group-size restaurants, the restaurant is ranked in the next coarser group
+(locality x cuisine, then cuisine, then the whole market).
+
+Usage:
+    uv run tools/analysis/peer_percentiles.py [RESTAURANT_ID] [--window-days N] [--min-peer-group-size N] [--refresh] [--json] [--db-path PATH]
+
+Author: Swiggy Dineout Challenge
+Version: 1.0
+"""
+
+import sqlite3
+import json
+import argparse
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+import numpy as np
+import pandas as pd
+
+# Project root and default database path
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+DEFAULT_DB_PATH = PROJECT_ROOT / ".db" / "swiggy_dineout.db"
+
+# Days of restaurant_metrics (ending at the latest date) the dimensions are measured over
+DEFAULT_WINDOW_DAYS = 30
+
+# Smallest peer group a restaurant is ranked in before falling back to a coarser one
+DEFAULT_MIN_PEER_GROUP_SIZE = 5
+
+# Bump when dimensions or peer grouping change so cached rankings are rebuilt
+ENGINE_VERSION = 2
+
+# Ranked dimensions (higher is better for all of them)
+DIMENSIONS = ["avg_daily_bookings", "avg_daily_revenue", "revenue_per_cover", "avg_rating", "campaign_roi"]
+
+# Peer group levels from finest to coarsest: (level name, grouping columns)
+PEER_GROUP_LEVELS = [
+    ("locality_cuisine_capacity", ["locality", "cuisine", "capacity_range"]),
+    ("locality_cuisine", ["locality", "cuisine"]),
+    ("cuisine", ["cuisine"]),
+    ("market", ["market"])
+]
+
+# competitive_intelligence capacity buckets
+CAPACITY_BINS = [0, 30, 80, np.inf]
+CAPACITY_LABELS = ["Small (1-30)", "Medium (31-80)", "Large (81+)"]
+
+
+def load_restaurant_dimensions(conn: sqlite3.Connection, window_days: int = DEFAULT_WINDOW_DAYS) -> pd.DataFrame:
+    """
+    Load one row per restaurant with its peer attributes and dimension values.
+
+    Daily metrics are aggregated in SQL over the last `window_days` days up to the
+    latest restaurant_metrics date; campaign ROI covers every campaign.
+
+    Returns:
+        pd.DataFrame: restaurant_id, locality, cuisine, capacity_range, the DIMENSIONS
+            and as_of_date (empty if there are no metrics)
+    """
+    as_of_date = conn.execute("SELECT MAX(date) FROM restaurant_metrics").fetchone()[0]
+    if as_of_date is None:
+        return pd.DataFrame(columns=["restaurant_id", "locality", "cuisine", "seating_capacity", *DIMENSIONS,
+                                     "capacity_range", "market", "as_of_date"])
+
+    frame = pd.read_sql_query("""
+        WITH window_metrics AS (
+            SELECT
+                restaurant_id,
+                AVG(bookings) AS avg_daily_bookings,
+                AVG(revenue) AS avg_daily_revenue,
+                SUM(revenue) / NULLIF(SUM(covers), 0) AS revenue_per_cover,
+                AVG(avg_rating) AS avg_rating
+            FROM restaurant_metrics
+            WHERE date > date(?, ?) AND date <= ?
+            GROUP BY restaurant_id
+        ),
+        campaigns AS (
+            SELECT restaurant_id, SUM(revenue_generated) / NULLIF(SUM(spend), 0) AS campaign_roi
+            FROM ads_data
+            GROUP BY restaurant_id
+        )
+        SELECT
+            m.restaurant_id, m.locality, m.cuisine, m.seating_capacity,
+            w.avg_daily_bookings, w.avg_daily_revenue, w.revenue_per_cover, w.avg_rating,
+            c.campaign_roi
+        FROM restaurant_master m
+        JOIN window_metrics w ON w.restaurant_id = m.restaurant_id
+        LEFT JOIN campaigns c ON c.restaurant_id = m.restaurant_id
+        ORDER BY m.restaurant_id
+    """, conn, params=(as_of_date, f"-{window_days} days", as_of_date))
+
+    frame["capacity_range"] = pd.cut(frame["seating_capacity"], bins=CAPACITY_BINS,
+                                     labels=CAPACITY_LABELS).astype(str)
+    frame["market"] = "All restaurants"
+    frame["as_of_date"] = as_of_date
+    return frame
+
+
+def compute_peer_percentiles(frame: pd.DataFrame,
+                             min_peer_group_size: int = DEFAULT_MIN_PEER_GROUP_SIZE) -> pd.DataFrame:
+    """
+    Percentile and z-score of every restaurant on every dimension within its peer group.
+
+    Every level's statistics are computed for all restaurants with groupby
+    transforms; each restaurant then takes the values of the finest level whose
+    group has at least `min_peer_group_size` members (the market level always
+    qualifies). Percentiles are 0-100 (share of peers at or below, ties included);
+    z-scores use the group's population standard deviation and are NaN when all
+    peers are equal.
+
+    Args:
+        frame (pd.DataFrame): Output of load_restaurant_dimensions
+        min_peer_group_size (int): Smallest acceptable peer group
+
+    Returns:
+        pd.DataFrame: One row per restaurant with peer_group_level, peer_group,
+            peer_group_size, {dimension}, {dimension}_percentile, {dimension}_zscore,
+            composite_percentile and overall_rank (1 = best composite)
+    """
+    n_levels = len(PEER_GROUP_LEVELS)
+    groupings = [frame.groupby(columns, sort=False, observed=True) for _, columns in PEER_GROUP_LEVELS]
+
+    # (levels x restaurants) group sizes -> index of the finest qualifying level
+    sizes = np.vstack([grouping["restaurant_id"].transform("size").to_numpy() for grouping in groupings])
+    qualifies = sizes >= min_peer_group_size
+    qualifies[-1] = True
+    level = qualifies.argmax(axis=0)
+    rows = np.arange(len(frame))
+
+    result = frame[["restaurant_id", "locality", "cuisine", "capacity_range", "as_of_date"]].copy()
+    result["peer_group_level"] = np.array([name for name, _ in PEER_GROUP_LEVELS])[level]
+    group_labels = np.vstack([
+        frame[columns[0]].astype(str).str.cat([frame[column].astype(str) for column in columns[1:]], sep=" / ").to_numpy()
+        for _, columns in PEER_GROUP_LEVELS
+    ])
+    result["peer_group"] = group_labels[level, rows]
+    result["peer_group_size"] = sizes[level, rows]
+
+    for dimension in DIMENSIONS:
+        values = frame[dimension].astype(float)
+        percentiles = np.empty((n_levels, len(frame)))
+        zscores = np.empty((n_levels, len(frame)))
+        for index, grouping in enumerate(groupings):
+            column = grouping[dimension]
+            percentiles[index] = column.rank(pct=True, method="max").to_numpy() * 100
+            mean = column.transform("mean").to_numpy()
+            std = column.transform("std", ddof=0).to_numpy()
+            with np.errstate(divide="ignore", invalid="ignore"):
+                zscores[index] = np.where(std > 0, (values.to_numpy() - mean) / std, np.nan)
+
+        result[dimension] = values.round(4)
+        result[f"{dimension}_percentile"] = percentiles[level, rows].round(2)
+        result[f"{dimension}_zscore"] = zscores[level, rows].round(4)
+
+    percentile_columns = [f"{dimension}_percentile" for dimension in DIMENSIONS]
+    result["composite_percentile"] = result[percentile_columns].mean(axis=1, skipna=True).round(2)
+    result["overall_rank"] = result["composite_percentile"].rank(ascending=False, method="min").astype("Int64")
+    return result
+
+
+def build_peer_percentiles(db_path: str = None, window_days: int = DEFAULT_WINDOW_DAYS,
+                           min_peer_group_size: int = DEFAULT_MIN_PEER_GROUP_SIZE,
+                           refresh: bool = False) -> Dict[str, Any]:
+    """
+    Rank all restaurants and cache the result, unless the cache already matches the data.
+
+    The cache is current when it was built by this engine version, for the same
+    window and minimum group size, as of the latest restaurant_metrics date.
+
+    Args:
+        db_path (str): Path to SQLite database file. Default: ".db/swiggy_dineout.db"
+        window_days (int): Days of metrics measured. Default: 30
+        min_peer_group_size (int): Smallest acceptable peer group. Default: 5
+        refresh (bool): Rebuild even if the cache is current
+
+    Returns:
+        Dict[str, Any]: as_of_date, restaurants ranked, source ("cache", "computed", or
+            "no metrics" when restaurant_metrics is empty) and the seconds spent computing
+    """
+    # Use default path if none provided
+    if db_path is None:
+        db_path = str(DEFAULT_DB_PATH)
+
+    with sqlite3.connect(db_path) as conn:
+        initialize_percentile_table(conn)
+        as_of_date = conn.execute("SELECT MAX(date) FROM restaurant_metrics").fetchone()[0]
+        cached = conn.execute("""
+            SELECT as_of_date, COUNT(*) FROM restaurant_peer_percentiles
+            WHERE engine_version = ? AND window_days = ? AND min_peer_group_size = ?
+        """, (ENGINE_VERSION, window_days, min_peer_group_size)).fetchone()
+
+        if as_of_date is None:
+            # Nothing to rank; drop rankings left from earlier data
+            with conn:
+                conn.execute("DELETE FROM restaurant_peer_percentiles")
+            return {"as_of_date": None, "restaurants": 0, "source": "no metrics", "seconds": 0.0}
+
+        if not refresh and cached[1] and cached[0] == as_of_date:
+            return {"as_of_date": as_of_date, "restaurants": cached[1], "source": "cache", "seconds": 0.0}
+
+        started = datetime.now()
+        rankings = compute_peer_percentiles(load_restaurant_dimensions(conn, window_days), min_peer_group_size)
+        seconds = (datetime.now() - started).total_seconds()
+
+        save_peer_percentiles(conn, rankings, window_days, min_peer_group_size)
+        return {"as_of_date": as_of_date, "restaurants": len(rankings), "source": "computed", "seconds": round(seconds, 3)}
+
+
+def initialize_percentile_table(conn: sqlite3.Connection) -> None:
+    """Create the restaurant_peer_percentiles cache table (idempotent)."""
+    dimension_columns = ",\n".join(
+        f"            {dimension} REAL,\n"
+        f"            {dimension}_percentile REAL,\n"
+        f"            {dimension}_zscore REAL"
+        for dimension in DIMENSIONS
+    )
+    conn.executescript(f"""
+        CREATE TABLE IF NOT EXISTS restaurant_peer_percentiles (
+            restaurant_id TEXT PRIMARY KEY,
+            as_of_date DATE NOT NULL,
+            window_days INTEGER NOT NULL,
+            min_peer_group_size INTEGER NOT NULL,
+            engine_version INTEGER NOT NULL,
+            locality TEXT NOT NULL,
+            cuisine TEXT NOT NULL,
+            capacity_range TEXT NOT NULL,
+            peer_group_level TEXT NOT NULL,
+            peer_group TEXT NOT NULL,
+            peer_group_size INTEGER NOT NULL,
+{dimension_columns},
+            composite_percentile REAL,
+            overall_rank INTEGER
+        );
+        CREATE INDEX IF NOT EXISTS idx_restaurant_peer_percentiles_rank ON restaurant_peer_percentiles(overall_rank);
+    """)
+
+
+def save_peer_percentiles(conn: sqlite3.Connection, rankings: pd.DataFrame, window_days: int,
+                          min_peer_group_size: int) -> None:
+    """Replace the cached rankings in one transaction."""
+    rankings = rankings.assign(window_days=window_days, min_peer_group_size=min_peer_group_size,
+                               engine_version=ENGINE_VERSION)
+    columns = [row[1] for row in conn.execute("PRAGMA table_info(restaurant_peer_percentiles)")]
+    records = rankings[columns].astype(object).where(rankings[columns].notna(), None).itertuples(index=False, name=None)
+
+    with conn:
+        conn.execute("DELETE FROM restaurant_peer_percentiles")
+        conn.executemany(
+            f"INSERT INTO restaurant_peer_percentiles ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})",
+            records
+        )
+
+
+def get_peer_percentiles(restaurant_id: str, db_path: str = None, window_days: int = DEFAULT_WINDOW_DAYS,
+                         min_peer_group_size: int = DEFAULT_MIN_PEER_GROUP_SIZE,
+                         refresh: bool = False) -> Optional[Dict[str, Any]]:
+    """
+    A restaurant's peer ranking, building the cached rankings first if they are stale.
+
+    Returns:
+        Dict[str, Any]: Peer group, composite percentile, overall rank and a value /
+            percentile / z-score entry per dimension, or None if the restaurant was
+            not ranked (unknown or without metrics in the window)
+
+    Example:
+        >>> ranking = get_peer_percentiles("R001")
+        >>> ranking["dimensions"]["avg_daily_bookings"]["percentile"]
+        62.5
+    """
+    # Use default path if none provided
+    if db_path is None:
+        db_path = str(DEFAULT_DB_PATH)
+
+    build = build_peer_percentiles(db_path, window_days, min_peer_group_size, refresh)
+
+    with sqlite3.connect(db_path) as conn:
+        conn.row_factory = sqlite3.Row
+        row = conn.execute("SELECT * FROM restaurant_peer_percentiles WHERE restaurant_id = ?", (restaurant_id,)).fetchone()
+        total = conn.execute("SELECT COUNT(*) FROM restaurant_peer_percentiles").fetchone()[0]
+    if not row:
+        return None
+
+    return {
+        "restaurant_id": row["restaurant_id"],
+        "as_of_date": row["as_of_date"],
+        "window_days": row["window_days"],
+        "peer_group_level": row["peer_group_level"],
+        "peer_group": row["peer_group"],
+        "peer_group_size": row["peer_group_size"],
+        "composite_percentile": row["composite_percentile"],
+        "overall_rank": row["overall_rank"],
+        "restaurants_ranked": total,
+        "source": build["source"],
+        "dimensions": {
+            dimension: {
+                "value": row[dimension],
+                "percentile": row[f"{dimension}_percentile"],
+                "zscore": row[f"{dimension}_zscore"]
+            }
+            for dimension in DIMENSIONS
+        }
+    }
+
+
+if __name__ == "__main__":
+    """Command-line interface for the peer percentile engine."""
+    parser = argparse.ArgumentParser(description="Rank restaurants against their peers with percentiles and z-scores")
+    parser.add_argument("restaurant_id", nargs="?", help="Restaurant to show (default: build rankings for all)")
+    parser.add_argument("--db-path", default=str(DEFAULT_DB_PATH), help="Database file path")
+    parser.add_argument("--window-days", type=int, default=DEFAULT_WINDOW_DAYS,
+                        help=f"Days of metrics measured (default: {DEFAULT_WINDOW_DAYS})")
+    parser.add_argument("--min-peer-group-size", type=int, default=DEFAULT_MIN_PEER_GROUP_SIZE,
+                        help=f"Smallest peer group before falling back to a coarser one (default: {DEFAULT_MIN_PEER_GROUP_SIZE})")
+    parser.add_argument("--refresh", action="store_true", help="Rebuild the rankings even if the cache is current")
+    parser.add_argument("--json", action="store_true", help="Output results in JSON format")
+
+    args = parser.parse_args()
+
+    if args.window_days < 1 or args.min_peer_group_size < 1:
+        parser.error("--window-days and --min-peer-group-size must be at least 1")
+
+    try:
+        if not args.restaurant_id:
+            summary = build_peer_percentiles(args.db_path, args.window_days, args.min_peer_group_size, args.refresh)
+            if args.json:
+                print(json.dumps(summary, indent=2))
+            elif summary["source"] == "no metrics":
+                print("❌ No restaurant_metrics rows to rank")
+                exit(1)
+            else:
+                print(f"✅ Peer rankings {'up to date' if summary['source'] == 'cache' else 'built'}: "
+                      f"{summary['restaurants']} restaurants as of {summary['as_of_date']}")
+                if summary["source"] == "computed":
+                    print(f"⏱️  Computed in {summary['seconds']}s")
+        else:
+            ranking = get_peer_percentiles(args.restaurant_id, args.db_path, args.window_days,
+                                           args.min_peer_group_size, args.refresh)
+            if ranking is None:
+                print(f"❌ Restaurant {args.restaurant_id} has no metrics in the last {args.window_days} days")
+                exit(1)
+
+            if args.json:
+                print(json.dumps(ranking, indent=2))
+            else:
+                print(f"🏁 PEER RANKING: {ranking['restaurant_id']}")
+                print("=" * 50)
+                print(f"📅 As of: {ranking['as_of_date']} (last {ranking['window_days']} days)")
+                print(f"👥 Peer group: {ranking['peer_group']} ({ranking['peer_group_size']} restaurants, "
+                      f"level: {ranking['peer_group_level']})")
+                print(f"🎯 Composite percentile: {ranking['composite_percentile']}")
+                print(f"🏆 Overall rank: {ranking['overall_rank']} of {ranking['restaurants_ranked']}")
+                print(f"\n{'DIMENSION':<22}{'VALUE':>14}{'PERCENTILE':>12}{'Z-SCORE':>10}")
+                print("-" * 58)
+                for dimension, scores in ranking["dimensions"].items():
+                    value = "-" if scores["value"] is None else f"{scores['value']:.2f}"
+                    percentile = "-" if scores["percentile"] is None else f"{scores['percentile']:.1f}"
+                    zscore = "-" if scores["zscore"] is None else f"{scores['zscore']:+.2f}"
+                    print(f"{dimension:<22}{value:>14}{percentile:>12}{zscore:>10}")
+
+    except Exception as e:
+        print(f"❌ Error computing peer percentiles: {str(e)}")
+        exit(1)
@@ -5,26 +5,51 @@ Evaluation Trends Analysis Tool
 Retrieves and analyzes evaluation trends from the database. Provides insights into
 evaluation patterns, performance trends, and scoring statistics.
 
+Statistics (rolling averages, regression slopes, percentiles, per-dimension rubric
+trends) are computed in SQL with window functions; only aggregates are returned
+unless --detailed is given. --group-by ranks every target entity or workflow type
+in a single grouped query (a leaderboard).
+
 Usage:
-    uv run tools/evaluation/get_trends.py [--restaurant-id ID] [--limit N] [--db-path PATH]
+    uv run tools/evaluation/get_trends.py [--target-entity-id ID] [--limit N] [--since TS] [--until TS] [--detailed] [--db-path PATH]
+    uv run tools/evaluation/get_trends.py --group-by target_entity_id [--rank-by score_slope] [--top N]
 
 Author: Swiggy Dineout Challenge
-Version: 1.0
+Version: 1.1
 """
 
 import sqlite3
 import json
+import math
 import argparse
 import os
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, List
 
 # Project root and default database path
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 DEFAULT_DB_PATH = PROJECT_ROOT / ".db" / "swiggy_dineout.db"
 
+# Evaluations per rolling average
+DEFAULT_ROLLING_WINDOW = 5
+
+# Score percentiles reported
+PERCENTILES = [25, 50, 75, 90]
+
+# Slopes (points per evaluation) closer to zero than this count as "stable"
+STABLE_SLOPE_THRESHOLD = 0.1
+
+# Leaderboard groupings and ranking metrics
+GROUP_BY_COLUMNS = ["target_entity_id", "workflow_type"]
+RANK_BY_METRICS = ["average_score", "latest_score", "score_slope", "total_evaluations"]
+
+# PRAGMA table_xinfo "hidden" values of virtual (2) and stored (3) generated columns
+GENERATED_COLUMN_HIDDEN = (2, 3)
+
 
-def get_evaluation_trends(workflow_type: str = None, target_entity_id: str = None, limit: int = 10, db_path: str = None) -> Dict[str, Any]:
+def get_evaluation_trends(workflow_type: str = None, target_entity_id: str = None, limit: int = 10, db_path: str = None,
+                          detailed: bool = False, since: str = None, until: str = None,
+                          rolling_window: int = DEFAULT_ROLLING_WINDOW) -> Dict[str, Any]:
     """
     Retrieve recent evaluations and calculate performance trends from the generic evaluation table.
     
@@ -32,6 +57,11 @@ def get_evaluation_trends(workflow_type: str = None, target_entity_id: str = Non
     and provide insights into evaluation patterns. Supports filtering by workflow type
     and target entity.
     
+    All statistics are computed in SQL with window functions over the selected window
+    of evaluations, so only aggregates leave the database unless `detailed` is set.
+    The trend is the least-squares slope of the score over the window (in points per
+    evaluation) rather than a comparison of the first and last score.
+    
     Args:
         workflow_type (str, optional): Filter evaluations for specific workflow type.
             If None, returns trends across all workflow types.
@@ -39,6 +69,10 @@ def get_evaluation_trends(workflow_type: str = None, target_entity_id: str = Non
             If None, returns trends across all entities.
         limit (int): Maximum number of recent evaluations to analyze. Default: 10
         db_path (str): Path to SQLite database file. Default: ".db/swiggy_dineout.db"
+        detailed (bool): Also return the evaluation records of the window
+        since (str, optional): Only evaluations created at or after this timestamp
+        until (str, optional): Only evaluations created at or before this timestamp
+        rolling_window (int): Evaluations per rolling average. Default: 5
         
     Returns:
         Dict[str, any]: Comprehensive trend analysis containing:
@@ -49,8 +83,15 @@ def get_evaluation_trends(workflow_type: str = None, target_entity_id: str = Non
             - latest_score (float): Most recent evaluation score
             - trend (str): Overall trend direction ("improving", "declining", "stable")
             - score_range (float): Difference between highest and lowest scores
+            - score_slope (float): Least-squares score change per evaluation
+            - score_std_dev (float): Population standard deviation of the scores
+            - rolling_average (float): Mean of the latest `rolling_window` scores
+            - percentiles (Dict): p25/p50/p75/p90 scores (nearest rank)
+            - dimension_trends (Dict): Average, latest score, slope and trend per rubric
+              dimension (from the indexed rubric score columns, see initialize_db.py)
             - latest_rubric_breakdown (Dict): Score breakdown by rubric dimension from latest evaluation
-            - evaluations (List[Dict]): Full evaluation records
+            - evaluations (List[Dict]): Full evaluation records with their rolling
+              average, newest first (only when detailed)
             
     Raises:
         sqlite3.Error: If database query fails
@@ -86,54 +127,74 @@ def get_evaluation_trends(workflow_type: str = None, target_entity_id: str = Non
             params.append(workflow_type)
         
         if target_entity_id:
-            conditions.append("JSON_EXTRACT(details, '$.target_entity_id') = ?")
+            # Indexed generated column when the table has been migrated (initialize_db.py)
+            if _has_column(conn, "target_entity_id"):
+                conditions.append("target_entity_id = ?")
+            else:
+                conditions.append("JSON_EXTRACT(details, '$.target_entity_id') = ?")
             params.append(target_entity_id)
         
+        if since:
+            conditions.append("created_at >= ?")
+            params.append(since)
+        
+        if until:
+            conditions.append("created_at <= ?")
+            params.append(until)
+        
         where_clause = ""
         if conditions:
             where_clause = "WHERE " + " AND ".join(conditions)
         
+        dimensions = _rubric_score_columns(conn)
+        series_cte = _series_cte(where_clause, dimensions, rolling_window)
+        params.append(limit)
+        
+        dimension_columns = "".join(
+            f""",
+                AVG({column}) AS {column}_average,
+                MAX(CASE WHEN x = n - 1 THEN {column} END) AS {column}_latest,
+                {_slope_sql(column)} AS {column}_slope"""
+            for column in dimensions
+        )
         query = f"""
-            SELECT * FROM evaluations 
-            {where_clause}
-            ORDER BY created_at DESC 
-            LIMIT ?
+            {series_cte}
+            SELECT
+                COUNT(*) AS total_evaluations,
+                AVG(evaluation_score) AS average_score,
+                MAX(evaluation_score) AS highest_score,
+                MIN(evaluation_score) AS lowest_score,
+                AVG(evaluation_score * evaluation_score) - AVG(evaluation_score) * AVG(evaluation_score) AS score_variance,
+                MAX(CASE WHEN x = n - 1 THEN evaluation_score END) AS latest_score,
+                MAX(CASE WHEN x = n - 1 THEN rolling_average END) AS rolling_average,
+                {_slope_sql("evaluation_score")} AS score_slope{_percentile_sql()}{dimension_columns}
+            FROM series
         """
-        params.append(limit)
         
         cursor.execute(query, params)
-        evaluations = [dict(row) for row in cursor.fetchall()]
+        stats = dict(cursor.fetchone())
         
-        if not evaluations:
-            return {
+        if not stats["total_evaluations"]:
+            result = {
                 "message": "No evaluations found",
-                "total_evaluations": 0,
-                "evaluations": []
+                "total_evaluations": 0
             }
-        
-        # Extract scores for trend analysis
-        scores = [eval['evaluation_score'] for eval in evaluations]
-        
-        # Calculate trend
-        trend = "stable"
-        if len(scores) > 1:
-            if scores[0] > scores[-1]:  # Latest vs oldest
-                trend = "improving"
-            elif scores[0] < scores[-1]:
-                trend = "declining"
-        
-        # Calculate score statistics
-        avg_score = round(sum(scores) / len(scores), 2)
-        max_score = max(scores)
-        min_score = min(scores)
+            if detailed:
+                result["evaluations"] = []
+            return result
         
         # Score distribution by rubric dimensions (from latest evaluation)
-        latest_eval = evaluations[0]
+        cursor.execute(f"""
+            SELECT evaluation_rubric FROM evaluations
+            {where_clause}
+            ORDER BY created_at DESC, evaluation_id DESC
+            LIMIT 1
+        """, params[:-1])
         rubric_breakdown = {}
         
         try:
             # Parse the latest evaluation's rubric JSON
-            latest_rubric = json.loads(latest_eval.get('evaluation_rubric', '{}'))
+            latest_rubric = json.loads(cursor.fetchone()['evaluation_rubric'] or '{}')
             for dimension, data in latest_rubric.items():
                 if isinstance(data, dict) and 'score' in data:
                     rubric_breakdown[dimension] = data['score']
@@ -142,17 +203,259 @@ def get_evaluation_trends(workflow_type: str = None, target_entity_id: str = Non
         except json.JSONDecodeError:
             rubric_breakdown = {"error": "Unable to parse rubric data"}
         
-        return {
-            "total_evaluations": len(evaluations),
-            "average_score": avg_score,
-            "highest_score": max_score,
-            "lowest_score": min_score,
-            "latest_score": scores[0],
-            "trend": trend,
-            "score_range": max_score - min_score,
-            "latest_rubric_breakdown": rubric_breakdown,
-            "evaluations": evaluations
+        dimension_trends = {}
+        for column in dimensions:
+            if stats[f"{column}_average"] is None:
+                continue
+            dimension_trends[column[:-len("_score")]] = {
+                "average": _round(stats[f"{column}_average"]),
+                "latest": stats[f"{column}_latest"],
+                "slope": _round(stats[f"{column}_slope"], 4),
+                "trend": _classify_slope(stats[f"{column}_slope"])
+            }
+        
+        result = {
+            "total_evaluations": stats["total_evaluations"],
+            "average_score": _round(stats["average_score"]),
+            "highest_score": stats["highest_score"],
+            "lowest_score": stats["lowest_score"],
+            "latest_score": stats["latest_score"],
+            "trend": _classify_slope(stats["score_slope"]),
+            "score_range": stats["highest_score"] - stats["lowest_score"],
+            "score_slope": _round(stats["score_slope"], 4),
+            "score_std_dev": _round(math.sqrt(max(stats["score_variance"], 0.0))),
+            "rolling_window": rolling_window,
+            "rolling_average": _round(stats["rolling_average"]),
+            "percentiles": {f"p{p}": stats[f"p{p}"] for p in PERCENTILES},
+            "dimension_trends": dimension_trends,
+            "latest_rubric_breakdown": rubric_breakdown
         }
+        
+        if detailed:
+            cursor.execute(f"""
+                {series_cte}
+                SELECT e.*, series.rolling_average
+                FROM series
+                JOIN evaluations e ON e.evaluation_id = series.evaluation_id
+                ORDER BY series.x DESC
+            """, params)
+            result["evaluations"] = [dict(row) for row in cursor.fetchall()]
+        
+        return result
+
+
+def get_evaluation_leaderboard(group_by: str = "target_entity_id", workflow_type: str = None, limit: int = 10,
+                               db_path: str = None, since: str = None, until: str = None,
+                               rank_by: str = "average_score", min_evaluations: int = 1,
+                               top: int = None) -> Dict[str, Any]:
+    """
+    Rank every target entity or workflow type by evaluation quality in one grouped query.
+    
+    Each group's statistics cover its latest `limit` evaluations (the same window
+    get_evaluation_trends uses for a single group), so the leaderboard entry of a
+    group matches its individual trend analysis.
+    
+    Args:
+        group_by (str): "target_entity_id" or "workflow_type"
+        workflow_type (str, optional): Only evaluations of this workflow type
+        limit (int): Recent evaluations analyzed per group. Default: 10
+        db_path (str): Path to SQLite database file. Default: ".db/swiggy_dineout.db"
+        since (str, optional): Only evaluations created at or after this timestamp
+        until (str, optional): Only evaluations created at or before this timestamp
+        rank_by (str): Metric ranked on, highest first (see RANK_BY_METRICS)
+        min_evaluations (int): Skip groups with fewer evaluations in their window
+        top (int, optional): Only return the best `top` groups
+        
+    Returns:
+        Dict[str, any]: group_by, rank_by, total_groups and groups, a ranked list of
+            {rank, <group_by>, total_evaluations, average_score, highest_score,
+            lowest_score, latest_score, score_slope, trend, last_evaluated_at}
+            
+    Raises:
+        ValueError: If group_by or rank_by is not supported
+        sqlite3.Error: If database query fails
+        
+    Example:
+        >>> board = get_evaluation_leaderboard("target_entity_id", rank_by="score_slope", top=10)
+        >>> for entry in board["groups"]:
+        ...     print(entry["rank"], entry["target_entity_id"], entry["trend"])
+    """
+    if group_by not in GROUP_BY_COLUMNS:
+        raise ValueError(f"Unsupported group_by '{group_by}'. Choose from: {', '.join(GROUP_BY_COLUMNS)}")
+    if rank_by not in RANK_BY_METRICS:
+        raise ValueError(f"Unsupported rank_by '{rank_by}'. Choose from: {', '.join(RANK_BY_METRICS)}")
+    
+    # Use default path if none provided
+    if db_path is None:
+        db_path = str(DEFAULT_DB_PATH)
+    
+    with sqlite3.connect(db_path) as conn:
+        conn.row_factory = sqlite3.Row
+        cursor = conn.cursor()
+        
+        group_expression = group_by
+        if group_by == "target_entity_id" and not _has_column(conn, "target_entity_id"):
+            group_expression = "JSON_EXTRACT(details, '$.target_entity_id')"
+        
+        conditions = [f"{group_expression} IS NOT NULL"]
+        params = []
+        
+        if workflow_type:
+            conditions.append("workflow_type = ?")
+            params.append(workflow_type)
+        
+        if since:
+            conditions.append("created_at >= ?")
+            params.append(since)
+        
+        if until:
+            conditions.append("created_at <= ?")
+            params.append(until)
+        
+        params.extend([limit, min_evaluations])
+        
+        query = f"""
+            WITH recent AS (
+                SELECT
+                    {group_expression} AS group_key,
+                    evaluation_score,
+                    created_at,
+                    ROW_NUMBER() OVER (
+                        PARTITION BY {group_expression}
+                        ORDER BY created_at DESC, evaluation_id DESC
+                    ) AS recency
+                FROM evaluations
+                WHERE {" AND ".join(conditions)}
+            ),
+            series AS (
+                SELECT recent.*, COUNT(*) OVER (PARTITION BY group_key) - recency AS x
+                FROM recent
+                WHERE recency <= ?
+            ),
+            groups AS (
+                SELECT
+                    group_key,
+                    COUNT(*) AS total_evaluations,
+                    AVG(evaluation_score) AS average_score,
+                    MAX(evaluation_score) AS highest_score,
+                    MIN(evaluation_score) AS lowest_score,
+                    MAX(CASE WHEN recency = 1 THEN evaluation_score END) AS latest_score,
+                    MAX(created_at) AS last_evaluated_at,
+                    {_slope_sql("evaluation_score")} AS score_slope
+                FROM series
+                GROUP BY group_key
+                HAVING COUNT(*) >= ?
+            )
+            SELECT RANK() OVER (ORDER BY {rank_by} DESC) AS rank, groups.*
+            FROM groups
+            ORDER BY rank, group_key
+        """
+        
+        cursor.execute(query, params)
+        rows = cursor.fetchall()
+    
+    entries = []
+    for row in rows[:top] if top else rows:
+        entries.append({
+            "rank": row["rank"],
+            group_by: row["group_key"],
+            "total_evaluations": row["total_evaluations"],
+            "average_score": _round(row["average_score"]),
+            "highest_score": row["highest_score"],
+            "lowest_score": row["lowest_score"],
+            "latest_score": row["latest_score"],
+            "score_slope": _round(row["score_slope"], 4),
+            "trend": _classify_slope(row["score_slope"]),
+            "last_evaluated_at": row["last_evaluated_at"]
+        })
+    
+    return {
+        "group_by": group_by,
+        "rank_by": rank_by,
+        "total_groups": len(rows),
+        "groups": entries
+    }
+
+
+def _print_leaderboard(leaderboard: Dict[str, Any]) -> None:
+    """Print a leaderboard as a ranked table."""
+    group_by = leaderboard["group_by"]
+    print(f"🏆 EVALUATION LEADERBOARD BY {group_by.upper()}")
+    print("=" * 90)
+    print(f"Ranked by {leaderboard['rank_by']} ({len(leaderboard['groups'])} of {leaderboard['total_groups']} groups)")
+    print(f"{'RANK':<6}{group_by.upper():<24}{'EVALS':>6}{'AVG':>9}{'LATEST':>9}{'SLOPE':>10}  TREND")
+    print("-" * 90)
+    for entry in leaderboard["groups"]:
+        latest = "-" if entry["latest_score"] is None else f"{entry['latest_score']:.2f}"
+        slope = "-" if entry["score_slope"] is None else f"{entry['score_slope']:+.4f}"
+        print(f"{entry['rank']:<6}{str(entry[group_by]):<24}{entry['total_evaluations']:>6}"
+              f"{entry['average_score']:>9.2f}{latest:>9}{slope:>10}  {entry['trend']}")
+
+
+def _series_cte(where_clause: str, dimensions: List[str], rolling_window: int) -> str:
+    """
+    CTE `series`: the latest LIMIT ? matching evaluations in chronological order,
+    with x (0 = oldest), n, score_rank and rolling_average window columns.
+    """
+    dimension_columns = "".join(f", {column}" for column in dimensions)
+    return f"""
+        WITH windowed AS (
+            SELECT evaluation_id, evaluation_score, created_at{dimension_columns}
+            FROM evaluations
+            {where_clause}
+            ORDER BY created_at DESC, evaluation_id DESC
+            LIMIT ?
+        ),
+        series AS (
+            SELECT
+                windowed.*,
+                ROW_NUMBER() OVER (ORDER BY created_at, evaluation_id) - 1 AS x,
+                COUNT(*) OVER () AS n,
+                ROW_NUMBER() OVER (ORDER BY evaluation_score) AS score_rank,
+                AVG(evaluation_score) OVER (
+                    ORDER BY created_at, evaluation_id
+                    ROWS BETWEEN {max(int(rolling_window), 1) - 1} PRECEDING AND CURRENT ROW
+                ) AS rolling_average
+            FROM windowed
+        )"""
+
+
+def _slope_sql(value: str, x: str = "x") -> str:
+    """Least-squares slope of `value` over `x` as an aggregate expression (rows with NULL values are skipped)"""
+    present_x = f"CASE WHEN {value} IS NOT NULL THEN {x} END"
+    return (f"(COUNT({value}) * SUM({x} * {value}) - SUM({present_x}) * SUM({value})) "
+            f"/ NULLIF(COUNT({value}) * SUM({present_x} * {present_x}) - SUM({present_x}) * SUM({present_x}), 0.0)")
+
+
+def _percentile_sql() -> str:
+    """Nearest-rank score percentiles over the score_rank/n window columns"""
+    return "".join(
+        f",\n                MIN(CASE WHEN score_rank * 100 >= {p} * n THEN evaluation_score END) AS p{p}"
+        for p in PERCENTILES
+    )
+
+
+def _rubric_score_columns(conn: sqlite3.Connection) -> List[str]:
+    """Generated rubric dimension score columns of the evaluations table (empty before migration)"""
+    return [
+        row[1] for row in conn.execute("PRAGMA table_xinfo(evaluations)")
+        if row[6] in GENERATED_COLUMN_HIDDEN and row[1].endswith("_score") and row[1] != "overall_weighted_score"
+    ]
+
+
+def _classify_slope(slope: float) -> str:
+    if slope is None or abs(slope) < STABLE_SLOPE_THRESHOLD:
+        return "stable"
+    return "improving" if slope > 0 else "declining"
+
+
+def _round(value: float, digits: int = 2) -> float:
+    return None if value is None else round(value, digits)
+
+
+def _has_column(conn: sqlite3.Connection, column: str) -> bool:
+    """Whether the evaluations table has a column (generated columns included)"""
+    return any(row[1] == column for row in conn.execute("PRAGMA table_xinfo(evaluations)"))
 
 
 if __name__ == "__main__":
@@ -162,13 +465,48 @@ if __name__ == "__main__":
     parser.add_argument("--target-entity-id", help="Filter by target entity ID (e.g., R001)")
     parser.add_argument("--limit", type=int, default=10, help="Number of recent evaluations to analyze (default: 10)")
     parser.add_argument("--db-path", default=str(DEFAULT_DB_PATH), help="Database file path")
+    parser.add_argument("--since", help="Only evaluations created at or after this timestamp (e.g. 2025-01-01)")
+    parser.add_argument("--until", help="Only evaluations created at or before this timestamp")
+    parser.add_argument("--rolling-window", type=int, default=DEFAULT_ROLLING_WINDOW,
+                        help=f"Evaluations per rolling average (default: {DEFAULT_ROLLING_WINDOW})")
     parser.add_argument("--detailed", action="store_true", help="Show detailed evaluation records")
     parser.add_argument("--json", action="store_true", help="Output results in JSON format")
     
+    # Leaderboard mode
+    parser.add_argument("--group-by", choices=GROUP_BY_COLUMNS,
+                        help="Rank every group by evaluation quality (--limit applies per group)")
+    parser.add_argument("--rank-by", choices=RANK_BY_METRICS, default="average_score",
+                        help="Leaderboard ranking metric, highest first (default: average_score)")
+    parser.add_argument("--min-evaluations", type=int, default=1,
+                        help="Leaderboard: skip groups with fewer evaluations (default: 1)")
+    parser.add_argument("--top", type=int, help="Leaderboard: only show the best N groups")
+    
     args = parser.parse_args()
     
+    if args.limit < 1 or args.rolling_window < 1:
+        parser.error("--limit and --rolling-window must be at least 1")
+    if args.group_by and (args.detailed or args.target_entity_id):
+        parser.error("--group-by cannot be combined with --detailed or --target-entity-id")
+    
+    if args.group_by:
+        try:
+            leaderboard = get_evaluation_leaderboard(args.group_by, args.workflow_type, args.limit, args.db_path,
+                                                     args.since, args.until, args.rank_by, args.min_evaluations,
+                                                     args.top)
+            if args.json:
+                print(json.dumps(leaderboard, indent=2))
+            elif not leaderboard["groups"]:
+                print("📭 No evaluations found")
+            else:
+                _print_leaderboard(leaderboard)
+        except Exception as e:
+            print(f"❌ Error building leaderboard: {str(e)}")
+            exit(1)
+        exit(0)
+    
     try:
-        trends = get_evaluation_trends(args.workflow_type, args.target_entity_id, args.limit, args.db_path)
+        trends = get_evaluation_trends(args.workflow_type, args.target_entity_id, args.limit, args.db_path,
+                                       args.detailed, args.since, args.until, args.rolling_window)
         
         if args.json:
             # Output as JSON
@@ -194,7 +532,11 @@ if __name__ == "__main__":
             print(f"🏆 Highest score: {trends['highest_score']}")
             print(f"📉 Lowest score: {trends['lowest_score']}")
             print(f"📏 Score range: {trends['score_range']}")
-            print(f"📈 Trend: {trends['trend'].upper()}")
+            print(f"📐 Std deviation: {trends['score_std_dev']}")
+            print(f"🔁 Rolling average (last {trends['rolling_window']}): {trends['rolling_average']}")
+            percentiles = trends['percentiles']
+            print(f"📊 Percentiles: " + ", ".join(f"{name.upper()} {value}" for name, value in percentiles.items()))
+            print(f"📈 Trend: {trends['trend'].upper()} (slope {trends['score_slope']:+} per evaluation)")
             
             print("\n🎯 LATEST RUBRIC BREAKDOWN")
             print("-" * 30)
@@ -205,11 +547,19 @@ if __name__ == "__main__":
             else:
                 print("  No rubric data available")
             
+            if trends['dimension_trends']:
+                print("\n📈 RUBRIC DIMENSION TRENDS")
+                print("-" * 30)
+                for dimension, dimension_trend in trends['dimension_trends'].items():
+                    print(f"  {dimension.replace('_', ' ').title()}: avg {dimension_trend['average']} | "
+                          f"latest {dimension_trend['latest']} | {dimension_trend['trend']} "
+                          f"({dimension_trend['slope']:+} per evaluation)")
+            
             if args.detailed:
                 print(f"\n📋 DETAILED RECORDS (latest {args.limit})")
                 print("-" * 50)
-                for i, eval_record in enumerate(trends['evaluations'][:5], 1):
-                    print(f"{i}. ID: {eval_record['evaluation_id']} | Score: {eval_record['evaluation_score']} | Session: {eval_record['session_id']} | Workflow: {eval_record['workflow_type']}")
+                for i, eval_record in enumerate(trends['evaluations'], 1):
+                    print(f"{i}. ID: {eval_record['evaluation_id']} | Score: {eval_record['evaluation_score']} | Rolling avg: {round(eval_record['rolling_average'], 2)} | Session: {eval_record['session_id']} | Workflow: {eval_record['workflow_type']}")
         
     except Exception as e:
         print(f"❌ Error analyzing trends: {str(e)}")
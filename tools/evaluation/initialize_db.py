@@ -6,21 +6,53 @@ Creates the evaluation database schema for storing evaluation scores and metadat
 This tool sets up the necessary tables for the evaluation system with a generic,
 scalable design that supports any rubric dimensions.
 
+Hot JSON paths (target entity, restaurant, rubric dimension scores) are exposed as
+indexed virtual generated columns, so per-entity lookups are index seeks instead of
+parsing every row's JSON. Existing databases are migrated in place.
+
 Usage:
     uv run tools/evaluation/initialize_db.py [--db-path PATH]
 
 Author: Swiggy Dineout Challenge
-Version: 2.0
+Version: 2.1
 """
 
 import sqlite3
 import argparse
 from pathlib import Path
+from typing import List
 
 # Project root and default database path
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 DEFAULT_DB_PATH = PROJECT_ROOT / ".db" / "swiggy_dineout.db"
 
+# Rubric dimensions of the restaurant-analysis evaluation (see prompts/evaluation/evaluate-solution.md)
+RUBRIC_DIMENSIONS = ["data_accuracy", "insight_quality", "completeness", "confidence_calibration"]
+
+
+def _rubric_score_expression(dimension: str) -> str:
+    """A dimension's score, stored either as {"score": x, "weight": w} or as a bare number"""
+    path = f"$.{dimension}"
+    return (f"COALESCE(json_extract(evaluation_rubric, '{path}.score'), "
+            f"CASE WHEN json_type(evaluation_rubric, '{path}') IN ('integer', 'real') "
+            f"THEN json_extract(evaluation_rubric, '{path}') END)")
+
+
+# Virtual generated columns over the JSON fields: column -> (type, expression)
+GENERATED_COLUMNS = {
+    "target_entity_id": ("TEXT", "json_extract(details, '$.target_entity_id')"),
+    "restaurant_id": ("TEXT", "COALESCE(json_extract(details, '$.restaurant_id'), json_extract(details, '$.target_entity_id'))"),
+    **{f"{dimension}_score": ("REAL", _rubric_score_expression(dimension)) for dimension in RUBRIC_DIMENSIONS},
+    "overall_weighted_score": ("REAL", "json_extract(evaluation_rubric, '$.overall_weighted_score')")
+}
+
+# Indexes on the generated columns: name -> columns
+GENERATED_COLUMN_INDEXES = {
+    "idx_evaluations_target_entity": "target_entity_id, created_at",
+    "idx_evaluations_restaurant": "restaurant_id, created_at",
+    "idx_evaluations_workflow_target": "workflow_type, target_entity_id, created_at"
+}
+
 
 def initialize_tables(db_path: str = None):
     """
@@ -33,8 +65,10 @@ def initialize_tables(db_path: str = None):
     - evaluation_score (final numeric score)
     - evaluation_rubric (JSON with all rubric dimensions and scores)
     - details (JSON with all use-case specific data)
+    - virtual generated columns for hot JSON paths (see GENERATED_COLUMNS)
     
-    This function is idempotent and safe to call multiple times.
+    This function is idempotent and safe to call multiple times; on a database
+    created before the generated columns existed it adds them and their indexes.
     
     Args:
         db_path (str): Path to SQLite database file. Defaults to project .db/swiggy_dineout.db
@@ -86,9 +120,39 @@ def initialize_tables(db_path: str = None):
             ON evaluations(created_at)
         """)
         
+        migrate_generated_columns(conn)
+        
         conn.commit()
 
 
+def migrate_generated_columns(conn: sqlite3.Connection) -> List[str]:
+    """
+    Add any missing JSON generated columns to the evaluations table and index them.
+    
+    The columns are VIRTUAL, so ALTER TABLE adds them without rewriting existing
+    rows; building the indexes computes the values once per row.
+    
+    Args:
+        conn (sqlite3.Connection): Open connection to the evaluation database
+        
+    Returns:
+        List[str]: Names of the columns that were added
+    """
+    # table_xinfo (unlike table_info) also lists generated columns
+    existing = {row[1] for row in conn.execute("PRAGMA table_xinfo(evaluations)")}
+    
+    added = []
+    for column, (column_type, expression) in GENERATED_COLUMNS.items():
+        if column not in existing:
+            conn.execute(f"ALTER TABLE evaluations ADD COLUMN {column} {column_type} GENERATED ALWAYS AS ({expression}) VIRTUAL")
+            added.append(column)
+    
+    for index_name, columns in GENERATED_COLUMN_INDEXES.items():
+        conn.execute(f"CREATE INDEX IF NOT EXISTS {index_name} ON evaluations({columns})")
+    
+    return added
+
+
 if __name__ == "__main__":
     """Command-line interface for database initialization."""
     parser = argparse.ArgumentParser(description="Initialize evaluation database tables with generic, scalable schema")
@@ -112,6 +176,7 @@ if __name__ == "__main__":
         print("   • evaluations (generic evaluation storage)")
         print("     - evaluation_id, session_id, workflow_type")
         print("     - evaluation_score, evaluation_rubric (JSON), details (JSON)")
+        print(f"     - generated from JSON: {', '.join(GENERATED_COLUMNS)}")
         print("🔍 Indexes created for performance optimization")
         
     except Exception as e:
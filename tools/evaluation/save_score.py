@@ -5,23 +5,33 @@ Evaluation Score Saving Tool
 Saves evaluation scores and metadata to the generic evaluation database. This tool handles 
 the insertion of evaluation records with flexible rubric dimensions and use-case specific details.
 
+Many records can be ingested at once from JSONL (a file or stdin): they are upserted on
+(session_id, workflow_type, created_at) in a single transaction over one connection.
+Bulk records must carry created_at, so re-ingesting a file is idempotent.
+
 Usage:
     uv run tools/evaluation/save_score.py --session-id SESSION --workflow-type TYPE --score SCORE [options]
+    uv run tools/evaluation/save_score.py --from-jsonl scores.jsonl
+    cat scores.jsonl | uv run tools/evaluation/save_score.py --from-jsonl -
 
 Author: Swiggy Dineout Challenge
-Version: 2.0
+Version: 2.1
 """
 
 import sqlite3
 import json
+import sys
 import argparse
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Iterable, Iterator, List, Tuple
 
 # Project root and default database path
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 DEFAULT_DB_PATH = PROJECT_ROOT / ".db" / "swiggy_dineout.db"
 
+# Records sent to SQLite per executemany call during bulk ingestion
+DEFAULT_BATCH_SIZE = 500
+
 
 def insert_evaluation_record(
     session_id: str,
@@ -115,14 +125,140 @@ def insert_evaluation_record(
         return evaluation_id
 
 
+def insert_evaluation_records(
+    records: Iterable[Dict[str, Any]],
+    db_path: str = None,
+    batch_size: int = DEFAULT_BATCH_SIZE
+) -> int:
+    """
+    Upsert many evaluation records in one transaction over a single connection.
+    
+    Records are keyed on (session_id, workflow_type, created_at): re-ingesting a
+    record with the same key updates its score, rubric and details instead of
+    adding a duplicate, so re-scoring runs are idempotent. created_at is therefore
+    required (e.g. "2025-01-15 10:30:00", the column's CURRENT_TIMESTAMP format),
+    and a key may appear only once per call. The iterable is consumed in chunks of `batch_size`, so a stream of any length
+    is ingested in bounded memory; any invalid record rolls the whole batch back.
+    
+    Args:
+        records (Iterable[Dict[str, Any]]): Records with session_id, workflow_type,
+            evaluation_score (or score), created_at and optional evaluation_rubric
+            (or rubric) and details
+        db_path (str, optional): Path to SQLite database file
+        batch_size (int): Records per executemany call
+        
+    Returns:
+        int: Number of records upserted
+        
+    Raises:
+        ValueError: If a record is missing a required field or repeats another record's key
+        sqlite3.Error: If database insertion fails
+        
+    Example:
+        >>> count = insert_evaluation_records([
+        ...     {'session_id': 'acad9e9a', 'workflow_type': 'restaurant-analysis',
+        ...      'evaluation_score': 81.0, 'created_at': '2025-01-15 10:30:00',
+        ...      'details': {'target_entity_id': 'R001'}},
+        ...     {'session_id': 'b7e1f2c3', 'workflow_type': 'restaurant-analysis',
+        ...      'score': 74.5, 'created_at': '2025-01-15 11:05:00', 'rubric': {'data_accuracy': {'score': 70.0, 'weight': 0.35}}}
+        ... ])
+        >>> print(f"Upserted {count} evaluations")
+    """
+    # Use default path if none provided
+    if db_path is None:
+        db_path = str(DEFAULT_DB_PATH)
+    
+    conn = sqlite3.connect(db_path)
+    count = 0
+    seen_keys = {}
+    try:
+        with conn:
+            for chunk in _chunks((_evaluation_row(record, index, seen_keys) for index, record in enumerate(records, 1)), batch_size):
+                conn.executemany("""
+                    INSERT INTO evaluations (
+                        session_id, workflow_type, evaluation_score,
+                        evaluation_rubric, details, created_at
+                    ) VALUES (?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(session_id, workflow_type, created_at) DO UPDATE SET
+                        evaluation_score = excluded.evaluation_score,
+                        evaluation_rubric = excluded.evaluation_rubric,
+                        details = excluded.details
+                """, chunk)
+                count += len(chunk)
+    finally:
+        conn.close()
+    return count
+
+
+def read_jsonl_records(stream) -> Iterator[Dict[str, Any]]:
+    """
+    Yield one evaluation record per non-blank line of a JSONL stream.
+    
+    Raises:
+        ValueError: If a line is not a JSON object (with its line number)
+    """
+    for line_number, line in enumerate(stream, 1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as e:
+            raise ValueError(f"line {line_number}: invalid JSON ({e})")
+        if not isinstance(record, dict):
+            raise ValueError(f"line {line_number}: expected a JSON object")
+        yield record
+
+
+def _evaluation_row(record: Dict[str, Any], index: int, seen_keys: Dict[Tuple, int]) -> Tuple:
+    """Validate a bulk record and convert it to an evaluations row, rejecting keys already in seen_keys"""
+    score = record.get("evaluation_score", record.get("score"))
+    created_at = record.get("created_at")
+    missing = [field for field, value in (("session_id", record.get("session_id")),
+                                          ("workflow_type", record.get("workflow_type")),
+                                          ("evaluation_score", score),
+                                          ("created_at", created_at or None)) if value is None]
+    if missing:
+        raise ValueError(f"record {index}: missing {', '.join(missing)}")
+    
+    key = (record["session_id"], record["workflow_type"], created_at)
+    if key in seen_keys:
+        raise ValueError(f"record {index}: same session_id, workflow_type and created_at as record {seen_keys[key]}")
+    seen_keys[key] = index
+    return (
+        record["session_id"],
+        record["workflow_type"],
+        float(score),
+        json.dumps(record.get("evaluation_rubric", record.get("rubric")) or {}),
+        json.dumps(record.get("details") or {}),
+        created_at
+    )
+
+
+def _chunks(rows: Iterable[Tuple], size: int) -> Iterator[List[Tuple]]:
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
 if __name__ == "__main__":
     """Command-line interface for saving evaluation scores."""
     parser = argparse.ArgumentParser(description="Save evaluation score to generic evaluation database")
-    parser.add_argument("--session-id", required=True, help="Session identifier")
-    parser.add_argument("--workflow-type", required=True, help="Workflow type (e.g., restaurant-analysis, code-review)")
-    parser.add_argument("--score", type=float, required=True, help="Overall evaluation score (0-100)")
+    parser.add_argument("--session-id", help="Session identifier (required unless --from-jsonl)")
+    parser.add_argument("--workflow-type", help="Workflow type (e.g., restaurant-analysis, code-review) (required unless --from-jsonl)")
+    parser.add_argument("--score", type=float, help="Overall evaluation score (0-100) (required unless --from-jsonl)")
     parser.add_argument("--db-path", default=str(DEFAULT_DB_PATH), help="Database file path")
     
+    # Bulk ingestion
+    parser.add_argument("--from-jsonl", metavar="PATH",
+                        help="Upsert one evaluation per line from a JSONL file ('-' reads stdin)")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE,
+                        help=f"Records per insert batch with --from-jsonl (default: {DEFAULT_BATCH_SIZE})")
+    
     # Generic fields (optional)
     parser.add_argument("--rubric-json", help="JSON string containing rubric structure")
     parser.add_argument("--details-json", help="JSON string containing details/metadata")
@@ -131,6 +267,31 @@ if __name__ == "__main__":
     
     args = parser.parse_args()
     
+    if args.from_jsonl:
+        if args.session_id or args.workflow_type or args.score is not None:
+            parser.error("--from-jsonl cannot be combined with --session-id, --workflow-type or --score")
+        if args.batch_size < 1:
+            parser.error("--batch-size must be at least 1")
+        
+        try:
+            if args.from_jsonl == "-":
+                count = insert_evaluation_records(read_jsonl_records(sys.stdin), args.db_path, args.batch_size)
+            else:
+                with open(args.from_jsonl, "r") as f:
+                    count = insert_evaluation_records(read_jsonl_records(f), args.db_path, args.batch_size)
+            
+            print(f"✅ Upserted {count} evaluation records")
+            print(f"📁 Source: {'stdin' if args.from_jsonl == '-' else args.from_jsonl}")
+        except Exception as e:
+            print(f"❌ Error ingesting evaluations (nothing was saved): {str(e)}")
+            exit(1)
+        exit(0)
+    
+    missing = [flag for flag, value in (("--session-id", args.session_id), ("--workflow-type", args.workflow_type),
+                                        ("--score", args.score)) if value is None]
+    if missing:
+        parser.error(f"the following arguments are required: {', '.join(missing)}")
+    
     try:
         # Parse rubric JSON if provided, otherwise empty
         evaluation_rubric = {}
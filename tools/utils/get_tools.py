@@ -2,22 +2,71 @@
 """
 CLI Tool Discovery Utility
 
-Discovers and documents CLI tools by executing them with --help flag.
-Provides information about available tools and their command-line interfaces.
+Discovers and documents CLI tools and their command-line interfaces.
+
+By default tools are inspected statically: an AST pass reads the module docstring and
+the argparse.ArgumentParser / add_argument calls without running any tool code. The
+probe mode instead executes each tool with --help in a subprocess.
+
+Inspections run concurrently, and their results are cached per tool file (keyed by
+path, mtime and content hash), so only new or changed tools are inspected again.
+
+Every run also maintains a machine-readable tool manifest (name, category, path,
+argument schema, description, content hash, last inspection time) as JSON or as a
+SQLite table, which --search/--category/--json query without rescanning the tree.
 """
 
+import ast
+import hashlib
+import json
+import operator
 import os
+import sqlite3
 import subprocess
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path, PurePath, PurePosixPath
 from typing import Dict, List, Optional, Any
 
+# Cache of inspection results, relative to the working directory
+DEFAULT_CACHE_PATH = ".cache/tool_discovery.json"
+CACHE_VERSION = 3
+
+# Concurrent help probes (each one is a `uv run` subprocess)
+DEFAULT_PROBE_WORKERS = min(8, (os.cpu_count() or 1) * 2)
+
+# "static" reads argparse definitions from the AST; "probe" runs the tool with --help
+DISCOVERY_MODES = ("static", "probe")
+
+# Tool manifest: JSON by default, a SQLite table for .db/.sqlite/.sqlite3 paths
+DEFAULT_MANIFEST_PATH = ".cache/tool_manifest.json"
+MANIFEST_VERSION = 2
+SQLITE_MANIFEST_SUFFIXES = (".db", ".sqlite", ".sqlite3")
 
-def discover_cli_tools(tools_dir: str = "tools") -> Dict[str, Dict[str, Any]]:
+# add_argument keywords recorded in the argument schema
+ARGUMENT_KEYWORDS = ("help", "type", "default", "required", "choices", "action", "nargs", "metavar", "dest")
+
+# What the static pass may evaluate when resolving module-level constants such as
+# DEFAULT_DB_PATH = PROJECT_ROOT / ".db" / "swiggy_dineout.db"; anything else is unresolved
+STATIC_CALLS = {"str": str, "int": int, "float": float, "min": min, "max": max, "round": round, "Path": PurePosixPath}
+STATIC_OPERATORS = {ast.Add: operator.add, ast.Sub: operator.sub, ast.Mult: operator.mul,
+                    ast.Div: operator.truediv, ast.FloorDiv: operator.floordiv, ast.Mod: operator.mod}
+STATIC_PATH_ATTRIBUTES = ("parent", "name", "stem", "suffix")
+
+
+def discover_cli_tools(tools_dir: str = "tools", cache_path: Optional[str] = DEFAULT_CACHE_PATH,
+                       max_workers: int = DEFAULT_PROBE_WORKERS, mode: str = "static") -> Dict[str, Dict[str, Any]]:
     """
     Discover all Python CLI tools in the tools directory and extract their help documentation.
     
+    Tools whose path, mtime and content hash match the cache are served from it; the
+    rest are inspected concurrently on a pool of `max_workers` threads.
+    
     Args:
         tools_dir: Path to the tools directory (default: "tools")
+        cache_path: JSON cache of inspection results (None disables caching)
+        max_workers: Maximum number of concurrent inspections
+        mode: "static" (AST introspection, no code runs) or "probe" (run with --help)
         
     Returns:
         Dictionary mapping tool names to their CLI documentation and metadata
@@ -27,51 +76,661 @@ def discover_cli_tools(tools_dir: str = "tools") -> Dict[str, Dict[str, Any]]:
         for tool_name, tool_info in tools.items():
             print(f"{tool_name}: {tool_info['description']}")
     """
-    tools_info = {}
     tools_path = Path(tools_dir)
     
     if not tools_path.exists():
         return {"error": f"Tools directory '{tools_dir}' not found"}
     
-    # Walk through tools directory
+    entries = _discover_entries(tools_path, cache_path, max_workers, mode)
+    return {entry["tool_info"]["name"]: entry["tool_info"] for entry in entries.values()}
+
+
+def _discover_entries(tools_path: Path, cache_path: Optional[str], max_workers: int,
+                      mode: str) -> Dict[str, Dict[str, Any]]:
+    """Cache entries for every tool under tools_path, keyed by relative path, inspecting only stale ones"""
+    if mode not in DISCOVERY_MODES:
+        raise ValueError(f"Unknown discovery mode '{mode}'. Choose from: {', '.join(DISCOVERY_MODES)}")
+    
+    cache = _load_cache(cache_path) if cache_path else {}
+    entries = {}
+    stale = []
+    
+    for file_path in _iter_tool_files(tools_path):
+        try:
+            relative_path = str(file_path.relative_to(Path.cwd()))
+        except ValueError:
+            # If relative_to fails, use the path as-is
+            relative_path = str(file_path)
+        
+        entry = _cached_entry(file_path, cache.get(relative_path), mode)
+        if entry:
+            entries[relative_path] = entry
+        else:
+            entries[relative_path] = None
+            stale.append((file_path, relative_path))
+    
+    # Probes are subprocess-bound, so threads are enough to overlap them
+    if stale:
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            inspected = executor.map(lambda item: _inspect_tool(*item, mode), stale)
+            for (file_path, relative_path), entry in zip(stale, inspected):
+                entries[relative_path] = entry
+    
+    # Rewrite the cache only when something was probed or removed
+    if cache_path and (stale or set(cache) != set(entries)):
+        _save_cache(cache_path, entries)
+    
+    return entries
+
+
+def _iter_tool_files(tools_path: Path):
+    """Yield every Python tool file under the tools directory"""
     for root, dirs, files in os.walk(tools_path):
         for file in files:
             if file.endswith('.py') and file != '__init__.py':
-                file_path = Path(root) / file
-                tool_name = file_path.stem
-                try:
-                    relative_path = str(file_path.relative_to(Path.cwd()))
-                except ValueError:
-                    # If relative_to fails, use the path as-is
-                    relative_path = str(file_path)
-                
-                # Try to get help documentation
-                help_output = get_tool_help(relative_path)
-                
-                # Extract basic file info
+                yield Path(root) / file
+
+
+def _file_sha256(file_path: Path) -> str:
+    with open(file_path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def _cached_entry(file_path: Path, entry: Optional[Dict[str, Any]], mode: str) -> Optional[Dict[str, Any]]:
+    """
+    Return the cache entry if it still describes the file in this mode, else None.
+    
+    An unchanged mtime and size is trusted without reading the file; otherwise the
+    content hash decides, so a touched but unmodified tool is not inspected again.
+    """
+    if not entry or entry.get("mode") != mode:
+        return None
+    
+    stat = file_path.stat()
+    if entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+        return entry
+    if entry["sha256"] == _file_sha256(file_path):
+        return {**entry, "mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+    return None
+
+
+def _inspect_tool(file_path: Path, relative_path: str, mode: str = "static") -> Dict[str, Any]:
+    """Inspect one tool (statically or by probing its --help) and build its cache entry"""
+    stat = file_path.stat()
+    sha256 = _file_sha256(file_path)
+    
+    # Extract the docstring and argparse schema without running the tool
+    try:
+        with open(file_path, 'r') as f:
+            lines = f.readlines()
+        
+        description = extract_module_docstring(lines)
+        cli_spec = extract_cli_spec(''.join(lines), relative_path)
+        
+    except Exception as e:
+        description = f"Error reading file: {str(e)}"
+        cli_spec = None
+    
+    if mode == "probe":
+        # Try to get help documentation
+        help_output = get_tool_help(relative_path)
+    elif cli_spec:
+        help_output = {
+            "success": True,
+            "help_text": format_static_help(cli_spec, relative_path),
+            "error": None
+        }
+    else:
+        help_output = {
+            "success": False,
+            "help_text": "",
+            "error": "No argparse parser found"
+        }
+    
+    tool_info = {
+        "name": file_path.stem,
+        "path": str(file_path),
+        "relative_path": relative_path,
+        "description": description,
+        "cli": cli_spec,
+        "help_output": help_output,
+        "executable": help_output.get("success", False),
+        "usage_command": f"uv run {relative_path}"
+    }
+    
+    return {
+        "mode": mode,
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "sha256": sha256,
+        "probed_at": datetime.now().isoformat(),
+        "tool_info": tool_info
+    }
+
+
+class _Unresolved(Exception):
+    """An expression the static pass cannot evaluate"""
+
+
+def _static_value(node: ast.AST, constants: Dict[str, Any]) -> Any:
+    """
+    Evaluate literals, known constants, arithmetic, f-strings, path attributes and the
+    STATIC_CALLS builtins; raise _Unresolved for anything else.
+    """
+    if isinstance(node, ast.Constant):
+        return node.value
+    if isinstance(node, ast.Name):
+        if node.id not in constants:
+            raise _Unresolved(node.id)
+        return constants[node.id]
+    if isinstance(node, (ast.Tuple, ast.List)):
+        values = [_static_value(element, constants) for element in node.elts]
+        return tuple(values) if isinstance(node, ast.Tuple) else values
+    if isinstance(node, ast.Dict) and None not in node.keys:
+        return {_static_value(key, constants): _static_value(value, constants) for key, value in zip(node.keys, node.values)}
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub):
+        return -_static_value(node.operand, constants)
+    if isinstance(node, ast.BinOp) and type(node.op) in STATIC_OPERATORS:
+        return STATIC_OPERATORS[type(node.op)](_static_value(node.left, constants), _static_value(node.right, constants))
+    if isinstance(node, ast.Attribute) and node.attr in STATIC_PATH_ATTRIBUTES:
+        value = _static_value(node.value, constants)
+        if isinstance(value, PurePath):
+            return getattr(value, node.attr)
+    if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id in STATIC_CALLS and not node.keywords:
+        return STATIC_CALLS[node.func.id](*[_static_value(arg, constants) for arg in node.args])
+    if isinstance(node, ast.JoinedStr):
+        return ''.join(_static_value(value, constants) if isinstance(value, ast.Constant) else _format_static(value, constants)
+                       for value in node.values)
+    raise _Unresolved(ast.unparse(node))
+
+
+def _format_static(node: ast.FormattedValue, constants: Dict[str, Any]) -> str:
+    """One interpolated f-string field, honouring !s/!r/!a and the format spec"""
+    value = _static_value(node.value, constants)
+    if node.conversion == ord("r"):
+        value = repr(value)
+    elif node.conversion == ord("a"):
+        value = ascii(value)
+    elif node.conversion == ord("s"):
+        value = str(value)
+    spec = _static_value(node.format_spec, constants) if node.format_spec else ""
+    return format(value, spec)
+
+
+def _resolve(node: ast.AST, constants: Dict[str, Any]) -> Any:
+    """
+    JSON-compatible value of an expression, with paths as strings.
+    
+    Raises:
+        _Unresolved: If the expression cannot be evaluated statically
+    """
+    try:
+        value = _static_value(node, constants)
+        if isinstance(value, PurePath):
+            value = str(value)
+        json.dumps(value)
+    except (TypeError, ValueError, ArithmeticError, MemoryError, RecursionError) as e:
+        raise _Unresolved(str(e))
+    return value
+
+
+def module_constants(tree: ast.Module, tool_path: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Top-level assignments the static pass can evaluate, in definition order.
+    
+    __file__ is the tool's path as given (e.g. relative to the project root), so
+    PROJECT_ROOT-based defaults render as project-relative paths.
+    """
+    constants = {"__file__": tool_path} if tool_path else {}
+    for statement in tree.body:
+        if isinstance(statement, ast.Assign):
+            targets, value = statement.targets, statement.value
+        elif isinstance(statement, ast.AnnAssign) and statement.value is not None:
+            targets, value = [statement.target], statement.value
+        else:
+            continue
+        names = [target.id for target in targets if isinstance(target, ast.Name)]
+        try:
+            resolved = _static_value(value, constants)
+        except (_Unresolved, TypeError, ValueError, ArithmeticError, MemoryError, RecursionError):
+            # A name that cannot be resolved must not keep an earlier value
+            for name in names:
+                constants.pop(name, None)
+            continue
+        constants.update({name: resolved for name in names})
+    return constants
+
+
+def _node_value(node: ast.AST, constants: Optional[Dict[str, Any]] = None) -> Any:
+    """
+    Python value of an AST node, resolving module-level constants; expressions that
+    cannot be evaluated become their source text.
+    
+    f-strings keep their literal parts with placeholders for the interpolated
+    expressions that cannot be resolved, e.g. "Database path (default: {get_path()})".
+    """
+    try:
+        return ast.literal_eval(node)
+    except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
+        pass
+    
+    try:
+        return _resolve(node, constants or {})
+    except _Unresolved:
+        pass
+    
+    if isinstance(node, ast.JoinedStr):
+        parts = []
+        for value in node.values:
+            if isinstance(value, ast.Constant):
+                parts.append(str(value.value))
+                continue
+            try:
+                parts.append(_format_static(value, constants or {}))
+            except (_Unresolved, TypeError, ValueError, ArithmeticError):
+                parts.append("{" + ast.unparse(value.value) + "}")
+        return ''.join(parts)
+    return ast.unparse(node)
+
+
+def _call_receiver(call: ast.Call) -> Optional[str]:
+    """Name of the object a method is called on (`parser` in parser.add_argument(...))"""
+    if isinstance(call.func, ast.Attribute) and isinstance(call.func.value, ast.Name):
+        return call.func.value.id
+    return None
+
+
+def _call_name(call: ast.Call) -> Optional[str]:
+    if isinstance(call.func, ast.Attribute):
+        return call.func.attr
+    if isinstance(call.func, ast.Name):
+        return call.func.id
+    return None
+
+
+def extract_cli_spec(source: str, tool_path: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """
+    Build a tool's command-line schema from its argparse calls, without running it.
+    
+    Finds argparse.ArgumentParser(...) for the description, every add_argument(...)
+    for the argument schema, and add_parser(...) for subcommands. Arguments added to
+    argument groups or mutually exclusive groups are attributed to the parser that
+    owns the group. Module-level constants are resolved where they can be evaluated
+    statically; a default that cannot be is left out rather than shown as source.
+    
+    Args:
+        source: Python source of the tool
+        tool_path: Path the tool is run as, used for __file__ in PROJECT_ROOT-style constants
+        
+    Returns:
+        Dictionary with description, arguments and subcommands, or None if the
+        tool defines no ArgumentParser (or cannot be parsed)
+    """
+    try:
+        tree = ast.parse(source)
+    except SyntaxError:
+        return None
+    
+    calls = sorted((node for node in ast.walk(tree) if isinstance(node, ast.Call)), key=lambda node: (node.lineno, node.col_offset))
+    parser_calls = [call for call in calls if _call_name(call) == "ArgumentParser"]
+    if not parser_calls:
+        return None
+    
+    constants = module_constants(tree, tool_path)
+    spec = {"description": None, "arguments": [], "subcommands": {}}
+    for keyword in parser_calls[0].keywords:
+        if keyword.arg == "description":
+            spec["description"] = _node_value(keyword.value, constants)
+    
+    # Variable name -> subcommand it belongs to (None for the top-level parser)
+    owners = {}
+    for node in ast.walk(tree):
+        if not (isinstance(node, ast.Assign) and isinstance(node.value, ast.Call)):
+            continue
+        targets = [target.id for target in node.targets if isinstance(target, ast.Name)]
+        call = node.value
+        if _call_name(call) == "add_parser" and call.args:
+            subcommand = _node_value(call.args[0], constants)
+            help_text = next((_node_value(k.value, constants) for k in call.keywords if k.arg in ("help", "description")), None)
+            spec["subcommands"][subcommand] = {"help": help_text, "arguments": []}
+            owners.update({target: subcommand for target in targets})
+        elif _call_name(call) in ("add_argument_group", "add_mutually_exclusive_group"):
+            owners.update({target: owners.get(_call_receiver(call)) for target in targets})
+    
+    for call in calls:
+        if _call_name(call) != "add_argument" or not isinstance(call.func, ast.Attribute):
+            continue
+        
+        flags = [_node_value(arg, constants) for arg in call.args]
+        argument = {"flags": flags, "positional": bool(flags) and not str(flags[0]).startswith("-")}
+        for keyword in call.keywords:
+            if keyword.arg == "default":
                 try:
-                    with open(file_path, 'r') as f:
-                        first_lines = f.readlines()[:20]  # Read first 20 lines for docstring
-                    
-                    # Extract module docstring
-                    description = extract_module_docstring(first_lines)
-                    
-                except Exception as e:
-                    description = f"Error reading file: {str(e)}"
-                
-                tool_info = {
-                    "name": tool_name,
-                    "path": str(file_path),
-                    "relative_path": relative_path,
-                    "description": description,
-                    "help_output": help_output,
-                    "executable": help_output.get("success", False),
-                    "usage_command": f"uv run {relative_path}"
-                }
-                
-                tools_info[tool_name] = tool_info
+                    argument["default"] = _resolve(keyword.value, constants)
+                except _Unresolved:
+                    pass
+            elif keyword.arg in ARGUMENT_KEYWORDS:
+                argument[keyword.arg] = _node_value(keyword.value, constants)
+        
+        subcommand = owners.get(_call_receiver(call))
+        if subcommand in spec["subcommands"]:
+            spec["subcommands"][subcommand]["arguments"].append(argument)
+        else:
+            spec["arguments"].append(argument)
+    
+    return spec
+
+
+def _format_arguments(arguments: List[Dict[str, Any]], indent: str = "  ") -> List[str]:
+    """Help lines for a list of argument schemas"""
+    lines = []
+    for argument in arguments:
+        flags = ", ".join(str(flag) for flag in argument["flags"])
+        if not argument["positional"] and argument.get("action") not in ("store_true", "store_false", "count", "help", "version"):
+            flags += f" {argument.get('metavar') or str(argument['flags'][-1]).lstrip('-').upper().replace('-', '_')}"
+        
+        details = str(argument.get("help") or "")
+        if argument.get("choices") is not None:
+            details += f" (choices: {argument['choices']})"
+        if argument.get("required"):
+            details += " (required)"
+        if "default" in argument and argument.get("action") not in ("store_true", "store_false") and "default" not in details:
+            details += f" (default: {argument['default']})"
+        lines.append(f"{indent}{flags:<24} {details.strip()}".rstrip())
+    return lines
+
+
+def format_static_help(cli_spec: Dict[str, Any], tool_path: str) -> str:
+    """Render argparse-style help text from a statically extracted CLI schema"""
+    positionals = [a for a in cli_spec["arguments"] if a["positional"]]
+    options = [a for a in cli_spec["arguments"] if not a["positional"]]
+    
+    usage = f"usage: uv run {tool_path}"
+    if cli_spec["subcommands"]:
+        usage += " {" + ",".join(cli_spec["subcommands"]) + "} ..."
+    usage += " [options]" if options else ""
+    usage += "".join(f" [{a['flags'][0]}]" if a.get("nargs") in ("?", "*") else f" {a['flags'][0]}" for a in positionals)
+    
+    lines = [usage]
+    if cli_spec["description"]:
+        lines += ["", str(cli_spec["description"])]
+    if positionals:
+        lines += ["", "positional arguments:"] + _format_arguments(positionals)
+    if options:
+        lines += ["", "options:"] + _format_arguments(options)
+    for subcommand, details in cli_spec["subcommands"].items():
+        lines += ["", f"{subcommand}: {details['help'] or ''}".rstrip()] + _format_arguments(details["arguments"], indent="    ")
+    return "\n".join(lines)
+
+
+def _load_cache(cache_path: str) -> Dict[str, Dict[str, Any]]:
+    """Load cached probe entries keyed by relative path (empty if missing, unreadable or outdated)"""
+    try:
+        with open(cache_path, 'r') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    
+    if cache.get("version") != CACHE_VERSION:
+        return {}
+    return cache.get("tools", {})
+
+
+def _save_cache(cache_path: str, entries: Dict[str, Dict[str, Any]]) -> None:
+    """Atomically write the probe cache"""
+    path = Path(cache_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_suffix(path.suffix + ".tmp")
+    with open(temp_path, 'w') as f:
+        json.dump({"version": CACHE_VERSION, "tools": entries}, f, indent=2)
+    os.replace(temp_path, path)
+
+
+def refresh_tool_manifest(manifest_path: str = DEFAULT_MANIFEST_PATH, tools_dir: str = "tools",
+                          cache_path: Optional[str] = DEFAULT_CACHE_PATH,
+                          max_workers: int = DEFAULT_PROBE_WORKERS, mode: str = "static") -> Dict[str, Any]:
+    """
+    Discover the tools and bring the persistent manifest up to date.
     
-    return tools_info
+    Discovery goes through the inspection cache, so only new or changed tools are
+    inspected; the manifest file is rewritten only when a tool was added, removed or
+    changed.
+    
+    Args:
+        manifest_path: JSON file, or SQLite database for .db/.sqlite/.sqlite3 paths
+        tools_dir: Path to the tools directory
+        cache_path: JSON cache of inspection results (None disables caching)
+        max_workers: Maximum number of concurrent inspections
+        mode: "static" (AST introspection) or "probe" (run each tool with --help)
+        
+    Returns:
+        The manifest: {"version", "generated_at", "tools_dir", "tools": {name: record},
+        "categories": {category: [names]}}, or {"error": ...}
+    """
+    tools_path = Path(tools_dir)
+    
+    if not tools_path.exists():
+        return {"error": f"Tools directory '{tools_dir}' not found"}
+    
+    entries = _discover_entries(tools_path, cache_path, max_workers, mode)
+    records = {}
+    for entry in entries.values():
+        record = _manifest_record(entry, tools_path)
+        records[record["name"]] = record
+    
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "generated_at": datetime.now().isoformat(),
+        "tools_dir": str(tools_dir),
+        "tools": dict(sorted(records.items())),
+        "categories": _category_index(records.values())
+    }
+    
+    if _manifest_fingerprint(_read_manifest_records(manifest_path)) != _manifest_fingerprint(records):
+        if _is_sqlite_manifest(manifest_path):
+            _write_sqlite_manifest(manifest_path, manifest)
+        else:
+            _write_json_manifest(manifest_path, manifest)
+    return manifest
+
+
+def query_tool_manifest(manifest_path: str = DEFAULT_MANIFEST_PATH, name: Optional[str] = None,
+                        search: Optional[str] = None, category: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Look tools up in a stored manifest without scanning the tools directory.
+    
+    Name and category lookups are dictionary reads for JSON manifests and indexed
+    queries for SQLite ones. Search is a case-insensitive substring match over the
+    tool name, description and argument schema.
+    
+    Args:
+        manifest_path: Manifest written by refresh_tool_manifest
+        name: Exact tool name
+        search: Text to look for
+        category: Tool category (its directory under tools/, e.g. "evaluation")
+        
+    Returns:
+        Matching manifest records sorted by name (empty if the manifest is missing)
+    """
+    if _is_sqlite_manifest(manifest_path):
+        return _query_sqlite_manifest(manifest_path, name, search, category)
+    
+    manifest = _load_json_manifest(manifest_path)
+    tools = manifest.get("tools", {})
+    if name is not None:
+        candidates = [tools[name]] if name in tools else []
+    elif category is not None:
+        candidates = [tools[tool] for tool in manifest.get("categories", {}).get(category, [])]
+    else:
+        candidates = list(tools.values())
+    
+    return [
+        record for record in sorted(candidates, key=lambda record: record["name"])
+        if (category is None or record["category"] == category)
+        and (search is None or _record_matches(record, search))
+    ]
+
+
+def _manifest_record(entry: Dict[str, Any], tools_path: Path) -> Dict[str, Any]:
+    """Manifest record for one cache entry: the tool info plus category, hash and inspection time"""
+    tool_info = entry["tool_info"]
+    try:
+        parts = Path(tool_info["path"]).relative_to(tools_path).parts
+    except ValueError:
+        parts = Path(tool_info["path"]).parts
+    
+    return {
+        **tool_info,
+        "category": parts[0] if len(parts) > 1 else "general",
+        "sha256": entry["sha256"],
+        "probed_at": entry["probed_at"],
+        "mode": entry["mode"]
+    }
+
+
+def _category_index(records) -> Dict[str, List[str]]:
+    categories = {}
+    for record in sorted(records, key=lambda record: record["name"]):
+        categories.setdefault(record["category"], []).append(record["name"])
+    return dict(sorted(categories.items()))
+
+
+def _manifest_fingerprint(records: Dict[str, Dict[str, Any]]) -> Dict[str, tuple]:
+    """What decides whether the stored manifest is current"""
+    return {name: (record["relative_path"], record["sha256"], record["mode"]) for name, record in records.items()}
+
+
+def _record_matches(record: Dict[str, Any], search: str) -> bool:
+    text = " ".join([record["name"], record["description"] or "", json.dumps(record.get("cli"))])
+    return search.lower() in text.lower()
+
+
+def _is_sqlite_manifest(manifest_path: str) -> bool:
+    return Path(manifest_path).suffix.lower() in SQLITE_MANIFEST_SUFFIXES
+
+
+def _read_manifest_records(manifest_path: str) -> Dict[str, Dict[str, Any]]:
+    """Every record of a stored manifest keyed by name (empty if missing or unreadable)"""
+    if _is_sqlite_manifest(manifest_path):
+        if not Path(manifest_path).exists():
+            return {}
+        return {record["name"]: record for record in _query_sqlite_manifest(manifest_path)}
+    return _load_json_manifest(manifest_path).get("tools", {})
+
+
+def _load_json_manifest(manifest_path: str) -> Dict[str, Any]:
+    try:
+        with open(manifest_path, 'r') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    
+    if manifest.get("version") != MANIFEST_VERSION:
+        return {}
+    return manifest
+
+
+def _write_json_manifest(manifest_path: str, manifest: Dict[str, Any]) -> None:
+    """Atomically write a JSON manifest"""
+    path = Path(manifest_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_suffix(path.suffix + ".tmp")
+    with open(temp_path, 'w') as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(temp_path, path)
+
+
+def _create_manifest_table(conn: sqlite3.Connection) -> None:
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS tool_manifest (
+            name TEXT PRIMARY KEY,
+            category TEXT NOT NULL,
+            relative_path TEXT NOT NULL,
+            usage_command TEXT NOT NULL,
+            description TEXT,
+            executable INTEGER NOT NULL,
+            cli_schema TEXT,
+            help_output TEXT NOT NULL,
+            sha256 TEXT NOT NULL,
+            probed_at TEXT NOT NULL,
+            mode TEXT NOT NULL,
+            manifest_version INTEGER NOT NULL
+        )
+    """)
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_tool_manifest_category ON tool_manifest(category, name)")
+
+
+def _write_sqlite_manifest(manifest_path: str, manifest: Dict[str, Any]) -> None:
+    """Replace the tool_manifest table contents in one transaction"""
+    Path(manifest_path).parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(manifest_path)
+    try:
+        with conn:
+            _create_manifest_table(conn)
+            conn.execute("DELETE FROM tool_manifest")
+            conn.executemany("""
+                INSERT INTO tool_manifest (
+                    name, category, relative_path, usage_command, description, executable,
+                    cli_schema, help_output, sha256, probed_at, mode, manifest_version
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, [
+                (record["name"], record["category"], record["relative_path"], record["usage_command"],
+                 record["description"], int(record["executable"]), json.dumps(record["cli"]),
+                 json.dumps(record["help_output"]), record["sha256"], record["probed_at"], record["mode"],
+                 MANIFEST_VERSION)
+                for record in manifest["tools"].values()
+            ])
+    finally:
+        conn.close()
+
+
+def _query_sqlite_manifest(manifest_path: str, name: Optional[str] = None, search: Optional[str] = None,
+                           category: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Indexed lookups against the tool_manifest table"""
+    if not Path(manifest_path).exists():
+        return []
+    
+    conditions = ["manifest_version = ?"]
+    params = [MANIFEST_VERSION]
+    if name is not None:
+        conditions.append("name = ?")
+        params.append(name)
+    if category is not None:
+        conditions.append("category = ?")
+        params.append(category)
+    if search is not None:
+        conditions.append("(name LIKE ? OR description LIKE ? OR cli_schema LIKE ?)")
+        params.extend([f"%{search}%"] * 3)
+    
+    conn = sqlite3.connect(manifest_path)
+    conn.row_factory = sqlite3.Row
+    try:
+        rows = conn.execute(
+            f"SELECT * FROM tool_manifest WHERE {' AND '.join(conditions)} ORDER BY name", params
+        ).fetchall()
+    except sqlite3.OperationalError:
+        # Not a manifest database (yet)
+        return []
+    finally:
+        conn.close()
+    
+    return [
+        {
+            "name": row["name"],
+            "path": row["relative_path"],
+            "relative_path": row["relative_path"],
+            "description": row["description"],
+            "cli": json.loads(row["cli_schema"]),
+            "help_output": json.loads(row["help_output"]),
+            "executable": bool(row["executable"]),
+            "usage_command": row["usage_command"],
+            "category": row["category"],
+            "sha256": row["sha256"],
+            "probed_at": row["probed_at"],
+            "mode": row["mode"]
+        }
+        for row in rows
+    ]
 
 
 def get_tool_help(tool_path: str) -> Dict[str, Any]:
@@ -145,14 +804,24 @@ def get_tool_help(tool_path: str) -> Dict[str, Any]:
 
 def extract_module_docstring(lines: List[str]) -> str:
     """
-    Extract module docstring from the first few lines of a Python file.
+    Extract module docstring from the lines of a Python file.
+    
+    Complete sources are parsed with ast, which handles every docstring form; partial
+    sources (such as the first few lines) fall back to scanning for the delimiters.
     
     Args:
-        lines: First few lines of the Python file
+        lines: Lines of the Python file (all of them, or the first few)
         
     Returns:
         Extracted docstring or fallback description
     """
+    try:
+        docstring = ast.get_docstring(ast.parse(''.join(lines)))
+    except SyntaxError:
+        docstring = None
+    if docstring:
+        return ' '.join(line.strip() for line in docstring.splitlines() if line.strip())
+    
     docstring_lines = []
     in_docstring = False
     docstring_delimiter = None
@@ -184,13 +853,18 @@ def extract_module_docstring(lines: List[str]) -> str:
     return "No description available"
 
 
-def print_tool_documentation(tool_name: str = None, tools_dir: str = "tools") -> None:
+def print_tool_documentation(tool_name: str = None, tools_dir: str = "tools",
+                             cache_path: Optional[str] = DEFAULT_CACHE_PATH,
+                             max_workers: int = DEFAULT_PROBE_WORKERS, mode: str = "static") -> None:
     """
     Print formatted CLI documentation for a specific tool or all tools.
     
     Args:
         tool_name: Name of specific tool to document (optional)
         tools_dir: Path to tools directory
+        cache_path: JSON cache of inspection results (None disables caching)
+        max_workers: Maximum number of concurrent inspections
+        mode: "static" (AST introspection) or "probe" (run each tool with --help)
         
     Example:
         # Print all tools
@@ -199,7 +873,7 @@ def print_tool_documentation(tool_name: str = None, tools_dir: str = "tools") ->
         # Print specific tool
         print_tool_documentation("evaluate")
     """
-    tools = discover_cli_tools(tools_dir)
+    tools = discover_cli_tools(tools_dir, cache_path, max_workers, mode)
     
     if "error" in tools:
         print(f"Error: {tools['error']}")
@@ -306,6 +980,10 @@ uv run tools/utils/get_tools.py evaluate
 
 # Show usage examples
 uv run tools/utils/get_tools.py --examples
+
+# Find tools by keyword or category, as JSON from the manifest
+uv run tools/utils/get_tools.py --search session --json
+uv run tools/utils/get_tools.py --category evaluation --from-manifest --json
         """
     }
 
@@ -318,6 +996,19 @@ if __name__ == "__main__":
     parser.add_argument("tool", nargs="?", help="Specific tool to document")
     parser.add_argument("--examples", action="store_true", help="Show usage examples")
     parser.add_argument("--tools-dir", default="tools", help="Tools directory path")
+    parser.add_argument("--cache-path", default=DEFAULT_CACHE_PATH, help=f"Inspection result cache (default: {DEFAULT_CACHE_PATH})")
+    parser.add_argument("--no-cache", action="store_true", help="Inspect every tool and skip the cache")
+    parser.add_argument("--workers", type=int, default=DEFAULT_PROBE_WORKERS,
+                        help="Concurrent inspections (default: twice the CPU count, at most 8)")
+    parser.add_argument("--probe", action="store_true",
+                        help="Run each tool with --help in a subprocess instead of reading its argparse calls statically")
+    parser.add_argument("--manifest", default=DEFAULT_MANIFEST_PATH,
+                        help=f"Tool manifest to maintain; .db/.sqlite/.sqlite3 store it in SQLite (default: {DEFAULT_MANIFEST_PATH})")
+    parser.add_argument("--from-manifest", action="store_true",
+                        help="Answer from the stored manifest without scanning the tools directory")
+    parser.add_argument("--search", help="Only tools whose name, description or arguments contain this text")
+    parser.add_argument("--category", help="Only tools in this category (directory under tools/, e.g. evaluation)")
+    parser.add_argument("--json", action="store_true", help="Print manifest records as JSON")
     
     args = parser.parse_args()
     
@@ -331,4 +1022,32 @@ if __name__ == "__main__":
             print("-" * 40)
             print(example)
     else:
-        print_tool_documentation(args.tool, args.tools_dir)
\ No newline at end of file
+        if not args.from_manifest:
+            manifest = refresh_tool_manifest(args.manifest, args.tools_dir, None if args.no_cache else args.cache_path,
+                                             args.workers, "probe" if args.probe else "static")
+            if "error" in manifest:
+                print(f"Error: {manifest['error']}")
+                exit(1)
+        
+        tools = query_tool_manifest(args.manifest, args.tool, args.search, args.category)
+        
+        if args.json:
+            print(json.dumps(tools[0] if args.tool and tools else tools, indent=2))
+        elif args.tool and tools:
+            _print_single_tool(tools[0])
+        elif args.tool:
+            print(f"Tool '{args.tool}' not found.")
+            print(f"Available tools: {', '.join(record['name'] for record in query_tool_manifest(args.manifest))}")
+        elif not tools:
+            print("No tools match." if args.search or args.category else "No tools found in the tools directory.")
+        else:
+            print("=" * 80)
+            print("AVAILABLE CLI TOOLS")
+            print("=" * 80)
+            
+            for record in tools:
+                _print_tool_summary(record)
+                print("-" * 40)
+        
+        if args.tool and not tools:
+            exit(1)
\ No newline at end of file
@@ -10,10 +10,18 @@ enhanced core tables and extended business intelligence tables.
 
 import sqlite3
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime, date, timedelta
 import random
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable, Iterator, Optional
+from itertools import chain, islice, groupby
+from operator import itemgetter
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 import os
+import argparse
+
+import numpy as np
 
 # Configure logging
 logging.basicConfig(
@@ -22,10 +30,222 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Personality-based performance patterns shared by both generation engines
+PERSONALITY_CONFIGS = {
+    'consistent_performer': {
+        'base_bookings': (15, 20), 'booking_variance': 3, 'base_rating': (4.1, 4.3), 
+        'spend_range': (450, 650), 'trend_factor': 0.0, 'volatility': 0.15
+    },
+    'rising_star': {
+        'base_bookings': (8, 15), 'booking_variance': 4, 'base_rating': (4.0, 4.4), 
+        'spend_range': (400, 700), 'trend_factor': 0.8, 'volatility': 0.25
+    },
+    'premium_niche': {
+        'base_bookings': (6, 12), 'booking_variance': 2, 'base_rating': (4.3, 4.7), 
+        'spend_range': (800, 1200), 'trend_factor': 0.1, 'volatility': 0.12
+    },
+    'struggling_veteran': {
+        'base_bookings': (12, 18), 'booking_variance': 5, 'base_rating': (3.8, 4.1), 
+        'spend_range': (350, 550), 'trend_factor': -0.6, 'volatility': 0.35
+    },
+    'volume_player': {
+        'base_bookings': (20, 30), 'booking_variance': 6, 'base_rating': (3.9, 4.2), 
+        'spend_range': (300, 450), 'trend_factor': 0.2, 'volatility': 0.20
+    },
+    'weekend_champion': {
+        'base_bookings': (10, 16), 'booking_variance': 8, 'base_rating': (4.0, 4.3), 
+        'spend_range': (500, 750), 'trend_factor': 0.1, 'volatility': 0.40
+    },
+    'volatile_performer': {
+        'base_bookings': (8, 25), 'booking_variance': 12, 'base_rating': (3.7, 4.5), 
+        'spend_range': (400, 900), 'trend_factor': 0.0, 'volatility': 0.60
+    },
+    'seasonal_specialist': {
+        'base_bookings': (12, 20), 'booking_variance': 5, 'base_rating': (4.1, 4.4), 
+        'spend_range': (600, 800), 'trend_factor': 0.3, 'volatility': 0.30
+    }
+}
+
+# Operating hours: 12 PM to 11 PM (12-23); peak hours: 1-3 PM and 7-9 PM
+OPERATING_HOURS = list(range(12, 24))
+PEAK_HOURS = [13, 14, 15, 19, 20, 21]
+
+COMPLAINT_CATEGORIES = ['Food Quality', 'Service Speed', 'Staff Behavior', 'Cleanliness', 'Billing Issues']
+ANOMALY_CATEGORIES = ['Sudden_Drop', 'Revenue_Spike', 'Irregular_Pattern', 'None']
+
+GENERATION_ENGINES = ['python', 'numpy']
+
+# Markets used for procedurally generated restaurants in scale-factor mode.
+# The first six localities and seven cuisines make up the baseline dataset.
+CITY_LOCALITIES = {
+    'Bangalore': ['Koramangala', 'Indiranagar', 'Whitefield', 'HSR Layout', 'Jayanagar', 'MG Road'],
+    'Mumbai': ['Bandra', 'Andheri', 'Powai', 'Lower Parel', 'Colaba'],
+    'Delhi': ['Connaught Place', 'Khan Market', 'Hauz Khas', 'Saket', 'Rajouri Garden'],
+    'Hyderabad': ['Banjara Hills', 'Jubilee Hills', 'Gachibowli'],
+    'Pune': ['Koregaon Park', 'Baner', 'Viman Nagar'],
+    'Chennai': ['T Nagar', 'Adyar', 'Nungambakkam']
+}
+BASELINE_LOCALITIES = ['Koramangala', 'Indiranagar', 'Bandra', 'Connaught Place', 'Khan Market', 'Whitefield']
+BASELINE_CUISINES = ['Indian', 'Italian', 'Japanese', 'American', 'Chinese', 'Continental', 'Seafood']
+CUISINES = BASELINE_CUISINES + ['Thai', 'Mexican', 'Mediterranean', 'South Indian']
+
+RESTAURANT_NAME_PREFIXES = ['Spice', 'Royal', 'Urban', 'Golden', 'Green', 'Coastal', 'Dragon', 'Little', 'Grand', 'Rustic', 'Saffron', 'Blue']
+RESTAURANT_NAME_SUFFIXES = ['Garden', 'Kitchen', 'Bistro', 'House', 'Table', 'Palace', 'Cafe', 'Express', 'Grill', 'Bowl', 'Diner', 'Tavern']
+
+# Scale factor 1 = 1,000 restaurants over a 365-day window
+SCALE_FACTOR_RESTAURANTS = 1000
+SCALE_FACTOR_DAYS = 365
+
+# Streaming load settings: rows per executemany chunk and restaurants per generated batch
+LOAD_CHUNK_SIZE = 50000
+RESTAURANTS_PER_BATCH = 64
+
+# Write-optimized PRAGMAs for the load phase, and the defaults restored afterwards.
+# Foreign keys are not enforced while loading: every generated row references
+# a restaurant written first, and the checks cost the single writer ~20%.
+LOAD_PRAGMAS = {
+    'journal_mode': 'MEMORY',
+    'synchronous': 'OFF',
+    'cache_size': -262144,  # 256 MiB
+    'temp_store': 'MEMORY',
+    'foreign_keys': 'OFF'
+}
+DEFAULT_PRAGMAS = {
+    'journal_mode': 'DELETE',
+    'synchronous': 'FULL',
+    'cache_size': -2000,
+    'temp_store': 'DEFAULT',
+    'foreign_keys': 'ON'
+}
+
+# Secondary indexes matched to the analyst access patterns in prompts/data-sources.md:
+# per-restaurant lookups by date, peer cohorts by locality/cuisine/capacity, and date-range
+# scans across restaurants. Trailing columns make the hottest aggregations covering.
+# Per-restaurant lookups on metrics, ads, operational, service quality, volatility and KPI
+# tables are already served by the UNIQUE constraints' implicit indexes.
+SCHEMA_INDEXES = {
+    'idx_restaurant_master_market': 'restaurant_master(locality, cuisine, seating_capacity)',
+    'idx_restaurant_master_city': 'restaurant_master(city, locality)',
+    'idx_restaurant_metrics_peer': 'restaurant_metrics(locality, cuisine, date, bookings, covers, revenue, avg_rating)',
+    'idx_restaurant_metrics_date': 'restaurant_metrics(date, restaurant_id, bookings, covers, revenue)',
+    'idx_ads_data_campaign_window': 'ads_data(campaign_end, campaign_start, restaurant_id)',
+    'idx_discount_history_restaurant': 'discount_history(restaurant_id, start_date, end_date)',
+    'idx_operational_metrics_date_hour': 'operational_metrics(date, hour_slot, capacity_utilization)',
+    'idx_service_quality_date': 'service_quality_tracking(date, restaurant_id, avg_service_rating, complaints_count)',
+    'idx_financial_settlements_restaurant': 'financial_settlements(restaurant_id, settlement_date)',
+    'idx_revenue_volatility_anomalies': 'revenue_volatility_tracking(date, restaurant_id, anomaly_category) WHERE anomaly_detected = 1',
+    'idx_performance_feedback_restaurant': 'performance_feedback_loop(restaurant_id, feedback_date)',
+    'idx_kpi_goals_period': 'kpi_goals_tracking(goal_period, kpi_type, achievement_percentage)',
+    'idx_restaurant_kpi_rollups_period': 'restaurant_kpi_rollups(grain, period_start, restaurant_id, bookings, revenue)'
+}
+
+# Rollup grains and the SQLite expression mapping a date column to its period start
+# (weeks start on Monday)
+ROLLUP_PERIODS = {
+    'day': "date({column})",
+    'week': "date({column}, 'weekday 0', '-6 days')",
+    'month': "date({column}, 'start of month')"
+}
+
+# Last day of a period, from its start
+ROLLUP_PERIOD_ENDS = {
+    'day': "period_start",
+    'week': "date(period_start, '+6 days')",
+    'month': "date(period_start, '+1 month', '-1 day')"
+}
+
+ROLLUP_TABLES = ['restaurant_kpi_rollups', 'restaurant_hour_of_week_profile']
+
+# Revenue volatility engine (revenue_volatility_tracking is derived from restaurant_metrics.revenue).
+# The volatility index is the EWMA coefficient of variation of daily revenue; anomalies are
+# robust z-scores (0.6745 * (x - median) / MAD) against the trailing window of prior days.
+VOLATILITY_EWMA_HALFLIFE_DAYS = 7
+ANOMALY_WINDOW_DAYS = 30
+ANOMALY_MIN_HISTORY_DAYS = 7
+ANOMALY_Z_THRESHOLD = 3.5
+# A day is an Irregular_Pattern when it and enough of the preceding week deviate moderately
+IRREGULAR_Z_THRESHOLD = 2.0
+IRREGULAR_WINDOW_DAYS = 7
+IRREGULAR_MIN_DAYS = 3
+VOLATILITY_TREND_WINDOWS = (7, 30)
+VOLATILITY_TREND_MIN_DAYS = 3
+# Days of revenue and volatility index re-read up to each restaurant's last processed day:
+# the z-score windows of the days an Irregular_Pattern looks back over, and the longest trend
+VOLATILITY_REVENUE_LOOKBACK_DAYS = ANOMALY_WINDOW_DAYS + IRREGULAR_WINDOW_DAYS - 1
+VOLATILITY_INDEX_LOOKBACK_DAYS = max(VOLATILITY_TREND_WINDOWS) - 1
+# Restaurants whose daily series are held in memory at once
+VOLATILITY_BATCH_SIZE = 1024
+
+# Tables with one row per restaurant per day (or hour); append mode extends only these
+DAILY_TABLES = ['restaurant_metrics', 'operational_metrics', 'service_quality_tracking']
+
+# Rows sampled per index by ANALYZE, so statistics stay cheap at scale-factor sizes
+ANALYSIS_LIMIT = 2000
+
+# Representative analyst queries (name, SQL, parameters). verify_query_plans() checks
+# that none of them falls back to a full scan.
+ANALYST_QUERIES = [
+    ('restaurant_profile', "SELECT * FROM restaurant_master WHERE restaurant_id = ?", ('R001',)),
+    ('market_restaurants', "SELECT restaurant_id, seating_capacity FROM restaurant_master WHERE locality = ? AND cuisine = ?", ('Koramangala', 'Indian')),
+    ('daily_trend', "SELECT date, bookings, cancellations, covers, revenue, avg_rating FROM restaurant_metrics WHERE restaurant_id = ? AND date >= ? ORDER BY date", ('R001', '2025-01-01')),
+    ('peer_cohort_daily', "SELECT date, AVG(bookings), AVG(revenue), AVG(avg_rating) FROM restaurant_metrics WHERE locality = ? AND cuisine = ? AND date >= ? GROUP BY date", ('Koramangala', 'Indian', '2025-01-01')),
+    ('peer_benchmark_comparison', "SELECT m.date, m.bookings, m.revenue, p.avg_bookings, p.avg_revenue FROM restaurant_metrics m JOIN peer_benchmarks p ON p.locality = m.locality AND p.cuisine = m.cuisine WHERE m.restaurant_id = ?", ('R001',)),
+    ('portfolio_date_range', "SELECT restaurant_id, SUM(bookings), SUM(revenue) FROM restaurant_metrics WHERE date BETWEEN ? AND ? GROUP BY restaurant_id", ('2025-01-01', '2025-01-31')),
+    ('restaurant_campaigns', "SELECT campaign_id, impressions, clicks, conversions, spend, revenue_generated FROM ads_data WHERE restaurant_id = ?", ('R001',)),
+    ('active_campaigns', "SELECT restaurant_id, campaign_id, spend FROM ads_data WHERE campaign_end >= ?", ('2025-01-01',)),
+    ('restaurant_discounts', "SELECT * FROM discount_history WHERE restaurant_id = ? ORDER BY start_date DESC", ('R001',)),
+    ('hourly_operations', "SELECT date, hour_slot, capacity_utilization, service_delay_minutes FROM operational_metrics WHERE restaurant_id = ? AND date >= ?", ('R001', '2025-01-01')),
+    ('fleet_hourly_utilization', "SELECT hour_slot, AVG(capacity_utilization) FROM operational_metrics WHERE date = ? GROUP BY hour_slot", ('2025-01-01',)),
+    ('service_quality_trend', "SELECT date, avg_service_rating, complaints_count FROM service_quality_tracking WHERE restaurant_id = ? AND date >= ?", ('R001', '2025-01-01')),
+    ('fleet_service_quality', "SELECT restaurant_id, avg_service_rating FROM service_quality_tracking WHERE date = ?", ('2025-01-01',)),
+    ('restaurant_settlements', "SELECT * FROM financial_settlements WHERE restaurant_id = ? ORDER BY settlement_date DESC", ('R001',)),
+    ('market_competition', "SELECT * FROM competitive_intelligence WHERE locality = ? AND cuisine = ?", ('Koramangala', 'Indian')),
+    ('restaurant_volatility', "SELECT * FROM revenue_volatility_tracking WHERE restaurant_id = ? AND date >= ?", ('R001', '2025-01-01')),
+    ('fleet_anomalies', "SELECT restaurant_id, date, anomaly_category FROM revenue_volatility_tracking WHERE anomaly_detected = 1 AND date >= ?", ('2025-01-01',)),
+    ('restaurant_feedback', "SELECT * FROM performance_feedback_loop WHERE restaurant_id = ? ORDER BY feedback_date DESC", ('R001',)),
+    ('restaurant_goals', "SELECT kpi_type, target_value, actual_value, achievement_percentage FROM kpi_goals_tracking WHERE restaurant_id = ? AND goal_period = ?", ('R001', '2025-Q1')),
+    ('fleet_goal_attainment', "SELECT restaurant_id, achievement_percentage FROM kpi_goals_tracking WHERE goal_period = ? AND kpi_type = ?", ('2025-Q1', 'Revenue')),
+    ('weekly_kpi_trend', "SELECT period_start, bookings, revenue, revenue_per_cover, peak_hour_slot FROM restaurant_kpi_rollups WHERE restaurant_id = ? AND grain = 'week' ORDER BY period_start DESC LIMIT 4", ('R001',)),
+    ('portfolio_month', "SELECT restaurant_id, bookings, revenue FROM restaurant_kpi_rollups WHERE grain = 'month' AND period_start = ?", ('2025-01-01',)),
+    ('utilization_profile', "SELECT day_of_week, hour_slot, avg_capacity_utilization FROM restaurant_hour_of_week_profile WHERE restaurant_id = ?", ('R001',))
+]
+
+# Tables generated from the restaurant list alone, mapped to their row-by-row generator.
+# These are sharded by restaurant so they can be generated in parallel worker processes;
+# a table's position in this mapping also keys its RNG substreams.
+SHARDED_TABLE_GENERATORS = {
+    'restaurant_metrics': 'generate_mock_metrics',
+    'ads_data': 'generate_mock_ads_data',
+    'discount_history': 'generate_mock_discount_history',
+    'operational_metrics': 'generate_operational_metrics',
+    'service_quality_tracking': 'generate_service_quality_data',
+    'financial_settlements': 'generate_financial_settlements',
+    'performance_feedback_loop': 'generate_performance_feedback',
+    'kpi_goals_tracking': 'generate_kpi_goals_tracking'
+}
+
 class DatabaseInitializer:
-    def __init__(self, db_path: str = "swiggy_dineout.db"):
+    def __init__(self, db_path: str = "swiggy_dineout.db", engine: str = "python",
+                 num_restaurants: int = None, days: int = 30, workers: int = 1,
+                 seed: int = None, end_date: date = None):
+        if engine not in GENERATION_ENGINES:
+            raise ValueError(f"Unknown generation engine '{engine}'. Choose from: {', '.join(GENERATION_ENGINES)}")
+        if num_restaurants is not None and num_restaurants < 1:
+            raise ValueError("num_restaurants must be at least 1")
+        if days < 0:
+            raise ValueError("days must not be negative")
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
         self.db_path = db_path
+        self.engine = engine
+        self.num_restaurants = num_restaurants
+        self.days = days
+        self.workers = workers
+        # Every table/restaurant stream derives from this root; an unseeded run draws fresh entropy
+        self.seed_sequence = np.random.SeedSequence(seed)
+        self.end_date = end_date or datetime.now().date()
         self.conn = None
+        self._bulk_loading = False
         
     def connect(self):
         """Establish database connection"""
@@ -43,6 +263,43 @@ class DatabaseInitializer:
             self.conn.close()
             logger.info("Database connection closed")
     
+    def _random(self, table_name: str, key: str = '') -> random.Random:
+        """Independent, reproducible random.Random stream for a table, optionally scoped to one restaurant"""
+        state = substream(self.seed_sequence, table_name, key).generate_state(4)
+        return random.Random(int.from_bytes(state.tobytes(), 'little'))
+    
+    @property
+    def window_start(self) -> date:
+        """First day of the generated daily window"""
+        return self.end_date - timedelta(days=self.days)
+    
+    def _window_random(self, table_name: str, restaurant: Dict, rng: random.Random) -> random.Random:
+        """Stream for a restaurant's daily draws: its table stream for the initial window, a window-keyed one when appending"""
+        key = _window_stream_key(restaurant, self.window_start)
+        return rng if key is None else self._random(table_name, key)
+    
+    @contextmanager
+    def bulk_load(self):
+        """Run the load phase inside a single transaction with write-optimized PRAGMAs"""
+        # Manage the transaction explicitly; journal_mode cannot change inside one
+        self.conn.isolation_level = None
+        for pragma, value in LOAD_PRAGMAS.items():
+            self.conn.execute(f"PRAGMA {pragma} = {value}")
+        
+        self.conn.execute("BEGIN")
+        self._bulk_loading = True
+        try:
+            yield
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+        finally:
+            self._bulk_loading = False
+            for pragma, value in DEFAULT_PRAGMAS.items():
+                self.conn.execute(f"PRAGMA {pragma} = {value}")
+            self.conn.isolation_level = ''
+    
     def create_tables(self):
         """Create all required tables based on the schema"""
         logger.info("Creating database tables...")
@@ -271,6 +528,420 @@ class DatabaseInitializer:
             logger.error(f"Error creating tables: {e}")
             raise
     
+    def create_rollup_tables(self):
+        """Create the pre-aggregated KPI rollup and hour-of-week utilization profile tables, and the revenue volatility state"""
+        # Restaurant KPIs at day/week/month grain, joined from daily metrics and hourly operations
+        restaurant_kpi_rollups_sql = '''
+        CREATE TABLE IF NOT EXISTS restaurant_kpi_rollups (
+            restaurant_id TEXT NOT NULL,
+            grain TEXT NOT NULL CHECK(grain IN ('day', 'week', 'month')),
+            period_start DATE NOT NULL,
+            period_end DATE NOT NULL,
+            days_covered INTEGER NOT NULL DEFAULT 0,
+            bookings INTEGER NOT NULL DEFAULT 0,
+            cancellations INTEGER NOT NULL DEFAULT 0,
+            cancellation_rate REAL NOT NULL DEFAULT 0.0,
+            covers INTEGER NOT NULL DEFAULT 0,
+            revenue REAL NOT NULL DEFAULT 0.0,
+            revenue_per_cover REAL NOT NULL DEFAULT 0.0,
+            avg_rating REAL,
+            avg_capacity_utilization REAL,
+            peak_hour_slot INTEGER CHECK(peak_hour_slot >= 0 AND peak_hour_slot <= 23),
+            peak_hour_utilization REAL,
+            online_bookings INTEGER NOT NULL DEFAULT 0,
+            offline_bookings INTEGER NOT NULL DEFAULT 0,
+            overbooking_incidents INTEGER NOT NULL DEFAULT 0,
+            underbooking_slots INTEGER NOT NULL DEFAULT 0,
+            avg_service_delay_minutes REAL,
+            FOREIGN KEY (restaurant_id) REFERENCES restaurant_master (restaurant_id),
+            UNIQUE(restaurant_id, grain, period_start)
+        )
+        '''
+        
+        # Utilization by weekday (0 = Sunday, as strftime('%w')) and hour over the full history.
+        # Totals are kept next to the averages so appended days can be folded in.
+        restaurant_hour_of_week_profile_sql = '''
+        CREATE TABLE IF NOT EXISTS restaurant_hour_of_week_profile (
+            restaurant_id TEXT NOT NULL,
+            day_of_week INTEGER NOT NULL CHECK(day_of_week >= 0 AND day_of_week <= 6),
+            hour_slot INTEGER NOT NULL CHECK(hour_slot >= 0 AND hour_slot <= 23),
+            observations INTEGER NOT NULL DEFAULT 0,
+            total_capacity_utilization REAL NOT NULL DEFAULT 0.0,
+            avg_capacity_utilization REAL NOT NULL DEFAULT 0.0,
+            peak_capacity_utilization REAL NOT NULL DEFAULT 0.0,
+            total_bookings INTEGER NOT NULL DEFAULT 0,
+            avg_bookings REAL NOT NULL DEFAULT 0.0,
+            overbooking_incidents INTEGER NOT NULL DEFAULT 0,
+            underbooking_slots INTEGER NOT NULL DEFAULT 0,
+            total_service_delay_minutes REAL NOT NULL DEFAULT 0.0,
+            avg_service_delay_minutes REAL NOT NULL DEFAULT 0.0,
+            FOREIGN KEY (restaurant_id) REFERENCES restaurant_master (restaurant_id),
+            UNIQUE(restaurant_id, day_of_week, hour_slot)
+        )
+        '''
+        
+        # EWMA state of each restaurant's revenue as of the last day written to
+        # revenue_volatility_tracking, so new days continue the average without replaying history
+        revenue_volatility_state_sql = '''
+        CREATE TABLE IF NOT EXISTS revenue_volatility_state (
+            restaurant_id TEXT PRIMARY KEY,
+            last_date DATE NOT NULL,
+            ewma_revenue REAL NOT NULL,
+            ewma_variance REAL NOT NULL,
+            FOREIGN KEY (restaurant_id) REFERENCES restaurant_master (restaurant_id)
+        )
+        '''
+
+        try:
+            cursor = self.conn.cursor()
+            cursor.execute(restaurant_kpi_rollups_sql)
+            cursor.execute(restaurant_hour_of_week_profile_sql)
+            cursor.execute(revenue_volatility_state_sql)
+            self.conn.commit()
+            logger.info(f"Rollup tables created: {', '.join(ROLLUP_TABLES)}")
+        except sqlite3.Error as e:
+            logger.error(f"Error creating rollup tables: {e}")
+            raise
+    
+    def create_watermark_table(self):
+        """Create the per-restaurant load watermark table used by append mode"""
+        # Personality and seed are kept so appended days continue each restaurant's profile
+        load_watermarks_sql = '''
+        CREATE TABLE IF NOT EXISTS load_watermarks (
+            restaurant_id TEXT PRIMARY KEY,
+            personality TEXT NOT NULL,
+            history_start DATE NOT NULL,
+            last_loaded_date DATE NOT NULL,
+            seed_entropy TEXT NOT NULL,
+            FOREIGN KEY (restaurant_id) REFERENCES restaurant_master (restaurant_id)
+        )
+        '''
+        
+        try:
+            self.conn.execute(load_watermarks_sql)
+            self.conn.commit()
+        except sqlite3.Error as e:
+            logger.error(f"Error creating watermark table: {e}")
+            raise
+    
+    def record_watermarks(self, restaurants: List[Dict]):
+        """Mark the current window's end date as loaded for the given restaurants"""
+        self.conn.executemany('''
+        INSERT INTO load_watermarks (restaurant_id, personality, history_start, last_loaded_date, seed_entropy)
+        VALUES (?, ?, ?, ?, ?)
+        ON CONFLICT(restaurant_id) DO UPDATE SET
+            last_loaded_date = excluded.last_loaded_date
+        ''', (
+            (r['restaurant_id'], r['personality'], r.get('history_start', self.window_start).isoformat(),
+             self.end_date.isoformat(), str(self.seed_sequence.entropy))
+            for r in restaurants
+        ))
+        if not self._bulk_loading:
+            self.conn.commit()
+    
+    def load_watermarked_restaurants(self) -> List[Dict[str, Any]]:
+        """Restaurants with their generation profile and last loaded date, read back from the watermark table"""
+        cursor = self.conn.execute('''
+        SELECT m.restaurant_id, m.restaurant_name, m.city, m.locality, m.cuisine, m.seating_capacity,
+               w.personality, w.history_start, w.last_loaded_date, w.seed_entropy
+        FROM restaurant_master m
+        JOIN load_watermarks w ON w.restaurant_id = m.restaurant_id
+        ORDER BY m.restaurant_id
+        ''')
+        columns = [column[0] for column in cursor.description]
+        restaurants = []
+        for row in cursor:
+            restaurant = dict(zip(columns, row))
+            restaurant['history_start'] = date.fromisoformat(restaurant['history_start'])
+            restaurant['last_loaded_date'] = date.fromisoformat(restaurant['last_loaded_date'])
+            restaurants.append(restaurant)
+        return restaurants
+    
+    def build_rollups(self, since: str = None, restaurant_ids: List[str] = None):
+        """
+        Build the KPI rollups and hour-of-week profiles from the raw daily and hourly tables.
+        
+        Without `since` everything is rebuilt. With `since` (YYYY-MM-DD, the first newly
+        loaded day) only the periods containing or following it are recomputed, and the
+        hourly rows from that day on are folded into the existing profiles.
+        `restaurant_ids` limits the work to those restaurants.
+        """
+        try:
+            cursor = self.conn.cursor()
+            scope = ''
+            if restaurant_ids is not None:
+                cursor.execute("CREATE TEMP TABLE IF NOT EXISTS rollup_scope (restaurant_id TEXT PRIMARY KEY)")
+                cursor.execute("DELETE FROM temp.rollup_scope")
+                cursor.executemany("INSERT INTO temp.rollup_scope VALUES (?)", ((rid,) for rid in restaurant_ids))
+                scope = " AND restaurant_id IN (SELECT restaurant_id FROM temp.rollup_scope)"
+            
+            for grain in ROLLUP_PERIODS:
+                self._build_kpi_rollup(cursor, grain, since, scope)
+            self._build_hour_of_week_profile(cursor, since, scope)
+            
+            if not self._bulk_loading:
+                self.conn.commit()
+            
+            restaurants = 'all restaurants' if restaurant_ids is None else f"{len(restaurant_ids):,} restaurants"
+            logger.info(f"Rollups built from {since or 'full history'} for {restaurants}")
+        except sqlite3.Error as e:
+            logger.error(f"Error building rollups: {e}")
+            raise
+    
+    def _build_kpi_rollup(self, cursor: sqlite3.Cursor, grain: str, since: str = None, scope: str = ''):
+        """Recompute one grain of restaurant_kpi_rollups, from the period containing `since`; `scope` is an extra SQL filter"""
+        period = ROLLUP_PERIODS[grain]
+        if since:
+            period_start = cursor.execute(f"SELECT {period.format(column='?')}", (since,)).fetchone()[0]
+            cursor.execute(f"DELETE FROM restaurant_kpi_rollups WHERE grain = ? AND period_start >= ?{scope}", (grain, period_start))
+        else:
+            period_start = ''
+            cursor.execute(f"DELETE FROM restaurant_kpi_rollups WHERE grain = ?{scope}", (grain,))
+        
+        # One pass over the hourly rows yields both the per-hour averages used to find the
+        # peak hour and the per-period operational totals
+        cursor.execute(f'''
+        INSERT INTO restaurant_kpi_rollups (
+            restaurant_id, grain, period_start, period_end, days_covered,
+            bookings, cancellations, cancellation_rate, covers, revenue, revenue_per_cover, avg_rating,
+            avg_capacity_utilization, peak_hour_slot, peak_hour_utilization,
+            online_bookings, offline_bookings, overbooking_incidents, underbooking_slots, avg_service_delay_minutes
+        )
+        WITH hourly AS (
+            SELECT restaurant_id, {period.format(column='date')} AS period_start, hour_slot,
+                   COUNT(*) AS slots,
+                   SUM(capacity_utilization) AS utilization,
+                   SUM(online_bookings) AS online_bookings,
+                   SUM(offline_bookings) AS offline_bookings,
+                   SUM(overbooking_incidents) AS overbooking_incidents,
+                   SUM(underbooking_slots) AS underbooking_slots,
+                   SUM(service_delay_minutes) AS service_delay_minutes
+            FROM operational_metrics
+            WHERE date >= :period_start{scope}
+            GROUP BY restaurant_id, period_start, hour_slot
+        ),
+        peaks AS (
+            SELECT restaurant_id, period_start, hour_slot, utilization / slots AS utilization,
+                   ROW_NUMBER() OVER (PARTITION BY restaurant_id, period_start ORDER BY utilization / slots DESC, hour_slot) AS peak_rank
+            FROM hourly
+        ),
+        operations AS (
+            SELECT restaurant_id, period_start,
+                   SUM(utilization) / SUM(slots) AS avg_capacity_utilization,
+                   SUM(online_bookings) AS online_bookings,
+                   SUM(offline_bookings) AS offline_bookings,
+                   SUM(overbooking_incidents) AS overbooking_incidents,
+                   SUM(underbooking_slots) AS underbooking_slots,
+                   SUM(service_delay_minutes) / SUM(slots) AS avg_service_delay_minutes
+            FROM hourly
+            GROUP BY restaurant_id, period_start
+        ),
+        metrics AS (
+            SELECT restaurant_id, {period.format(column='date')} AS period_start,
+                   COUNT(*) AS days_covered,
+                   SUM(bookings) AS bookings,
+                   SUM(cancellations) AS cancellations,
+                   SUM(covers) AS covers,
+                   SUM(revenue) AS revenue,
+                   AVG(avg_rating) AS avg_rating
+            FROM restaurant_metrics
+            WHERE date >= :period_start{scope}
+            GROUP BY restaurant_id, period_start
+        )
+        SELECT m.restaurant_id, :grain, m.period_start, {ROLLUP_PERIOD_ENDS[grain].replace('period_start', 'm.period_start')}, m.days_covered,
+               m.bookings, m.cancellations,
+               CASE WHEN m.bookings > 0 THEN ROUND(1.0 * m.cancellations / m.bookings, 4) ELSE 0.0 END,
+               m.covers, ROUND(m.revenue, 2),
+               CASE WHEN m.covers > 0 THEN ROUND(m.revenue / m.covers, 2) ELSE 0.0 END,
+               ROUND(m.avg_rating, 2),
+               ROUND(o.avg_capacity_utilization, 2), p.hour_slot, ROUND(p.utilization, 2),
+               COALESCE(o.online_bookings, 0), COALESCE(o.offline_bookings, 0),
+               COALESCE(o.overbooking_incidents, 0), COALESCE(o.underbooking_slots, 0),
+               ROUND(o.avg_service_delay_minutes, 2)
+        FROM metrics m
+        LEFT JOIN operations o ON o.restaurant_id = m.restaurant_id AND o.period_start = m.period_start
+        LEFT JOIN peaks p ON p.restaurant_id = m.restaurant_id AND p.period_start = m.period_start AND p.peak_rank = 1
+        ''', {'grain': grain, 'period_start': period_start})
+    
+    def _build_hour_of_week_profile(self, cursor: sqlite3.Cursor, since: str = None, scope: str = ''):
+        """Fold hourly rows from `since` on (or the full history) into restaurant_hour_of_week_profile"""
+        if not since:
+            cursor.execute(f"DELETE FROM restaurant_hour_of_week_profile WHERE 1 = 1{scope}")
+        
+        cursor.execute(f'''
+        INSERT INTO restaurant_hour_of_week_profile (
+            restaurant_id, day_of_week, hour_slot, observations,
+            total_capacity_utilization, avg_capacity_utilization, peak_capacity_utilization,
+            total_bookings, avg_bookings, overbooking_incidents, underbooking_slots,
+            total_service_delay_minutes, avg_service_delay_minutes
+        )
+        SELECT restaurant_id, CAST(strftime('%w', date) AS INTEGER) AS day_of_week, hour_slot, COUNT(*),
+               ROUND(SUM(capacity_utilization), 2), ROUND(AVG(capacity_utilization), 2), MAX(capacity_utilization),
+               SUM(online_bookings + offline_bookings), ROUND(AVG(online_bookings + offline_bookings), 2),
+               SUM(overbooking_incidents), SUM(underbooking_slots),
+               ROUND(SUM(service_delay_minutes), 2), ROUND(AVG(service_delay_minutes), 2)
+        FROM operational_metrics
+        WHERE date >= ?{scope}
+        GROUP BY restaurant_id, day_of_week, hour_slot
+        ON CONFLICT(restaurant_id, day_of_week, hour_slot) DO UPDATE SET
+            observations = observations + excluded.observations,
+            total_capacity_utilization = ROUND(total_capacity_utilization + excluded.total_capacity_utilization, 2),
+            avg_capacity_utilization = ROUND((total_capacity_utilization + excluded.total_capacity_utilization) / (observations + excluded.observations), 2),
+            peak_capacity_utilization = MAX(peak_capacity_utilization, excluded.peak_capacity_utilization),
+            total_bookings = total_bookings + excluded.total_bookings,
+            avg_bookings = ROUND(1.0 * (total_bookings + excluded.total_bookings) / (observations + excluded.observations), 2),
+            overbooking_incidents = overbooking_incidents + excluded.overbooking_incidents,
+            underbooking_slots = underbooking_slots + excluded.underbooking_slots,
+            total_service_delay_minutes = ROUND(total_service_delay_minutes + excluded.total_service_delay_minutes, 2),
+            avg_service_delay_minutes = ROUND((total_service_delay_minutes + excluded.total_service_delay_minutes) / (observations + excluded.observations), 2)
+        ''', (since or '',))
+
+    def build_revenue_volatility(self, restaurant_ids: List[str] = None, rebuild: bool = False):
+        """
+        Derive revenue_volatility_tracking from the daily revenue in restaurant_metrics.
+
+        Only the days after each restaurant's revenue_volatility_state row are written: the
+        EWMA carries over from the state, and the trailing revenue and volatility index are
+        read back for the z-score windows and trend slopes. Restaurants without state are
+        computed from their first day. `rebuild` discards the state first; `restaurant_ids`
+        limits the work to those restaurants.
+        """
+        try:
+            cursor = self.conn.cursor()
+            scope = ''
+            if restaurant_ids is not None:
+                cursor.execute("CREATE TEMP TABLE IF NOT EXISTS volatility_scope (restaurant_id TEXT PRIMARY KEY)")
+                cursor.execute("DELETE FROM temp.volatility_scope")
+                cursor.executemany("INSERT INTO temp.volatility_scope VALUES (?)", ((rid,) for rid in restaurant_ids))
+                scope = " AND restaurant_id IN (SELECT restaurant_id FROM temp.volatility_scope)"
+            if rebuild:
+                cursor.execute(f"DELETE FROM revenue_volatility_state WHERE 1 = 1{scope}")
+                cursor.execute(f"DELETE FROM revenue_volatility_tracking WHERE 1 = 1{scope}")
+
+            pending = cursor.execute(f'''
+            SELECT restaurant_id, s.last_date, s.ewma_revenue, s.ewma_variance
+            FROM restaurant_master
+            LEFT JOIN revenue_volatility_state s USING (restaurant_id)
+            WHERE 1 = 1{scope}
+            ORDER BY restaurant_id
+            ''').fetchall()
+
+            cursor.execute("CREATE TEMP TABLE IF NOT EXISTS volatility_batch (restaurant_id TEXT PRIMARY KEY, position INTEGER, last_date DATE)")
+            written = 0
+            for start in range(0, len(pending), VOLATILITY_BATCH_SIZE):
+                written += self._build_volatility_batch(cursor, pending[start:start + VOLATILITY_BATCH_SIZE])
+
+            if not self._bulk_loading:
+                self.conn.commit()
+            logger.info(f"Revenue volatility derived for {written:,} new restaurant-days across {len(pending):,} restaurants")
+        except sqlite3.Error as e:
+            logger.error(f"Error building revenue volatility: {e}")
+            raise
+
+    def _build_volatility_batch(self, cursor: sqlite3.Cursor, pending: List[tuple]) -> int:
+        """Compute and write the new volatility days of one batch of (restaurant_id, last_date, ewma_revenue, ewma_variance) rows"""
+        cursor.execute("DELETE FROM temp.volatility_batch")
+        cursor.executemany("INSERT INTO temp.volatility_batch VALUES (?, ?, ?)",
+                           ((row[0], position, row[1]) for position, row in enumerate(pending)))
+        # Rows come back as (batch position, days since epoch, value) so they convert straight
+        # to arrays. CROSS JOIN keeps the batch as the outer loop: the temp table has no
+        # statistics, and the planner would otherwise scan the whole daily table.
+        revenue_rows = cursor.execute('''
+        SELECT b.position, CAST(strftime('%s', m.date) AS INTEGER) / 86400, m.revenue
+        FROM temp.volatility_batch b
+        CROSS JOIN restaurant_metrics m ON m.restaurant_id = b.restaurant_id AND m.date > COALESCE(date(b.last_date, ?), '')
+        ''', (f"-{VOLATILITY_REVENUE_LOOKBACK_DAYS} days",)).fetchall()
+        if not revenue_rows:
+            return 0
+        index_rows = cursor.execute('''
+        SELECT b.position, CAST(strftime('%s', v.date) AS INTEGER) / 86400, v.revenue_volatility_index
+        FROM temp.volatility_batch b
+        CROSS JOIN revenue_volatility_tracking v ON v.restaurant_id = b.restaurant_id
+            AND v.date > date(b.last_date, ?) AND v.date <= b.last_date
+        ''', (f"-{VOLATILITY_INDEX_LOOKBACK_DAYS} days",)).fetchall()
+
+        # Lay the batch out as a (restaurant x day) grid; missing days stay NaN
+        revenue_rows = np.array(revenue_rows, dtype=float)
+        first_day = int(revenue_rows[:, 1].min())
+        grid_days = np.arange(first_day, int(revenue_rows[:, 1].max()) + 1).astype('datetime64[D]')
+        revenue_grid = np.full((len(pending), len(grid_days)), np.nan)
+        revenue_grid[revenue_rows[:, 0].astype(np.int64), revenue_rows[:, 1].astype(np.int64) - first_day] = revenue_rows[:, 2]
+
+        index_grid = np.full(revenue_grid.shape, np.nan)
+        if index_rows:
+            index_rows = np.array(index_rows, dtype=float)
+            index_rows = index_rows[index_rows[:, 1] >= first_day]
+            index_grid[index_rows[:, 0].astype(np.int64), index_rows[:, 1].astype(np.int64) - first_day] = index_rows[:, 2]
+
+        last_dates = np.array([row[1] or 'NaT' for row in pending], dtype='datetime64[D]')
+        new_days = np.isnat(last_dates)[:, None] | (grid_days[None, :] > last_dates[:, None])
+        processed = new_days & ~np.isnan(revenue_grid)
+        if not processed.any():
+            return 0
+        ewma_mean = np.array([np.nan if row[2] is None else row[2] for row in pending], dtype=float)
+        ewma_variance = np.array([0.0 if row[3] is None else row[3] for row in pending], dtype=float)
+
+        volatility = compute_revenue_volatility(revenue_grid, new_days, ewma_mean, ewma_variance, index_grid)
+
+        # New state first, so the rows written below commit together with it
+        has_new = processed.any(axis=1)
+        last_columns = revenue_grid.shape[1] - 1 - np.argmax(processed[:, ::-1], axis=1)
+        cursor.executemany('''
+        INSERT INTO revenue_volatility_state (restaurant_id, last_date, ewma_revenue, ewma_variance)
+        VALUES (?, ?, ?, ?)
+        ON CONFLICT(restaurant_id) DO UPDATE SET
+            last_date = excluded.last_date,
+            ewma_revenue = excluded.ewma_revenue,
+            ewma_variance = excluded.ewma_variance
+        ''', (
+            (pending[i][0], str(grid_days[last_columns[i]]), float(volatility['ewma_mean'][i]), float(volatility['ewma_variance'][i]))
+            for i in np.flatnonzero(has_new)
+        ))
+
+        new_rows, new_columns = np.nonzero(processed)
+        columns = {
+            'restaurant_id': np.array([row[0] for row in pending])[new_rows],
+            'date': np.datetime_as_string(grid_days[new_columns], unit='D'),
+            'revenue_volatility_index': volatility['volatility_index'][new_rows, new_columns],
+            'anomaly_detected': (volatility['anomaly_category'][new_rows, new_columns] != 'None').astype(np.int64),
+            'anomaly_category': volatility['anomaly_category'][new_rows, new_columns],
+            'volatility_trend_7d': np.round(volatility['volatility_trend_7d'][new_rows, new_columns], 3),
+            'volatility_trend_30d': np.round(volatility['volatility_trend_30d'][new_rows, new_columns], 3)
+        }
+        return self.load_rows('revenue_volatility_tracking', list(columns), _column_rows(columns, list(columns)))
+
+    def optimize_schema(self):
+        """Create the analyst access-pattern indexes and gather planner statistics"""
+        logger.info(f"Creating {len(SCHEMA_INDEXES)} secondary indexes...")
+        
+        try:
+            cursor = self.conn.cursor()
+            for index_name, definition in SCHEMA_INDEXES.items():
+                cursor.execute(f"CREATE INDEX IF NOT EXISTS {index_name} ON {definition}")
+            
+            cursor.execute(f"PRAGMA analysis_limit = {ANALYSIS_LIMIT}")
+            cursor.execute("ANALYZE")
+            self.conn.commit()
+            logger.info("Indexes created and planner statistics gathered (ANALYZE)")
+        except sqlite3.Error as e:
+            logger.error(f"Error optimizing schema: {e}")
+            raise
+    
+    def verify_query_plans(self) -> Dict[str, List[str]]:
+        """
+        Run EXPLAIN QUERY PLAN for every analyst query.
+        
+        Returns the plan of each query that falls back to a full table or index scan
+        (a SCAN step instead of a SEARCH); an empty dict means every query is index-served.
+        """
+        failures = {}
+        cursor = self.conn.cursor()
+        for name, sql, params in ANALYST_QUERIES:
+            plan = [row[3] for row in cursor.execute(f"EXPLAIN QUERY PLAN {sql}", params)]
+            if any(step.startswith('SCAN ') for step in plan):
+                failures[name] = plan
+        return failures
+    
     def generate_mock_restaurants(self) -> List[Dict[str, Any]]:
         """Generate diverse mock restaurant data with different performance personalities"""
         restaurants = [
@@ -403,64 +1074,69 @@ class DatabaseInitializer:
                 'nps_score': 62.0
             }
         ]
+        
+        if self.num_restaurants is None:
+            return restaurants
+        if self.num_restaurants <= len(restaurants):
+            return restaurants[:self.num_restaurants]
+        
+        # Scale-factor mode: keep the hand-crafted restaurants and synthesize the rest
+        return restaurants + self.generate_procedural_restaurants(
+            self.num_restaurants - len(restaurants), start_index=len(restaurants) + 1
+        )
+    
+    def generate_procedural_restaurants(self, count: int, start_index: int = 1) -> List[Dict[str, Any]]:
+        """Procedurally generate restaurants across cities, localities and cuisines using the personality archetypes"""
+        personalities = list(PERSONALITY_CONFIGS)
+        cities = list(CITY_LOCALITIES)
+        restaurants = []
+        
+        for index in range(start_index, start_index + count):
+            restaurant_id = f"R{index:03d}"
+            rng = self._random('restaurant_master', restaurant_id)
+            city = rng.choice(cities)
+            restaurant = {
+                'restaurant_id': restaurant_id,
+                'restaurant_name': f"{rng.choice(RESTAURANT_NAME_PREFIXES)} {rng.choice(RESTAURANT_NAME_SUFFIXES)}",
+                'city': city,
+                'locality': rng.choice(CITY_LOCALITIES[city]),
+                'cuisine': rng.choice(CUISINES),
+                'personality': rng.choice(personalities)
+            }
+            
+            # Profile fields (capacity, NPS, exclusivity, ...) follow the personality rules
+            profile = self.generate_restaurant_profile_extensions([restaurant])[0]
+            restaurant.update(profile)
+            established = datetime.strptime(profile['establishment_date'], '%Y-%m-%d').date()
+            onboarded = established + timedelta(days=rng.randint(0, (self.end_date - established).days))
+            restaurant['onboarded_date'] = onboarded.strftime('%Y-%m-%d')
+            restaurants.append(restaurant)
+        
         return restaurants
     
     def generate_mock_metrics(self, restaurants: List[Dict]) -> List[Dict[str, Any]]:
-        """Generate 30 days of realistic restaurant metrics data based on restaurant personalities"""
+        """Generate the configured window of daily restaurant metrics (30 days by default) based on restaurant personalities"""
         metrics = []
-        end_date = datetime.now().date()
-        start_date = end_date - timedelta(days=30)
-        
-        # Define personality-based performance patterns
-        personality_configs = {
-            'consistent_performer': {
-                'base_bookings': (15, 20), 'booking_variance': 3, 'base_rating': (4.1, 4.3), 
-                'spend_range': (450, 650), 'trend_factor': 0.0, 'volatility': 0.15
-            },
-            'rising_star': {
-                'base_bookings': (8, 15), 'booking_variance': 4, 'base_rating': (4.0, 4.4), 
-                'spend_range': (400, 700), 'trend_factor': 0.8, 'volatility': 0.25
-            },
-            'premium_niche': {
-                'base_bookings': (6, 12), 'booking_variance': 2, 'base_rating': (4.3, 4.7), 
-                'spend_range': (800, 1200), 'trend_factor': 0.1, 'volatility': 0.12
-            },
-            'struggling_veteran': {
-                'base_bookings': (12, 18), 'booking_variance': 5, 'base_rating': (3.8, 4.1), 
-                'spend_range': (350, 550), 'trend_factor': -0.6, 'volatility': 0.35
-            },
-            'volume_player': {
-                'base_bookings': (20, 30), 'booking_variance': 6, 'base_rating': (3.9, 4.2), 
-                'spend_range': (300, 450), 'trend_factor': 0.2, 'volatility': 0.20
-            },
-            'weekend_champion': {
-                'base_bookings': (10, 16), 'booking_variance': 8, 'base_rating': (4.0, 4.3), 
-                'spend_range': (500, 750), 'trend_factor': 0.1, 'volatility': 0.40
-            },
-            'volatile_performer': {
-                'base_bookings': (8, 25), 'booking_variance': 12, 'base_rating': (3.7, 4.5), 
-                'spend_range': (400, 900), 'trend_factor': 0.0, 'volatility': 0.60
-            },
-            'seasonal_specialist': {
-                'base_bookings': (12, 20), 'booking_variance': 5, 'base_rating': (4.1, 4.4), 
-                'spend_range': (600, 800), 'trend_factor': 0.3, 'volatility': 0.30
-            }
-        }
+        end_date = self.end_date
+        start_date = end_date - timedelta(days=self.days)
         
         for restaurant in restaurants:
+            rng = self._random('restaurant_metrics', restaurant['restaurant_id'])
             restaurant_id = restaurant['restaurant_id']
             restaurant_name = restaurant['restaurant_name']
             locality = restaurant['locality']
             cuisine = restaurant['cuisine']
             personality = restaurant['personality']
-            config = personality_configs[personality]
+            config = PERSONALITY_CONFIGS[personality]
             
             # Set base metrics based on personality
-            base_bookings = random.randint(*config['base_bookings'])
-            base_rating = round(random.uniform(*config['base_rating']), 1)
+            base_bookings = rng.randint(*config['base_bookings'])
+            base_rating = round(rng.uniform(*config['base_rating']), 1)
             
+            rng = self._window_random('restaurant_metrics', restaurant, rng)
             current_date = start_date
-            day_count = 0
+            # Trends continue from the restaurant's first loaded day when appending
+            day_count = _window_offset(restaurant, self.window_start)
             
             while current_date <= end_date:
                 day_count += 1
@@ -477,34 +1153,34 @@ class DatabaseInitializer:
                 else:
                     # Apply trend and normal variance
                     trend_effect = (day_count / 30.0) * config['trend_factor']
-                    variance = random.randint(-config['booking_variance'], config['booking_variance'])
+                    variance = rng.randint(-config['booking_variance'], config['booking_variance'])
                     daily_bookings = max(1, int(base_bookings + trend_effect + variance))
                 
                 # Apply volatility for some personalities
-                if personality == 'volatile_performer' and random.random() < 0.15:
+                if personality == 'volatile_performer' and rng.random() < 0.15:
                     # Random spike or drop
-                    daily_bookings = int(daily_bookings * random.uniform(0.3, 2.5))
-                elif personality == 'struggling_veteran' and random.random() < 0.10:
+                    daily_bookings = int(daily_bookings * rng.uniform(0.3, 2.5))
+                elif personality == 'struggling_veteran' and rng.random() < 0.10:
                     # Occasional bad days
                     daily_bookings = max(1, int(daily_bookings * 0.4))
                 
                 # Calculate dependent metrics
-                cancellations = max(0, int(daily_bookings * random.uniform(0.05, 0.18)))
-                covers = daily_bookings * random.randint(2, 4)
+                cancellations = max(0, int(daily_bookings * rng.uniform(0.05, 0.18)))
+                covers = daily_bookings * rng.randint(2, 4)
                 
                 # Spending varies by cuisine and personality
-                base_spend = random.uniform(*config['spend_range'])
+                base_spend = rng.uniform(*config['spend_range'])
                 if cuisine == 'Japanese':
                     base_spend *= 1.2  # Premium cuisine
                 elif cuisine == 'American':
                     base_spend *= 0.9  # Fast casual
                 
-                avg_spend = round(base_spend * random.uniform(0.85, 1.15), 2)
+                avg_spend = round(base_spend * rng.uniform(0.85, 1.15), 2)
                 revenue = covers * avg_spend
                 
                 # Rating with personality influence
                 rating_variance = config['volatility'] * 0.5
-                rating = max(1.0, min(5.0, base_rating + random.uniform(-rating_variance, rating_variance)))
+                rating = max(1.0, min(5.0, base_rating + rng.uniform(-rating_variance, rating_variance)))
                 
                 metrics.append({
                     'restaurant_id': restaurant_id,
@@ -530,30 +1206,31 @@ class DatabaseInitializer:
         campaign_types = ['visibility_boost', 'weekend_special', 'lunch_deals', 'dinner_prime']
         
         for restaurant in restaurants:
+            rng = self._random('ads_data', restaurant['restaurant_id'])
             restaurant_id = restaurant['restaurant_id']
             # Generate 2-4 campaigns per restaurant
-            num_campaigns = random.randint(2, 4)
+            num_campaigns = rng.randint(2, 4)
             
             for i in range(num_campaigns):
-                campaign_type = random.choice(campaign_types)
+                campaign_type = rng.choice(campaign_types)
                 campaign_id = f"C{restaurant_id[-3:]}_{i+1:02d}_{campaign_type[:4]}"
                 
                 # Random campaign duration (7-30 days)
-                duration = random.randint(7, 30)
-                end_date = datetime.now().date() - timedelta(days=random.randint(1, 10))
+                duration = rng.randint(7, 30)
+                end_date = self.end_date - timedelta(days=rng.randint(1, 10))
                 start_date = end_date - timedelta(days=duration)
                 
-                impressions = random.randint(15000, 50000)
-                clicks = int(impressions * random.uniform(0.05, 0.12))  # 5-12% CTR
-                conversions = int(clicks * random.uniform(0.06, 0.15))  # 6-15% conversion
-                spend = round(random.uniform(3000, 8000), 2)
-                revenue_generated = round(conversions * random.uniform(80, 150), 2)
+                impressions = rng.randint(15000, 50000)
+                clicks = int(impressions * rng.uniform(0.05, 0.12))  # 5-12% CTR
+                conversions = int(clicks * rng.uniform(0.06, 0.15))  # 6-15% conversion
+                spend = round(rng.uniform(3000, 8000), 2)
+                revenue_generated = round(conversions * rng.uniform(80, 150), 2)
                 
                 # Financial details (previously separate table)
-                total_investment = spend * random.uniform(1.1, 1.5)  # Investment is usually higher than actual spend
+                total_investment = spend * rng.uniform(1.1, 1.5)  # Investment is usually higher than actual spend
                 fund_consumption_rate = round(spend / total_investment, 3)
-                yoy_funding_change = round(random.uniform(-20.0, 45.0), 1)  # Year-over-year change %
-                mom_funding_change = round(random.uniform(-15.0, 25.0), 1)  # Month-over-month change %
+                yoy_funding_change = round(rng.uniform(-20.0, 45.0), 1)  # Year-over-year change %
+                mom_funding_change = round(rng.uniform(-15.0, 25.0), 1)  # Month-over-month change %
                 
                 ads_data.append({
                     'restaurant_id': restaurant_id,
@@ -574,23 +1251,24 @@ class DatabaseInitializer:
         
         return ads_data
     
-    def generate_mock_peer_benchmarks(self) -> List[Dict[str, Any]]:
+    def generate_mock_peer_benchmarks(self, localities: List[str] = None, cuisines: List[str] = None) -> List[Dict[str, Any]]:
         """Generate mock peer benchmark data"""
-        localities = ['Koramangala', 'Indiranagar', 'Bandra', 'Connaught Place', 'Khan Market', 'Whitefield']
-        cuisines = ['Indian', 'Italian', 'Japanese', 'American', 'Chinese', 'Continental', 'Seafood']
+        localities = localities or BASELINE_LOCALITIES
+        cuisines = cuisines or BASELINE_CUISINES
         
         benchmarks = []
+        rng = self._random('peer_benchmarks')
         for locality in localities:
             for cuisine in cuisines:
                 benchmarks.append({
                     'locality': locality,
                     'cuisine': cuisine,
-                    'avg_bookings': round(random.uniform(12, 20), 1),
-                    'avg_conversion_rate': round(random.uniform(0.07, 0.12), 3),
-                    'avg_ads_spend': round(random.uniform(4000, 7000), 2),
-                    'avg_roi': round(random.uniform(2.2, 3.8), 1),
-                    'avg_revenue': round(random.uniform(150000, 250000), 2),
-                    'avg_rating': round(random.uniform(4.0, 4.5), 1)
+                    'avg_bookings': round(rng.uniform(12, 20), 1),
+                    'avg_conversion_rate': round(rng.uniform(0.07, 0.12), 3),
+                    'avg_ads_spend': round(rng.uniform(4000, 7000), 2),
+                    'avg_roi': round(rng.uniform(2.2, 3.8), 1),
+                    'avg_revenue': round(rng.uniform(150000, 250000), 2),
+                    'avg_rating': round(rng.uniform(4.0, 4.5), 1)
                 })
         
         return benchmarks
@@ -601,22 +1279,23 @@ class DatabaseInitializer:
         discount_types = ['Flat', 'Tiered', 'Combo', 'Happy Hour']
         
         for restaurant in restaurants:
+            rng = self._random('discount_history', restaurant['restaurant_id'])
             restaurant_id = restaurant['restaurant_id']
             # Generate 1-3 discount periods per restaurant
-            num_periods = random.randint(1, 3)
+            num_periods = rng.randint(1, 3)
             
             for i in range(num_periods):
-                duration = random.randint(14, 45)  # 2-6 weeks
-                end_date = datetime.now().date() - timedelta(days=random.randint(1, 30))
+                duration = rng.randint(14, 45)  # 2-6 weeks
+                end_date = self.end_date - timedelta(days=rng.randint(1, 30))
                 start_date = end_date - timedelta(days=duration)
                 
                 discount_data.append({
                     'restaurant_id': restaurant_id,
                     'start_date': start_date.strftime('%Y-%m-%d'),
                     'end_date': end_date.strftime('%Y-%m-%d'),
-                    'discount_type': random.choice(discount_types),
-                    'discount_percent': round(random.uniform(5, 25), 1),
-                    'roi_from_discount': round(random.uniform(2.0, 4.2), 1)
+                    'discount_type': rng.choice(discount_types),
+                    'discount_percent': round(rng.uniform(5, 25), 1),
+                    'roi_from_discount': round(rng.uniform(2.0, 4.2), 1)
                 })
         
         return discount_data
@@ -626,6 +1305,7 @@ class DatabaseInitializer:
         profile_extensions = []
         
         for restaurant in restaurants:
+            rng = self._random('restaurant_profile', restaurant['restaurant_id'])
             restaurant_id = restaurant['restaurant_id']
             personality = restaurant['personality']
             cuisine = restaurant['cuisine']
@@ -635,35 +1315,35 @@ class DatabaseInitializer:
                 veg_type = 'Non-Veg' if cuisine == 'Japanese' else 'Both'
                 exclusivity = 'Exclusive'
                 parent_type = 'Independent'
-                capacity = random.randint(20, 40)
-                nps = random.randint(65, 85)
-                establishment_date = (datetime.now().date() - timedelta(days=random.randint(1095, 2555))).strftime('%Y-%m-%d')
+                capacity = rng.randint(20, 40)
+                nps = rng.randint(65, 85)
+                establishment_date = (self.end_date - timedelta(days=rng.randint(1095, 2555))).strftime('%Y-%m-%d')
             elif personality == 'volume_player':
                 veg_type = 'Both'
                 exclusivity = 'Non-Exclusive'
                 parent_type = 'Franchise'
-                capacity = random.randint(80, 150)
-                nps = random.randint(35, 55)
-                establishment_date = (datetime.now().date() - timedelta(days=random.randint(730, 1825))).strftime('%Y-%m-%d')
+                capacity = rng.randint(80, 150)
+                nps = rng.randint(35, 55)
+                establishment_date = (self.end_date - timedelta(days=rng.randint(730, 1825))).strftime('%Y-%m-%d')
             elif personality == 'rising_star':
                 veg_type = 'Both'
                 exclusivity = 'Exclusive'
                 parent_type = 'Independent'
-                capacity = random.randint(40, 70)
-                nps = random.randint(55, 75)
-                establishment_date = (datetime.now().date() - timedelta(days=random.randint(180, 720))).strftime('%Y-%m-%d')
+                capacity = rng.randint(40, 70)
+                nps = rng.randint(55, 75)
+                establishment_date = (self.end_date - timedelta(days=rng.randint(180, 720))).strftime('%Y-%m-%d')
             else:
-                veg_type = random.choice(['Veg', 'Non-Veg', 'Both'])
-                exclusivity = random.choice(['Exclusive', 'Non-Exclusive'])
-                parent_type = random.choice(['Franchise', 'Brand-Owned', 'Independent'])
-                capacity = random.randint(30, 80)
-                nps = random.randint(40, 70)
-                establishment_date = (datetime.now().date() - timedelta(days=random.randint(365, 2190))).strftime('%Y-%m-%d')
+                veg_type = rng.choice(['Veg', 'Non-Veg', 'Both'])
+                exclusivity = rng.choice(['Exclusive', 'Non-Exclusive'])
+                parent_type = rng.choice(['Franchise', 'Brand-Owned', 'Independent'])
+                capacity = rng.randint(30, 80)
+                nps = rng.randint(40, 70)
+                establishment_date = (self.end_date - timedelta(days=rng.randint(365, 2190))).strftime('%Y-%m-%d')
             
             profile_extensions.append({
                 'restaurant_id': restaurant_id,
                 'veg_nonveg_type': veg_type,
-                'online_order_enabled': random.choice([0, 1]),
+                'online_order_enabled': rng.choice([0, 1]),
                 'establishment_date': establishment_date,
                 'exclusivity_status': exclusivity,
                 'parent_type': parent_type,
@@ -674,24 +1354,23 @@ class DatabaseInitializer:
         return profile_extensions
     
     def generate_operational_metrics(self, restaurants: List[Dict]) -> List[Dict[str, Any]]:
-        """Generate hourly operational metrics for last 30 days"""
+        """Generate hourly operational metrics for the configured window (last 30 days by default)"""
         operational_data = []
-        end_date = datetime.now().date()
-        start_date = end_date - timedelta(days=30)
-        
-        # Operating hours: 12 PM to 11 PM (12-23)
-        operating_hours = list(range(12, 24))
+        end_date = self.end_date
+        start_date = end_date - timedelta(days=self.days)
         
         for restaurant in restaurants:
+            rng = self._random('operational_metrics', restaurant['restaurant_id'])
             restaurant_id = restaurant['restaurant_id']
             personality = restaurant['personality']
-            capacity = random.randint(30, 100)  # Base capacity for calculations
+            capacity = rng.randint(30, 100)  # Base capacity for calculations
             
+            rng = self._window_random('operational_metrics', restaurant, rng)
             current_date = start_date
             while current_date <= end_date:
-                for hour in operating_hours:
+                for hour in OPERATING_HOURS:
                     # Peak hours: 1-3 PM and 7-9 PM
-                    is_peak = hour in [13, 14, 15, 19, 20, 21]
+                    is_peak = hour in PEAK_HOURS
                     is_weekend = current_date.weekday() >= 5
                     
                     # Base utilization varies by personality and time
@@ -705,19 +1384,19 @@ class DatabaseInitializer:
                         base_utilization = 70 if is_peak else 40
                     
                     # Add randomness
-                    utilization = max(0, min(100, base_utilization + random.randint(-15, 15)))
+                    utilization = max(0, min(100, base_utilization + rng.randint(-15, 15)))
                     
                     # Calculate other metrics based on utilization
-                    online_bookings = int(utilization * 0.4 * random.uniform(0.7, 1.3))
-                    offline_bookings = int(utilization * 0.6 * random.uniform(0.7, 1.3))
+                    online_bookings = int(utilization * 0.4 * rng.uniform(0.7, 1.3))
+                    offline_bookings = int(utilization * 0.6 * rng.uniform(0.7, 1.3))
                     
                     # Overbooking incidents (rare but realistic)
-                    overbooking = 1 if utilization > 90 and random.random() < 0.1 else 0
+                    overbooking = 1 if utilization > 90 and rng.random() < 0.1 else 0
                     underbooking = max(0, capacity - online_bookings - offline_bookings) if utilization < 50 else 0
                     
                     # Service delays increase with utilization
                     delay_factor = max(0, (utilization - 60) / 40)
-                    service_delay = random.uniform(0, 15) * delay_factor
+                    service_delay = rng.uniform(0, 15) * delay_factor
                     
                     operational_data.append({
                         'restaurant_id': restaurant_id,
@@ -738,47 +1417,47 @@ class DatabaseInitializer:
     def generate_service_quality_data(self, restaurants: List[Dict]) -> List[Dict[str, Any]]:
         """Generate daily service quality tracking data"""
         quality_data = []
-        end_date = datetime.now().date()
-        start_date = end_date - timedelta(days=30)
-        
-        complaint_categories = ['Food Quality', 'Service Speed', 'Staff Behavior', 'Cleanliness', 'Billing Issues']
+        end_date = self.end_date
+        start_date = end_date - timedelta(days=self.days)
         
         for restaurant in restaurants:
+            rng = self._random('service_quality_tracking', restaurant['restaurant_id'])
             restaurant_id = restaurant['restaurant_id']
             personality = restaurant['personality']
             
             # Base service levels vary by personality
             if personality == 'premium_niche':
-                base_service_rating = random.uniform(4.3, 4.7)
+                base_service_rating = rng.uniform(4.3, 4.7)
                 complaints_rate = 0.02
             elif personality == 'struggling_veteran':
-                base_service_rating = random.uniform(3.5, 3.9)
+                base_service_rating = rng.uniform(3.5, 3.9)
                 complaints_rate = 0.08
             else:
-                base_service_rating = random.uniform(3.8, 4.4)
+                base_service_rating = rng.uniform(3.8, 4.4)
                 complaints_rate = 0.04
             
+            rng = self._window_random('service_quality_tracking', restaurant, rng)
             current_date = start_date
             while current_date <= end_date:
                 # Daily review volume based on restaurant size
-                reviews_count = random.randint(2, 15)
+                reviews_count = rng.randint(2, 15)
                 
                 # Service rating with daily variation
-                service_rating = max(1.0, min(5.0, base_service_rating + random.uniform(-0.4, 0.4)))
+                service_rating = max(1.0, min(5.0, base_service_rating + rng.uniform(-0.4, 0.4)))
                 
                 # Complaints based on service level
-                complaints = max(0, int(reviews_count * complaints_rate * random.uniform(0.5, 1.5)))
+                complaints = max(0, int(reviews_count * complaints_rate * rng.uniform(0.5, 1.5)))
                 
                 # Resolution time varies by restaurant efficiency
                 if personality == 'premium_niche':
-                    resolution_time = random.uniform(2, 8)
+                    resolution_time = rng.uniform(2, 8)
                 elif personality == 'struggling_veteran':
-                    resolution_time = random.uniform(12, 48)
+                    resolution_time = rng.uniform(12, 48)
                 else:
-                    resolution_time = random.uniform(4, 24)
+                    resolution_time = rng.uniform(4, 24)
                 
                 # Select complaint categories
-                selected_categories = random.sample(complaint_categories, min(complaints, len(complaint_categories)))
+                selected_categories = rng.sample(COMPLAINT_CATEGORIES, min(complaints, len(COMPLAINT_CATEGORIES)))
                 
                 quality_data.append({
                     'restaurant_id': restaurant_id,
@@ -801,17 +1480,18 @@ class DatabaseInitializer:
         campaign_categories = ['Brand Awareness', 'Revenue Drive', 'Customer Acquisition', 'Retention']
         
         for ad in ads_data:
+            rng = self._random('campaign_financial_details', f"{ad['restaurant_id']}/{ad['campaign_id']}")
             spend = ad['spend']
             
             # Total investment is usually 10-30% higher than actual spend
-            total_investment = spend * random.uniform(1.1, 1.3)
+            total_investment = spend * rng.uniform(1.1, 1.3)
             
             # Fund consumption rate
             consumption_rate = spend / total_investment if total_investment > 0 else 0
             
             # YoY and MoM changes (simulated)
-            yoy_change = random.uniform(-25, 40)  # -25% to +40%
-            mom_change = random.uniform(-15, 25)  # -15% to +25%
+            yoy_change = rng.uniform(-25, 40)  # -25% to +40%
+            mom_change = rng.uniform(-15, 25)  # -15% to +25%
             
             financial_details.append({
                 'restaurant_id': ad['restaurant_id'],
@@ -820,7 +1500,7 @@ class DatabaseInitializer:
                 'fund_consumption_rate': round(consumption_rate, 3),
                 'yoy_funding_change': round(yoy_change, 1),
                 'mom_funding_change': round(mom_change, 1),
-                'campaign_category': random.choice(campaign_categories)
+                'campaign_category': rng.choice(campaign_categories)
             })
         
         return financial_details
@@ -828,41 +1508,42 @@ class DatabaseInitializer:
     def generate_financial_settlements(self, restaurants: List[Dict]) -> List[Dict[str, Any]]:
         """Generate financial settlement records"""
         settlement_data = []
-        end_date = datetime.now().date()
+        end_date = self.end_date
         start_date = end_date - timedelta(days=90)  # 3 months of settlement history
         
         settlement_types = ['Commission', 'Refund', 'Penalty', 'Bonus']
         
         for restaurant in restaurants:
+            rng = self._random('financial_settlements', restaurant['restaurant_id'])
             restaurant_id = restaurant['restaurant_id']
             personality = restaurant['personality']
             
             # Number of settlements varies by restaurant type
             if personality == 'volume_player':
-                num_settlements = random.randint(8, 15)
+                num_settlements = rng.randint(8, 15)
             elif personality == 'premium_niche':
-                num_settlements = random.randint(3, 8)
+                num_settlements = rng.randint(3, 8)
             else:
-                num_settlements = random.randint(5, 12)
+                num_settlements = rng.randint(5, 12)
             
             for _ in range(num_settlements):
-                settlement_date = start_date + timedelta(days=random.randint(0, 90))
-                settlement_type = random.choice(settlement_types)
+                settlement_date = start_date + timedelta(days=rng.randint(0, 90))
+                settlement_type = rng.choice(settlement_types)
                 
                 if settlement_type == 'Commission':
-                    amount = random.uniform(5000, 25000)
-                    processing_days = random.randint(2, 7)
+                    amount = rng.uniform(5000, 25000)
+                    processing_days = rng.randint(2, 7)
                 elif settlement_type == 'Refund':
-                    amount = random.uniform(500, 5000)
-                    processing_days = random.randint(1, 5)
+                    amount = rng.uniform(500, 5000)
+                    processing_days = rng.randint(1, 5)
                 elif settlement_type == 'Penalty':
-                    amount = random.uniform(200, 2000)
-                    processing_days = random.randint(1, 3)
+                    amount = rng.uniform(200, 2000)
+                    processing_days = rng.randint(1, 3)
                 else:  # Bonus
-                    amount = random.uniform(1000, 8000)
-                    processing_days = random.randint(3, 10)
+                    amount = rng.uniform(1000, 8000)
+                    processing_days = rng.randint(3, 10)
                 
-                outstanding = random.uniform(0, amount * 0.2) if random.random() < 0.2 else 0
+                outstanding = rng.uniform(0, amount * 0.2) if rng.random() < 0.2 else 0
                 
                 settlement_data.append({
                     'restaurant_id': restaurant_id,
@@ -875,12 +1556,13 @@ class DatabaseInitializer:
         
         return settlement_data
     
-    def generate_competitive_intelligence(self) -> List[Dict[str, Any]]:
+    def generate_competitive_intelligence(self, localities: List[str] = None, cuisines: List[str] = None) -> List[Dict[str, Any]]:
         """Generate competitive intelligence data"""
         competitive_data = []
+        rng = self._random('competitive_intelligence')
         
-        localities = ['Koramangala', 'Indiranagar', 'Bandra', 'Connaught Place', 'Khan Market', 'Whitefield']
-        cuisines = ['Indian', 'Italian', 'Japanese', 'American', 'Chinese', 'Continental', 'Seafood']
+        localities = localities or BASELINE_LOCALITIES
+        cuisines = cuisines or BASELINE_CUISINES
         capacity_ranges = ['Small (1-30)', 'Medium (31-80)', 'Large (81+)']
         price_positions = ['Premium', 'Mid-Range', 'Budget']
         
@@ -889,23 +1571,23 @@ class DatabaseInitializer:
                 for capacity_range in capacity_ranges:
                     # Market characteristics vary by locality and cuisine
                     if locality in ['Bandra', 'Khan Market'] and cuisine == 'Japanese':
-                        competitor_count = random.randint(8, 15)
-                        market_share = random.uniform(5, 15)
-                        avg_rating = random.uniform(4.2, 4.6)
+                        competitor_count = rng.randint(8, 15)
+                        market_share = rng.uniform(5, 15)
+                        avg_rating = rng.uniform(4.2, 4.6)
                         price_pos = 'Premium'
-                        competitive_score = random.uniform(7, 9)
+                        competitive_score = rng.uniform(7, 9)
                     elif capacity_range == 'Large (81+)' and cuisine == 'American':
-                        competitor_count = random.randint(12, 25)
-                        market_share = random.uniform(8, 20)
-                        avg_rating = random.uniform(3.8, 4.2)
+                        competitor_count = rng.randint(12, 25)
+                        market_share = rng.uniform(8, 20)
+                        avg_rating = rng.uniform(3.8, 4.2)
                         price_pos = 'Mid-Range'
-                        competitive_score = random.uniform(5, 7)
+                        competitive_score = rng.uniform(5, 7)
                     else:
-                        competitor_count = random.randint(5, 20)
-                        market_share = random.uniform(3, 25)
-                        avg_rating = random.uniform(3.5, 4.5)
-                        price_pos = random.choice(price_positions)
-                        competitive_score = random.uniform(4, 8)
+                        competitor_count = rng.randint(5, 20)
+                        market_share = rng.uniform(3, 25)
+                        avg_rating = rng.uniform(3.5, 4.5)
+                        price_pos = rng.choice(price_positions)
+                        competitive_score = rng.uniform(4, 8)
                     
                     competitive_data.append({
                         'locality': locality,
@@ -920,63 +1602,10 @@ class DatabaseInitializer:
         
         return competitive_data
     
-    def generate_revenue_volatility_tracking(self, restaurants: List[Dict]) -> List[Dict[str, Any]]:
-        """Generate revenue volatility and anomaly detection data"""
-        volatility_data = []
-        end_date = datetime.now().date()
-        start_date = end_date - timedelta(days=30)
-        
-        anomaly_categories = ['Sudden_Drop', 'Revenue_Spike', 'Irregular_Pattern', 'None']
-        
-        for restaurant in restaurants:
-            restaurant_id = restaurant['restaurant_id']
-            personality = restaurant['personality']
-            
-            # Base volatility varies by personality
-            if personality == 'volatile_performer':
-                base_volatility = random.uniform(0.6, 0.9)
-                anomaly_probability = 0.25
-            elif personality == 'consistent_performer':
-                base_volatility = random.uniform(0.1, 0.3)
-                anomaly_probability = 0.05
-            elif personality == 'struggling_veteran':
-                base_volatility = random.uniform(0.4, 0.7)
-                anomaly_probability = 0.15
-            else:
-                base_volatility = random.uniform(0.2, 0.5)
-                anomaly_probability = 0.10
-            
-            current_date = start_date
-            while current_date <= end_date:
-                # Daily volatility index
-                volatility_index = max(0, base_volatility + random.uniform(-0.2, 0.2))
-                
-                # Anomaly detection
-                is_anomaly = random.random() < anomaly_probability
-                anomaly_category = random.choice(anomaly_categories[:-1]) if is_anomaly else 'None'
-                
-                # Trend calculations (simplified)
-                trend_7d = random.uniform(-0.3, 0.3)
-                trend_30d = random.uniform(-0.5, 0.5)
-                
-                volatility_data.append({
-                    'restaurant_id': restaurant_id,
-                    'date': current_date.strftime('%Y-%m-%d'),
-                    'revenue_volatility_index': round(volatility_index, 3),
-                    'anomaly_detected': 1 if is_anomaly else 0,
-                    'anomaly_category': anomaly_category,
-                    'volatility_trend_7d': round(trend_7d, 3),
-                    'volatility_trend_30d': round(trend_30d, 3)
-                })
-                
-                current_date += timedelta(days=1)
-        
-        return volatility_data
-    
     def generate_performance_feedback(self, restaurants: List[Dict]) -> List[Dict[str, Any]]:
         """Generate sales team feedback data"""
         feedback_data = []
-        end_date = datetime.now().date()
+        end_date = self.end_date
         
         feedback_notes_templates = [
             "Strong performance this quarter, exceeding targets",
@@ -998,32 +1627,33 @@ class DatabaseInitializer:
         ]
         
         for restaurant in restaurants:
+            rng = self._random('performance_feedback_loop', restaurant['restaurant_id'])
             restaurant_id = restaurant['restaurant_id']
             personality = restaurant['personality']
             
             # Generate 2-4 feedback records per restaurant
-            num_feedback = random.randint(2, 4)
+            num_feedback = rng.randint(2, 4)
             
             for i in range(num_feedback):
-                feedback_date = end_date - timedelta(days=random.randint(1, 90))
+                feedback_date = end_date - timedelta(days=rng.randint(1, 90))
                 
                 # Rating based on personality
                 if personality == 'rising_star':
                     sales_rating = 'Positive'
-                    prr_score = random.uniform(7, 9)
-                    nrr_score = random.uniform(110, 150)
+                    prr_score = rng.uniform(7, 9)
+                    nrr_score = rng.uniform(110, 150)
                 elif personality == 'struggling_veteran':
                     sales_rating = 'Negative'
-                    prr_score = random.uniform(3, 5)
-                    nrr_score = random.uniform(70, 95)
+                    prr_score = rng.uniform(3, 5)
+                    nrr_score = rng.uniform(70, 95)
                 elif personality == 'premium_niche':
                     sales_rating = 'Positive'
-                    prr_score = random.uniform(8, 10)
-                    nrr_score = random.uniform(120, 160)
+                    prr_score = rng.uniform(8, 10)
+                    nrr_score = rng.uniform(120, 160)
                 else:
-                    sales_rating = random.choice(['Positive', 'Neutral', 'Negative'])
-                    prr_score = random.uniform(5, 8)
-                    nrr_score = random.uniform(90, 130)
+                    sales_rating = rng.choice(['Positive', 'Neutral', 'Negative'])
+                    prr_score = rng.uniform(5, 8)
+                    nrr_score = rng.uniform(90, 130)
                 
                 feedback_data.append({
                     'restaurant_id': restaurant_id,
@@ -1031,8 +1661,8 @@ class DatabaseInitializer:
                     'sales_team_rating': sales_rating,
                     'prr_score': round(prr_score, 1),
                     'nrr_score': round(nrr_score, 1),
-                    'feedback_notes': random.choice(feedback_notes_templates),
-                    'action_items': random.choice(action_items_templates)
+                    'feedback_notes': rng.choice(feedback_notes_templates),
+                    'action_items': rng.choice(action_items_templates)
                 })
         
         return feedback_data
@@ -1043,9 +1673,10 @@ class DatabaseInitializer:
         
         kpi_types = ['Revenue', 'Bookings', 'Rating', 'ROI', 'Conversion_Rate']
         goal_phases = ['Q1', 'Q2', 'Q3', 'Q4']
-        current_year = datetime.now().year
+        current_year = self.end_date.year
         
         for restaurant in restaurants:
+            rng = self._random('kpi_goals_tracking', restaurant['restaurant_id'])
             restaurant_id = restaurant['restaurant_id']
             personality = restaurant['personality']
             
@@ -1056,34 +1687,34 @@ class DatabaseInitializer:
                     # Set targets based on personality and KPI type
                     if kpi_type == 'Revenue':
                         if personality == 'volume_player':
-                            target = random.uniform(200000, 350000)
-                            actual = target * random.uniform(0.8, 1.2)
+                            target = rng.uniform(200000, 350000)
+                            actual = target * rng.uniform(0.8, 1.2)
                         elif personality == 'premium_niche':
-                            target = random.uniform(150000, 250000)
-                            actual = target * random.uniform(0.9, 1.15)
+                            target = rng.uniform(150000, 250000)
+                            actual = target * rng.uniform(0.9, 1.15)
                         else:
-                            target = random.uniform(100000, 200000)
-                            actual = target * random.uniform(0.7, 1.3)
+                            target = rng.uniform(100000, 200000)
+                            actual = target * rng.uniform(0.7, 1.3)
                     
                     elif kpi_type == 'Bookings':
                         if personality == 'volume_player':
-                            target = random.uniform(600, 900)
-                            actual = target * random.uniform(0.8, 1.2)
+                            target = rng.uniform(600, 900)
+                            actual = target * rng.uniform(0.8, 1.2)
                         else:
-                            target = random.uniform(300, 600)
-                            actual = target * random.uniform(0.7, 1.3)
+                            target = rng.uniform(300, 600)
+                            actual = target * rng.uniform(0.7, 1.3)
                     
                     elif kpi_type == 'Rating':
-                        target = random.uniform(4.0, 4.5)
-                        actual = target + random.uniform(-0.3, 0.3)
+                        target = rng.uniform(4.0, 4.5)
+                        actual = target + rng.uniform(-0.3, 0.3)
                     
                     elif kpi_type == 'ROI':
-                        target = random.uniform(2.5, 4.0)
-                        actual = target * random.uniform(0.6, 1.4)
+                        target = rng.uniform(2.5, 4.0)
+                        actual = target * rng.uniform(0.6, 1.4)
                     
                     else:  # Conversion_Rate
-                        target = random.uniform(0.08, 0.15)
-                        actual = target * random.uniform(0.7, 1.3)
+                        target = rng.uniform(0.08, 0.15)
+                        actual = target * rng.uniform(0.7, 1.3)
                     
                     achievement = (actual / target * 100) if target > 0 else 0
                     
@@ -1099,27 +1730,59 @@ class DatabaseInitializer:
         
         return kpi_data
     
-    def insert_data(self, table_name: str, data: List[Dict[str, Any]]):
-        """Insert data into specified table"""
-        if not data:
-            logger.warning(f"No data to insert into {table_name}")
-            return
+    def load_rows(self, table_name: str, columns: List[str], rows: Iterable[tuple], chunk_size: int = LOAD_CHUNK_SIZE) -> int:
+        """Stream row tuples into a table in fixed-size chunks, returning the number of rows written"""
+        placeholders = ', '.join(['?' for _ in columns])
+        sql = f"INSERT OR REPLACE INTO {table_name} ({', '.join(columns)}) VALUES ({placeholders})"
         
         try:
             cursor = self.conn.cursor()
-            columns = list(data[0].keys())
-            placeholders = ', '.join(['?' for _ in columns])
-            sql = f"INSERT OR REPLACE INTO {table_name} ({', '.join(columns)}) VALUES ({placeholders})"
-            
-            values = [tuple(row[col] for col in columns) for row in data]
-            cursor.executemany(sql, values)
-            self.conn.commit()
+            rows = iter(rows)
+            total = 0
+            while chunk := list(islice(rows, chunk_size)):
+                cursor.executemany(sql, chunk)
+                total += len(chunk)
             
-            logger.info(f"Inserted {len(data)} records into {table_name}")
+            # Inside bulk_load() the single load transaction is committed at the end
+            if not self._bulk_loading:
+                self.conn.commit()
+            return total
         except sqlite3.Error as e:
             logger.error(f"Error inserting data into {table_name}: {e}")
             raise
     
+    def insert_data(self, table_name: str, data: Iterable[Dict[str, Any]]):
+        """Insert data into specified table, streaming rows in fixed-size chunks"""
+        rows = iter(data)
+        first_row = next(rows, None)
+        if first_row is None:
+            logger.warning(f"No data to insert into {table_name}")
+            return
+        
+        columns = list(first_row.keys())
+        values = (tuple(row[col] for col in columns) for row in chain([first_row], rows))
+        count = self.load_rows(table_name, columns, values)
+        
+        logger.info(f"Inserted {count} records into {table_name}")
+    
+    def insert_columns(self, table_name: str, columns: Dict[str, np.ndarray]):
+        """Insert column arrays produced by the vectorized engine into specified table"""
+        self.insert_column_batches(table_name, [columns])
+    
+    def insert_column_batches(self, table_name: str, batches: Iterable[Dict[str, np.ndarray]]):
+        """Stream batches of column arrays into specified table without materializing the whole table"""
+        batches = iter(batches)
+        first_batch = next(batches, None)
+        if not first_batch:
+            logger.warning(f"No data to insert into {table_name}")
+            return
+        
+        columns = list(first_batch.keys())
+        rows = chain.from_iterable(_column_rows(batch, columns) for batch in chain([first_batch], batches))
+        count = self.load_rows(table_name, columns, rows)
+        
+        logger.info(f"Inserted {count} records into {table_name}")
+    
     def initialize_database(self):
         """Main method to initialize the entire database"""
         try:
@@ -1133,114 +1796,664 @@ class DatabaseInitializer:
             # Connect and create tables
             self.connect()
             self.create_tables()
+            self.create_rollup_tables()
+            self.create_watermark_table()
             
             # Generate and insert mock data
             logger.info("Generating comprehensive mock data for all 12 consolidated tables...")
             
             # Core data generation
+            logger.info(f"Generation seed: {self.seed_sequence.entropy} (window ends {self.end_date})")
             restaurants = self.generate_mock_restaurants()
+            logger.info(f"Generating data for {len(restaurants)} restaurants over a {self.days}-day window")
+            logger.info(f"Using '{self.engine}' generation engine for daily and hourly tables")
             
-            # Filter out personality field for database insertion (used only for data generation logic)
-            restaurants_for_db = []
-            for restaurant in restaurants:
-                restaurant_copy = restaurant.copy()
-                restaurant_copy.pop('personality', None)  # Remove personality field
-                restaurants_for_db.append(restaurant_copy)
-            
-            self.insert_data('restaurant_master', restaurants_for_db)
-            
-            metrics = self.generate_mock_metrics(restaurants)
-            self.insert_data('restaurant_metrics', metrics)
-            
-            ads_data = self.generate_mock_ads_data(restaurants)
-            self.insert_data('ads_data', ads_data)
-            
-            peer_benchmarks = self.generate_mock_peer_benchmarks()
-            self.insert_data('peer_benchmarks', peer_benchmarks)
-            
-            discount_history = self.generate_mock_discount_history(restaurants)
-            self.insert_data('discount_history', discount_history)
-            
-            # Extended data generation
-            logger.info("Generating extended business intelligence data...")
-            
-            operational_metrics = self.generate_operational_metrics(restaurants)
-            self.insert_data('operational_metrics', operational_metrics)
-            
-            service_quality = self.generate_service_quality_data(restaurants)
-            self.insert_data('service_quality_tracking', service_quality)
-            
-            financial_settlements = self.generate_financial_settlements(restaurants)
-            self.insert_data('financial_settlements', financial_settlements)
-            
-            competitive_intel = self.generate_competitive_intelligence()
-            self.insert_data('competitive_intelligence', competitive_intel)
-            
-            volatility_tracking = self.generate_revenue_volatility_tracking(restaurants)
-            self.insert_data('revenue_volatility_tracking', volatility_tracking)
-            
-            performance_feedback = self.generate_performance_feedback(restaurants)
-            self.insert_data('performance_feedback_loop', performance_feedback)
+            with self.bulk_load():
+                if self.workers > 1:
+                    logger.info(f"Generating table shards across {self.workers} worker processes")
+                    with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                        self._load_all_tables(restaurants, executor)
+                else:
+                    self._load_all_tables(restaurants)
+                
+                self.build_rollups()
+                self.build_revenue_volatility(rebuild=True)
+                self.record_watermarks(restaurants)
             
-            kpi_goals = self.generate_kpi_goals_tracking(restaurants)
-            self.insert_data('kpi_goals_tracking', kpi_goals)
+            # Indexes are built after the load so inserts do not maintain them row by row
+            self.optimize_schema()
             
             logger.info("Database initialization completed successfully!")
             
-            # Print summary
-            cursor = self.conn.cursor()
-            
-            # Core tables
-            core_tables = ['restaurant_master', 'restaurant_metrics', 'ads_data', 'peer_benchmarks', 'discount_history']
+            self.print_summary()
             
-            # Extended tables
-            extended_tables = [
-                'operational_metrics', 'service_quality_tracking', 'financial_settlements', 
-                'competitive_intelligence', 'revenue_volatility_tracking', 'performance_feedback_loop', 
-                'kpi_goals_tracking'
-            ]
+        except Exception as e:
+            logger.error(f"Database initialization failed: {e}")
+            raise
+        finally:
+            self.close()
+    
+    def append_database(self):
+        """
+        Append the days after each restaurant's watermark, up to end_date, to an existing database.
+        
+        Only the daily and hourly tables grow; their rollups are refreshed from the first
+        appended day and revenue volatility is derived for the new days. Restaurants are
+        processed in groups sharing a watermark, and each group commits its rows, rollups,
+        volatility and new watermark together, so an interrupted run resumes where it stopped.
+        """
+        if not os.path.exists(self.db_path):
+            raise FileNotFoundError(f"Database not found: {self.db_path}")
+        
+        try:
+            logger.info(f"Appending daily data up to {self.end_date}...")
+            self.connect()
+            self.create_rollup_tables()
+            self.create_watermark_table()
             
-            print("\n" + "="*70)
-            print("DATABASE INITIALIZATION SUMMARY")
-            print("="*70)
+            restaurants = self.load_watermarked_restaurants()
+            if not restaurants:
+                raise ValueError(f"No load watermarks in {self.db_path}; run a full initialization first")
             
-            print("\nCORE TABLES (Problem Statement):")
-            print("-" * 40)
-            for table in core_tables:
-                cursor.execute(f"SELECT COUNT(*) FROM {table}")
-                count = cursor.fetchone()[0]
-                print(f"{table:<30}: {count:>8} records")
+            # Appends reuse the seed of the original load so restaurant profiles stay consistent
+            self.seed_sequence = np.random.SeedSequence(int(restaurants[0]['seed_entropy']))
             
-            print("\nEXTENDED TABLES (Business Intelligence):")
-            print("-" * 40)
-            for table in extended_tables:
-                cursor.execute(f"SELECT COUNT(*) FROM {table}")
-                count = cursor.fetchone()[0]
-                print(f"{table:<30}: {count:>8} records")
+            appended_days = 0
+            for last_loaded, group in groupby(sorted(restaurants, key=itemgetter('last_loaded_date')), key=itemgetter('last_loaded_date')):
+                group = list(group)
+                first_day = last_loaded + timedelta(days=1)
+                if first_day > self.end_date:
+                    logger.info(f"{len(group)} restaurants already loaded up to {last_loaded}")
+                    continue
+                
+                # The generators' window is [end_date - days, end_date]
+                self.days = (self.end_date - first_day).days
+                logger.info(f"Appending {first_day} to {self.end_date} for {len(group)} restaurants")
+                with self.bulk_load():
+                    if self.workers > 1:
+                        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                            self._load_sharded_tables(group, executor, DAILY_TABLES)
+                    else:
+                        self._load_sharded_tables(group, tables=DAILY_TABLES)
+                    
+                    restaurant_ids = [r['restaurant_id'] for r in group]
+                    self.build_rollups(since=first_day.isoformat(), restaurant_ids=restaurant_ids)
+                    self.build_revenue_volatility(restaurant_ids=restaurant_ids)
+                    self.record_watermarks(group)
+                appended_days = max(appended_days, self.days + 1)
             
-            # Calculate totals
-            total_records = 0
-            for table in core_tables + extended_tables:
-                cursor.execute(f"SELECT COUNT(*) FROM {table}")
-                total_records += cursor.fetchone()[0]
+            self.conn.execute("PRAGMA optimize")
+            logger.info(f"Append completed: up to {appended_days} new days per restaurant")
             
-            print("\n" + "="*70)
-            print(f"Total Tables: {len(core_tables + extended_tables)} (5 enhanced core + 7 extended)")
-            print(f"Total Records: {total_records:,}")
-            print(f"Database file: {self.db_path}")
-            print("="*70)
+            self.print_summary()
             
         except Exception as e:
-            logger.error(f"Database initialization failed: {e}")
+            logger.error(f"Database append failed: {e}")
             raise
         finally:
             self.close()
+    
+    def _load_all_tables(self, restaurants: List[Dict], executor: ProcessPoolExecutor = None):
+        """Generate every table and stream it into the database through this single writer"""
+        # Filter out personality field for database insertion (used only for data generation logic)
+        restaurants_for_db = []
+        for restaurant in restaurants:
+            restaurant_copy = restaurant.copy()
+            restaurant_copy.pop('personality', None)  # Remove personality field
+            restaurants_for_db.append(restaurant_copy)
+        
+        self.insert_data('restaurant_master', restaurants_for_db)
+        
+        self._load_sharded_tables(restaurants, executor)
+        
+        # Procedural restaurants can land outside the baseline markets, so benchmarks
+        # then cover every locality and cuisine they may be placed in
+        localities, cuisines = None, None
+        if any(r['locality'] not in BASELINE_LOCALITIES or r['cuisine'] not in BASELINE_CUISINES for r in restaurants):
+            localities = [locality for names in CITY_LOCALITIES.values() for locality in names]
+            cuisines = CUISINES
+        
+        peer_benchmarks = self.generate_mock_peer_benchmarks(localities, cuisines)
+        self.insert_data('peer_benchmarks', peer_benchmarks)
+        
+        competitive_intel = self.generate_competitive_intelligence(localities, cuisines)
+        self.insert_data('competitive_intelligence', competitive_intel)
+    
+    def _load_sharded_tables(self, restaurants: List[Dict], executor: ProcessPoolExecutor = None,
+                             tables: Iterable[str] = SHARDED_TABLE_GENERATORS):
+        """Generate the given restaurant-sharded tables and stream them into the database"""
+        # Shard results arrive in submission order, so tables are written one after another
+        for table_name, results in groupby(self._iter_shard_results(restaurants, executor, tables), key=itemgetter(0)):
+            outputs = (output for _, output in results)
+            if self._is_vectorized(table_name):
+                self.insert_column_batches(table_name, outputs)
+            else:
+                self.insert_data(table_name, chain.from_iterable(outputs))
+    
+    def _is_vectorized(self, table_name: str) -> bool:
+        """Whether a table is produced as column arrays by the vectorized engine"""
+        return self.engine == 'numpy' and table_name in VectorizedGenerator.BLOCK_BUILDERS
+    
+    def _iter_shard_results(self, restaurants: List[Dict], executor: ProcessPoolExecutor = None,
+                            tables: Iterable[str] = SHARDED_TABLE_GENERATORS):
+        """
+        Yield (table_name, shard_output) for every restaurant shard of every sharded table.
+        
+        Without an executor shards are generated in-process. With one, at most two
+        shards per worker are in flight so finished results never pile up in memory.
+        """
+        shards = [restaurants[start:start + RESTAURANTS_PER_BATCH] for start in range(0, len(restaurants), RESTAURANTS_PER_BATCH)]
+        # Workers rebuild the same root seed, so their per-restaurant streams match an in-process run
+        config = {'engine': self.engine, 'days': self.days, 'seed': self.seed_sequence.entropy, 'end_date': self.end_date}
+        tasks = ((config, table_name, shard) for table_name in tables for shard in shards)
+        
+        if executor is None:
+            for task in tasks:
+                yield task[1], _generate_shard(*task)
+            return
+        
+        pending = deque()
+        for task in tasks:
+            pending.append((task[1], executor.submit(_generate_shard, *task)))
+            if len(pending) >= self.workers * 2:
+                table_name, future = pending.popleft()
+                yield table_name, future.result()
+        while pending:
+            table_name, future = pending.popleft()
+            yield table_name, future.result()
+    
+    def generate_shard(self, table_name: str, restaurants: List[Dict]):
+        """Generate one table for a shard of restaurants; every restaurant draws from its own substream"""
+        if self._is_vectorized(table_name):
+            vectorized = VectorizedGenerator(self.seed_sequence, days=self.days, end_date=self.end_date)
+            return vectorized.generate_table(table_name, restaurants)
+        
+        return getattr(self, SHARDED_TABLE_GENERATORS[table_name])(restaurants)
+    
+    def print_summary(self):
+        """Print record counts for all tables"""
+        cursor = self.conn.cursor()
+        
+        # Core tables
+        core_tables = ['restaurant_master', 'restaurant_metrics', 'ads_data', 'peer_benchmarks', 'discount_history']
+        
+        # Extended tables
+        extended_tables = [
+            'operational_metrics', 'service_quality_tracking', 'financial_settlements', 
+            'competitive_intelligence', 'revenue_volatility_tracking', 'performance_feedback_loop', 
+            'kpi_goals_tracking'
+        ]
+        
+        print("\n" + "="*70)
+        print("DATABASE INITIALIZATION SUMMARY")
+        print("="*70)
+        
+        print("\nCORE TABLES (Problem Statement):")
+        print("-" * 40)
+        for table in core_tables:
+            cursor.execute(f"SELECT COUNT(*) FROM {table}")
+            count = cursor.fetchone()[0]
+            print(f"{table:<30}: {count:>8} records")
+        
+        print("\nEXTENDED TABLES (Business Intelligence):")
+        print("-" * 40)
+        for table in extended_tables:
+            cursor.execute(f"SELECT COUNT(*) FROM {table}")
+            count = cursor.fetchone()[0]
+            print(f"{table:<30}: {count:>8} records")
+        
+        # Calculate totals
+        total_records = 0
+        for table in core_tables + extended_tables:
+            cursor.execute(f"SELECT COUNT(*) FROM {table}")
+            total_records += cursor.fetchone()[0]
+        
+        print("\nROLLUP TABLES (Pre-aggregated KPIs):")
+        print("-" * 40)
+        for table in ROLLUP_TABLES:
+            cursor.execute(f"SELECT COUNT(*) FROM {table}")
+            count = cursor.fetchone()[0]
+            print(f"{table:<32}: {count:>8} records")
+        
+        print("\n" + "="*70)
+        print(f"Total Tables: {len(core_tables + extended_tables)} (5 enhanced core + 7 extended)")
+        print(f"Total Records: {total_records:,}")
+        print(f"Database file: {self.db_path}")
+        print("="*70)
+
+
+def substream(seed_sequence: np.random.SeedSequence, table_name: str, key: str = '') -> np.random.SeedSequence:
+    """
+    Child SeedSequence for a (table, key) pair.
+    
+    The spawn key is derived from the names rather than from generation order, so a
+    restaurant's data is the same whether it is generated serially, in a worker
+    process, or on its own during partial regeneration.
+    """
+    return np.random.SeedSequence(seed_sequence.entropy, spawn_key=tuple(f"{table_name}/{key}".encode()))
+
+
+def _window_stream_key(restaurant: Dict, window_start: date) -> Optional[str]:
+    """
+    Substream key for the daily draws of an appended window, or None for a restaurant's initial window.
+    
+    Base parameters always come from the restaurant's table stream, so appended days keep
+    the same profile; keying the daily draws by window start keeps appends reproducible
+    without replaying history.
+    """
+    history_start = restaurant.get('history_start')
+    if history_start is None or history_start >= window_start:
+        return None
+    return f"{restaurant['restaurant_id']}@{window_start.isoformat()}"
+
+
+def _window_offset(restaurant: Dict, window_start: date) -> int:
+    """Days between a restaurant's first loaded day and the start of the current window"""
+    history_start = restaurant.get('history_start')
+    return 0 if history_start is None else (window_start - history_start).days
+
+
+def _generate_shard(config: Dict[str, Any], table_name: str, restaurants: List[Dict]):
+    """Process-pool entry point: generate one table shard without touching the database"""
+    return DatabaseInitializer(**config).generate_shard(table_name, restaurants)
+
+
+def _column_rows(columns: Dict[str, np.ndarray], names: List[str], chunk_size: int = LOAD_CHUNK_SIZE) -> Iterator[tuple]:
+    """Yield row tuples from column arrays, converting only one chunk to Python objects at a time"""
+    row_count = len(columns[names[0]])
+    for start in range(0, row_count, chunk_size):
+        # tolist() converts NumPy scalars to native Python types sqlite3 can bind
+        yield from zip(*(columns[name][start:start + chunk_size].tolist() for name in names))
+
+
+def compute_revenue_volatility(revenue: np.ndarray, new_days: np.ndarray, ewma_mean: np.ndarray,
+                               ewma_variance: np.ndarray, volatility_index: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Volatility index, anomaly category and volatility trends for a (restaurant x day) revenue grid.
+
+    The EWMA of revenue and its variance advance one day at a time for all restaurants at
+    once, starting from `ewma_mean` / `ewma_variance` (a NaN mean means no history yet) and
+    only over `new_days`; `volatility_index` holds the already computed index of earlier
+    days. Z-scores, anomaly flags and trend slopes are windowed reductions over every
+    restaurant, evaluated only from the first new day on (flags also over the
+    IRREGULAR_WINDOW_DAYS before it). Missing days are NaN and leave the EWMA unchanged.
+
+    Returns the volatility_index, anomaly_category, volatility_trend_7d and volatility_trend_30d
+    grids (defaults before the first new day), plus the updated per-restaurant ewma_mean and
+    ewma_variance.
+    """
+    alpha = 1 - 0.5 ** (1 / VOLATILITY_EWMA_HALFLIFE_DAYS)
+    ewma_mean, ewma_variance, volatility_index = ewma_mean.copy(), ewma_variance.copy(), volatility_index.copy()
+    observed = ~np.isnan(revenue)
+    updated_days = new_days.any(axis=0)
+    for day in np.flatnonzero(updated_days):
+        update = new_days[:, day] & observed[:, day]
+        first = update & np.isnan(ewma_mean)
+        ewma_mean[first] = revenue[first, day]
+        ewma_variance[first] = 0.0
+        step = update & ~first
+        diff = revenue[step, day] - ewma_mean[step]
+        ewma_mean[step] += alpha * diff
+        ewma_variance[step] = (1 - alpha) * (ewma_variance[step] + alpha * diff * diff)
+        # Rounded as stored, so trends read the same values whether days are new or read back
+        with np.errstate(divide='ignore', invalid='ignore'):
+            volatility_index[update, day] = np.round(
+                np.where(ewma_mean[update] > 0, np.sqrt(ewma_variance[update]) / ewma_mean[update], 0.0), 3
+            )
+
+    first_new = int(np.argmax(updated_days))
+    start = max(first_new - IRREGULAR_WINDOW_DAYS + 1, 0)
+
+    # Robust z-score of each day against the ANOMALY_WINDOW_DAYS before it
+    padded = np.concatenate([np.full((revenue.shape[0], ANOMALY_WINDOW_DAYS), np.nan), revenue], axis=1)
+    windows = np.lib.stride_tricks.sliding_window_view(padded, ANOMALY_WINDOW_DAYS, axis=1)[:, start:-1]
+    median, history = _window_median(windows)
+    mad, _ = _window_median(np.abs(windows - median[..., None]))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        zscore = np.where((history >= ANOMALY_MIN_HISTORY_DAYS) & (mad > 0),
+                          0.6745 * (revenue[:, start:] - median) / mad, np.nan)
+
+    moderate = np.abs(zscore) >= IRREGULAR_Z_THRESHOLD
+    anomaly_category = np.full(revenue.shape, 'None', dtype=object)
+    anomaly_category[:, start:] = np.select(
+        [zscore <= -ANOMALY_Z_THRESHOLD, zscore >= ANOMALY_Z_THRESHOLD,
+         moderate & (_rolling_sum(moderate, IRREGULAR_WINDOW_DAYS) >= IRREGULAR_MIN_DAYS)],
+        ANOMALY_CATEGORIES[:3], 'None'
+    )
+
+    result = {
+        'volatility_index': volatility_index,
+        'anomaly_category': anomaly_category,
+        'ewma_mean': ewma_mean,
+        'ewma_variance': ewma_variance
+    }
+
+    # Least-squares slope of the volatility index per day over each trend window. Positions are
+    # local to the window, so a day's slope is the same however much history the grid holds.
+    for window in VOLATILITY_TREND_WINDOWS:
+        padded = np.concatenate([np.full((revenue.shape[0], window - 1), np.nan), volatility_index], axis=1)
+        windows = np.lib.stride_tricks.sliding_window_view(padded, window, axis=1)[:, first_new:]
+        indexed = ~np.isnan(windows)
+        x = np.arange(window, dtype=float) * indexed
+        y = np.where(indexed, windows, 0.0)
+        n = indexed.sum(axis=2)
+        sum_x, sum_y = x.sum(axis=2), y.sum(axis=2)
+        denominator = n * (x * x).sum(axis=2) - sum_x ** 2
+        trend = np.zeros(revenue.shape)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            trend[:, first_new:] = np.where(
+                (n >= VOLATILITY_TREND_MIN_DAYS) & (denominator > 0),
+                (n * (x * y).sum(axis=2) - sum_x * sum_y) / denominator, 0.0
+            )
+        result[f'volatility_trend_{window}d'] = trend
+    return result
+
+
+def _window_median(windows: np.ndarray):
+    """
+    Median over the last axis ignoring NaN, and the number of values it was taken from.
+
+    np.nanmedian falls back to masked arrays for short windows; sorting moves NaN to
+    the end instead, so the median is read at positions given by each window's count.
+    """
+    ordered = np.sort(windows, axis=-1)
+    count = np.sum(~np.isnan(ordered), axis=-1)
+    low = np.take_along_axis(ordered, np.maximum(count - 1, 0)[..., None] // 2, axis=-1)[..., 0]
+    high = np.take_along_axis(ordered, count[..., None] // 2, axis=-1)[..., 0]
+    return np.where(count > 0, (low + high) / 2, np.nan), count
+
+
+def _rolling_sum(values: np.ndarray, window: int) -> np.ndarray:
+    """Sum of each day and the `window - 1` days before it, along axis 1"""
+    cumulative = np.cumsum(values, axis=1, dtype=float)
+    trailing = np.zeros_like(cumulative)
+    trailing[:, window:] = cumulative[:, :-window]
+    return cumulative - trailing
+
+class VectorizedGenerator:
+    """
+    NumPy generation engine for the high-volume daily and hourly tables.
+    
+    Each table is produced as a dict of column arrays, built one vectorized
+    block per restaurant instead of one dict per row. The personality rules
+    mirror the row-by-row generators on DatabaseInitializer so both engines
+    produce statistically equivalent data.
+    """
+    
+    # Table name -> per-restaurant block builder
+    BLOCK_BUILDERS = {
+        'restaurant_metrics': '_metrics_block',
+        'operational_metrics': '_operational_block',
+        'service_quality_tracking': '_service_quality_block'
+    }
+    
+    def __init__(self, seed_sequence: np.random.SeedSequence = None, days: int = 30, end_date: date = None):
+        self.seed_sequence = seed_sequence if seed_sequence is not None else np.random.SeedSequence()
+        self.days = days
+        end_date = end_date or datetime.now().date()
+        self.window_start = end_date - timedelta(days=days)
+        
+        # Date window covering the last `days` days inclusive
+        dates = np.arange(np.datetime64(self.window_start, 'D'), np.datetime64(end_date, 'D') + np.timedelta64(1, 'D'))
+        self.date_strings = np.datetime_as_string(dates, unit='D')
+        # 1970-01-01 was a Thursday, so shifting by 3 gives Monday=0 like date.weekday()
+        self.weekdays = (dates.astype(np.int64) + 3) % 7
+    
+    @staticmethod
+    def _concat(blocks: List[Dict[str, np.ndarray]]) -> Dict[str, np.ndarray]:
+        """Concatenate per-restaurant column blocks into a single set of column arrays"""
+        if not blocks:
+            return {}
+        return {column: np.concatenate([block[column] for block in blocks]) for column in blocks[0]}
+    
+    def generate_table(self, table_name: str, restaurants: List[Dict]) -> Dict[str, np.ndarray]:
+        """Generate a table for the given restaurants as column arrays"""
+        build_block = getattr(self, self.BLOCK_BUILDERS[table_name])
+        return self._concat([
+            build_block(r, np.random.default_rng(substream(self.seed_sequence, table_name, r['restaurant_id'])))
+            for r in restaurants
+        ])
+    
+    def _window_rng(self, table_name: str, restaurant: Dict, rng: np.random.Generator) -> np.random.Generator:
+        """Generator for a restaurant's daily draws: its table stream for the initial window, a window-keyed one when appending"""
+        key = _window_stream_key(restaurant, self.window_start)
+        return rng if key is None else np.random.default_rng(substream(self.seed_sequence, table_name, key))
+    
+    def iter_batches(self, table_name: str, restaurants: List[Dict],
+                     restaurants_per_batch: int = RESTAURANTS_PER_BATCH) -> Iterator[Dict[str, np.ndarray]]:
+        """Yield a table as column-array batches covering `restaurants_per_batch` restaurants each"""
+        for start in range(0, len(restaurants), restaurants_per_batch):
+            yield self.generate_table(table_name, restaurants[start:start + restaurants_per_batch])
+    
+    def generate_metrics(self, restaurants: List[Dict]) -> Dict[str, np.ndarray]:
+        """Generate the configured window of daily restaurant metrics as column arrays"""
+        return self.generate_table('restaurant_metrics', restaurants)
+    
+    def _metrics_block(self, restaurant: Dict, rng: np.random.Generator) -> Dict[str, np.ndarray]:
+        personality = restaurant['personality']
+        config = PERSONALITY_CONFIGS[personality]
+        date_strings, weekdays = self.date_strings, self.weekdays
+        n = len(date_strings)
+        day_count = np.arange(1, n + 1) + _window_offset(restaurant, self.window_start)
+        
+        base_bookings = int(rng.integers(*config['base_bookings'], endpoint=True))
+        base_rating = round(float(rng.uniform(*config['base_rating'])), 1)
+        rng = self._window_rng('restaurant_metrics', restaurant, rng)
+        
+        if personality == 'weekend_champion':
+            multiplier = np.where(weekdays >= 5, 1.8, 0.7)
+            bookings = np.maximum(1, (base_bookings * multiplier).astype(np.int64))
+        elif personality == 'seasonal_specialist':
+            multiplier = np.where(day_count % 7 < 3, 1.2, 0.9)
+            bookings = np.maximum(1, (base_bookings * multiplier).astype(np.int64))
+        else:
+            trend_effect = (day_count / 30.0) * config['trend_factor']
+            variance = rng.integers(-config['booking_variance'], config['booking_variance'], size=n, endpoint=True)
+            bookings = np.maximum(1, (base_bookings + trend_effect + variance).astype(np.int64))
+        
+        if personality == 'volatile_performer':
+            shocked = rng.random(n) < 0.15
+            bookings = np.where(shocked, (bookings * rng.uniform(0.3, 2.5, n)).astype(np.int64), bookings)
+        elif personality == 'struggling_veteran':
+            bad_day = rng.random(n) < 0.10
+            bookings = np.where(bad_day, np.maximum(1, (bookings * 0.4).astype(np.int64)), bookings)
+        
+        cancellations = (bookings * rng.uniform(0.05, 0.18, n)).astype(np.int64)
+        covers = bookings * rng.integers(2, 4, size=n, endpoint=True)
+        
+        base_spend = rng.uniform(*config['spend_range'], n)
+        if restaurant['cuisine'] == 'Japanese':
+            base_spend *= 1.2
+        elif restaurant['cuisine'] == 'American':
+            base_spend *= 0.9
+        avg_spend = np.round(base_spend * rng.uniform(0.85, 1.15, n), 2)
+        
+        rating_variance = config['volatility'] * 0.5
+        rating = np.clip(base_rating + rng.uniform(-rating_variance, rating_variance, n), 1.0, 5.0)
+        
+        return {
+            'restaurant_id': np.full(n, restaurant['restaurant_id']),
+            'restaurant_name': np.full(n, restaurant['restaurant_name']),
+            'locality': np.full(n, restaurant['locality']),
+            'cuisine': np.full(n, restaurant['cuisine']),
+            'date': date_strings,
+            'bookings': bookings,
+            'cancellations': cancellations,
+            'covers': covers,
+            'avg_spend_per_cover': avg_spend,
+            'revenue': np.round(covers * avg_spend, 2),
+            'avg_rating': np.round(rating, 1)
+        }
+    
+    def generate_operational_metrics(self, restaurants: List[Dict]) -> Dict[str, np.ndarray]:
+        """Generate hourly operational metrics for the configured window as column arrays"""
+        return self.generate_table('operational_metrics', restaurants)
+    
+    def _operational_block(self, restaurant: Dict, rng: np.random.Generator) -> Dict[str, np.ndarray]:
+        personality = restaurant['personality']
+        date_strings, weekdays = self.date_strings, self.weekdays
+        capacity = int(rng.integers(30, 100, endpoint=True))
+        rng = self._window_rng('operational_metrics', restaurant, rng)
+        hours = np.array(OPERATING_HOURS)
+        shape = (len(date_strings), len(hours))
+        
+        # Rows are laid out day-major, hour-minor, like the nested loops of the row engine
+        is_peak = np.isin(hours, PEAK_HOURS)[np.newaxis, :]
+        is_weekend = (weekdays >= 5)[:, np.newaxis]
+        
+        if personality == 'weekend_champion':
+            base_utilization = np.where(is_weekend, 85, 45)
+        elif personality == 'premium_niche':
+            base_utilization = np.where(is_peak, 65, 30)
+        elif personality == 'volume_player':
+            base_utilization = np.where(is_peak, 75, 55)
+        else:
+            base_utilization = np.where(is_peak, 70, 40)
+        
+        utilization = np.clip(np.broadcast_to(base_utilization, shape) + rng.integers(-15, 15, size=shape, endpoint=True), 0, 100)
+        online_bookings = (utilization * 0.4 * rng.uniform(0.7, 1.3, shape)).astype(np.int64)
+        offline_bookings = (utilization * 0.6 * rng.uniform(0.7, 1.3, shape)).astype(np.int64)
+        
+        overbooking = ((utilization > 90) & (rng.random(shape) < 0.1)).astype(np.int64)
+        underbooking = np.where(utilization < 50, np.maximum(0, capacity - online_bookings - offline_bookings), 0)
+        
+        delay_factor = np.maximum(0, (utilization - 60) / 40)
+        service_delay = rng.uniform(0, 15, shape) * delay_factor
+        
+        return {
+            'restaurant_id': np.full(utilization.size, restaurant['restaurant_id']),
+            'date': np.repeat(date_strings, len(hours)),
+            'hour_slot': np.tile(hours, len(date_strings)),
+            'capacity_utilization': utilization.astype(np.float64).ravel(),
+            'overbooking_incidents': overbooking.ravel(),
+            'underbooking_slots': underbooking.ravel(),
+            'online_bookings': online_bookings.ravel(),
+            'offline_bookings': offline_bookings.ravel(),
+            'service_delay_minutes': np.round(service_delay, 1).ravel()
+        }
+    
+    def generate_service_quality_data(self, restaurants: List[Dict]) -> Dict[str, np.ndarray]:
+        """Generate daily service quality tracking data as column arrays"""
+        return self.generate_table('service_quality_tracking', restaurants)
+    
+    def _service_quality_block(self, restaurant: Dict, rng: np.random.Generator) -> Dict[str, np.ndarray]:
+        personality = restaurant['personality']
+        date_strings = self.date_strings
+        n = len(date_strings)
+        
+        if personality == 'premium_niche':
+            base_service_rating = rng.uniform(4.3, 4.7)
+            complaints_rate = 0.02
+            resolution_range = (2, 8)
+        elif personality == 'struggling_veteran':
+            base_service_rating = rng.uniform(3.5, 3.9)
+            complaints_rate = 0.08
+            resolution_range = (12, 48)
+        else:
+            base_service_rating = rng.uniform(3.8, 4.4)
+            complaints_rate = 0.04
+            resolution_range = (4, 24)
+        
+        rng = self._window_rng('service_quality_tracking', restaurant, rng)
+        reviews_count = rng.integers(2, 15, size=n, endpoint=True)
+        service_rating = np.clip(base_service_rating + rng.uniform(-0.4, 0.4, n), 1.0, 5.0)
+        complaints = (reviews_count * complaints_rate * rng.uniform(0.5, 1.5, n)).astype(np.int64)
+        resolution_time = rng.uniform(*resolution_range, n)
+        
+        # Sample categories without replacement by ranking a random key per category;
+        # only the (rare) days with complaints need their labels joined
+        category_order = np.argsort(rng.random((n, len(COMPLAINT_CATEGORIES))), axis=1)
+        categories = np.full(n, None, dtype=object)
+        for day in np.flatnonzero(complaints):
+            picked = category_order[day, :min(complaints[day], len(COMPLAINT_CATEGORIES))]
+            categories[day] = ', '.join(COMPLAINT_CATEGORIES[i] for i in picked)
+        
+        return {
+            'restaurant_id': np.full(n, restaurant['restaurant_id']),
+            'date': date_strings,
+            'reviews_count': reviews_count,
+            'avg_service_rating': np.round(service_rating, 1),
+            'complaints_count': complaints,
+            'complaint_categories': categories,
+            'resolution_time_hours': np.round(resolution_time, 1)
+        }
 
 def main():
     """Main function to run database initialization"""
+    parser = argparse.ArgumentParser(description="Initialize the Swiggy Dineout SQLite database with mock data")
+    parser.add_argument("--db-path", default="swiggy_dineout.db", help="Database file path (default: swiggy_dineout.db)")
+    parser.add_argument("--engine", choices=GENERATION_ENGINES,
+                        help="Generation engine for daily/hourly tables: row-by-row 'python' (default) or vectorized 'numpy' (default in scale-factor mode)")
+    parser.add_argument("--restaurants", type=int, help="Number of restaurants to generate (default: the 8 hand-crafted restaurants)")
+    parser.add_argument("--days", type=int, help="Days of daily/hourly history to generate (default: 30)")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Worker processes for table generation; 0 uses every CPU core (default: 1, in-process)")
+    parser.add_argument("--seed", type=int, help="Seed for reproducible data; every table and restaurant gets its own substream")
+    parser.add_argument("--end-date", type=date.fromisoformat,
+                        help="Last day of generated history as YYYY-MM-DD (default: today); pin it with --seed for byte-identical rebuilds")
+    parser.add_argument("--append", action="store_true",
+                        help="Append the days since each restaurant's last loaded date up to --end-date instead of rebuilding")
+    parser.add_argument("--optimize-only", action="store_true",
+                        help="Only rebuild rollups, bring revenue volatility up to date, create indexes and run ANALYZE on an existing database (no regeneration)")
+    parser.add_argument("--verify-plans", action="store_true",
+                        help="Check with EXPLAIN QUERY PLAN that no analyst query falls back to a full scan")
+    parser.add_argument("--scale-factor", type=float,
+                        help=f"Benchmark size: {SCALE_FACTOR_RESTAURANTS:,} restaurants x {SCALE_FACTOR_DAYS} days per unit "
+                             f"(e.g. 50 = 50k restaurants); --restaurants/--days override")
+    
+    args = parser.parse_args()
+    
+    if args.restaurants is not None and args.restaurants < 1:
+        parser.error("--restaurants must be at least 1")
+    if args.days is not None and args.days < 1:
+        parser.error("--days must be at least 1")
+    if args.scale_factor is not None and args.scale_factor <= 0:
+        parser.error("--scale-factor must be positive")
+    
+    num_restaurants, days, engine = args.restaurants, args.days, args.engine
+    if args.scale_factor is not None:
+        if num_restaurants is None:
+            num_restaurants = max(1, int(args.scale_factor * SCALE_FACTOR_RESTAURANTS))
+        if days is None:
+            days = SCALE_FACTOR_DAYS
+        engine = engine or "numpy"
+    
     try:
-        db_initializer = DatabaseInitializer()
-        db_initializer.initialize_database()
+        db_initializer = DatabaseInitializer(
+            args.db_path,
+            engine=engine or "python",
+            num_restaurants=num_restaurants,
+            days=30 if days is None else days,
+            workers=args.workers or os.cpu_count(),
+            seed=args.seed,
+            end_date=args.end_date
+        )
+        if args.optimize_only:
+            db_initializer.connect()
+            try:
+                db_initializer.create_rollup_tables()
+                db_initializer.build_rollups()
+                db_initializer.build_revenue_volatility()
+                db_initializer.optimize_schema()
+            finally:
+                db_initializer.close()
+        elif args.append:
+            db_initializer.append_database()
+        else:
+            db_initializer.initialize_database()
+        
+        if args.verify_plans:
+            db_initializer.connect()
+            try:
+                failures = db_initializer.verify_query_plans()
+            finally:
+                db_initializer.close()
+            if failures:
+                for name, plan in failures.items():
+                    print(f"❌ {name}: {' | '.join(plan)}")
+                print(f"❌ {len(failures)} of {len(ANALYST_QUERIES)} analyst queries fall back to a full scan")
+                return 1
+            print(f"✅ All {len(ANALYST_QUERIES)} analyst queries are served by index searches")
     except Exception as e:
         logger.error(f"Failed to initialize database: {e}")
         return 1
@@ -6,9 +6,23 @@ This tool creates and manages session contexts for restaurant performance analys
 It generates unique session IDs, sets up artifact directory structures, and initializes
 session state with proper database configuration.
 
+Sessions are recorded in a SQLite registry (sessions.db in the artifacts directory),
+indexed by session ID, restaurant, status and timestamp. The registry is the source of
+truth; each session's session_context.json is written as an export for the agents.
+
+Workflow progress and errors are append-only JSONL journals (workflow_execution.jsonl,
+error_log.jsonl): every event is a single atomic line append, so parallel analysts can
+log without locks or lost updates. compact_journal() rewrites the legacy
+workflow_execution.json / error_log.json documents from them on demand.
+
 Main Functions:
 - generate_session_id(): Create unique 8-character session identifier
 - create_session_context(): Initialize session with artifacts and database config
+- read_session_context(): Look up a session in the registry
+- list_sessions() / latest_session(): Indexed session listings
+- update_session_status(): Record a session's progress
+- append_journal_event() / log_workflow_event() / log_error(): Append to a session journal
+- read_journal() / compact_journal(): Read a journal, or export it in the legacy JSON shape
 - main(): Command-line interface for session initialization
 
 Usage:
@@ -20,21 +34,53 @@ Usage:
     
     # Use specific session ID
     uv run tools/utils/initialize_session.py R001 --session-id "custom123"
+    
+    # List sessions (optionally for one restaurant / status), or show the latest one
+    uv run tools/utils/initialize_session.py --list
+    uv run tools/utils/initialize_session.py R001 --list --status completed
+    uv run tools/utils/initialize_session.py R001 --latest
+    
+    # Register session directories created before the registry existed
+    uv run tools/utils/initialize_session.py --reindex
+    
+    # Journal workflow progress / errors, and export the legacy JSON documents
+    uv run tools/utils/initialize_session.py --session-id abc12345 --log-workflow '{"agent": "booking", "status": "started"}'
+    uv run tools/utils/initialize_session.py --session-id abc12345 --log-error '{"agent": "booking", "error": "timeout"}'
+    uv run tools/utils/initialize_session.py --session-id abc12345 --compact
 
 Author: Swiggy Dineout Challenge
-Version: 1.0
+Version: 1.1
 """
 
 import json
 import os
+import sqlite3
 import uuid
 from datetime import datetime
 import argparse
+from pathlib import Path
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
+# Resolved against the project root, not the working directory: agents run with their
+# session directory as cwd and log through this tool without --artifacts-dir
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+DEFAULT_ARTIFACTS_DIR = str(PROJECT_ROOT / ".artifacts")
+
+# Session registry database, inside the artifacts directory
+SESSION_REGISTRY_FILE = "sessions.db"
+
+# Registry columns besides the full context JSON
+SESSION_COLUMNS = ["session_id", "restaurant_id", "workflow", "status", "created_at", "updated_at", "artifacts_directory"]
+
+# Journal name -> (file stem in the session directory, list key of the legacy JSON document)
+SESSION_JOURNALS = {
+    "workflow": ("workflow_execution", "workflows"),
+    "error": ("error_log", "errors")
+}
+
 def generate_session_id():
     """
     Generate a unique 8-character session identifier.
@@ -52,7 +98,96 @@ def generate_session_id():
     """
     return str(uuid.uuid4())[:8]
 
-def create_session_context(session_id, restaurant_id, artifacts_dir="./.artifacts"):
+def get_registry_path(artifacts_dir=DEFAULT_ARTIFACTS_DIR):
+    """
+    Path of the session registry database for an artifacts directory.
+    """
+    return os.path.join(os.path.abspath(artifacts_dir), SESSION_REGISTRY_FILE)
+
+def connect_session_registry(artifacts_dir=DEFAULT_ARTIFACTS_DIR):
+    """
+    Open the session registry, creating the table and its indexes if needed.
+    
+    WAL mode lets concurrent sessions (batch generate) register while others read.
+    
+    Args:
+        artifacts_dir (str): Base directory for artifact storage
+        
+    Returns:
+        sqlite3.Connection: Connection with rows as sqlite3.Row
+    """
+    os.makedirs(os.path.abspath(artifacts_dir), exist_ok=True)
+    conn = sqlite3.connect(get_registry_path(artifacts_dir), timeout=30)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.executescript("""
+        CREATE TABLE IF NOT EXISTS sessions (
+            session_id TEXT PRIMARY KEY,
+            restaurant_id TEXT NOT NULL,
+            workflow TEXT,
+            status TEXT NOT NULL,
+            created_at TEXT NOT NULL,
+            updated_at TEXT NOT NULL,
+            artifacts_directory TEXT NOT NULL,
+            context TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_sessions_restaurant_created ON sessions(restaurant_id, created_at);
+        CREATE INDEX IF NOT EXISTS idx_sessions_status_created ON sessions(status, created_at);
+        CREATE INDEX IF NOT EXISTS idx_sessions_created ON sessions(created_at);
+    """)
+    return conn
+
+def register_session(session_context, artifacts_dir=DEFAULT_ARTIFACTS_DIR):
+    """
+    Insert or replace a session in the registry.
+    
+    Args:
+        session_context (dict): Session context as built by create_session_context
+        artifacts_dir (str): Base directory for artifact storage
+    """
+    now = datetime.now().isoformat()
+    conn = connect_session_registry(artifacts_dir)
+    try:
+        with conn:
+            conn.execute("""
+                INSERT INTO sessions (session_id, restaurant_id, workflow, status, created_at, updated_at, artifacts_directory, context)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(session_id) DO UPDATE SET
+                    restaurant_id = excluded.restaurant_id,
+                    workflow = excluded.workflow,
+                    status = excluded.status,
+                    created_at = excluded.created_at,
+                    updated_at = excluded.updated_at,
+                    artifacts_directory = excluded.artifacts_directory,
+                    context = excluded.context
+            """, (
+                session_context["session_id"],
+                session_context["restaurant_id"],
+                session_context.get("workflow"),
+                session_context.get("status", "initialized"),
+                session_context.get("timestamp", now),
+                now,
+                session_context["artifacts_directory"],
+                json.dumps(session_context)
+            ))
+    finally:
+        conn.close()
+
+def export_session_context(session_context):
+    """
+    Write a session's session_context.json export into its artifacts directory.
+    
+    Returns:
+        str: Path of the written file
+    """
+    context_file = os.path.join(session_context["artifacts_directory"], "session_context.json")
+    temp_file = context_file + ".tmp"
+    with open(temp_file, 'w') as f:
+        json.dump(session_context, f, indent=2)
+    os.replace(temp_file, context_file)
+    return context_file
+
+def create_session_context(session_id, restaurant_id, artifacts_dir=DEFAULT_ARTIFACTS_DIR):
     """
     Create comprehensive session context with artifacts directory structure.
     
@@ -63,7 +198,7 @@ def create_session_context(session_id, restaurant_id, artifacts_dir="./.artifact
     Args:
         session_id (str): Unique session identifier
         restaurant_id (str): Restaurant being analyzed (e.g., "R001")
-        artifacts_dir (str): Base directory for artifact storage. Default: "./.artifacts"
+        artifacts_dir (str): Base directory for artifact storage. Default: the project's .artifacts
         
     Returns:
         Tuple[Dict, str]: Session context dictionary and session directory path
@@ -107,40 +242,312 @@ def create_session_context(session_id, restaurant_id, artifacts_dir="./.artifact
         }
     }
     
-    # Save session context
-    context_file = f"{session_dir}/session_context.json"
-    with open(context_file, 'w') as f:
-        json.dump(session_context, f, indent=2)
-    
-    # Initialize workflow execution log
-    workflow_log = {"workflows": []}
-    workflow_file = f"{session_dir}/workflow_execution.json"
-    with open(workflow_file, 'w') as f:
-        json.dump(workflow_log, f, indent=2)
+    # Register the session, then export its context file
+    register_session(session_context, artifacts_dir)
+    export_session_context(session_context)
     
-    # Initialize error log
-    error_log = {"errors": []}
-    error_file = f"{session_dir}/error_log.json"
-    with open(error_file, 'w') as f:
-        json.dump(error_log, f, indent=2)
+    # Initialize the workflow execution and error journals with their (empty) legacy exports
+    for journal in SESSION_JOURNALS:
+        open(get_journal_path(session_dir, journal), 'a').close()
+        compact_journal(session_dir, journal)
     
     return session_context, session_dir
 
-def read_session_context(session_id):
+def get_journal_path(session_dir, journal):
+    """
+    Path of a session's JSONL journal ("workflow" or "error").
     """
-    Read session context from file.
+    if journal not in SESSION_JOURNALS:
+        raise ValueError(f"Unknown journal '{journal}'. Choose from: {', '.join(SESSION_JOURNALS)}")
+    return os.path.join(session_dir, f"{SESSION_JOURNALS[journal][0]}.jsonl")
+
+def append_journal_event(session_dir, journal, event):
     """
-    with open(f"./.artifacts/{session_id}/session_context.json", "r") as f:
-        return json.load(f)
+    Append one event to a session journal as a single JSON line.
+    
+    The line is written with one write() on a descriptor opened with O_APPEND, so
+    concurrent writers never interleave or overwrite each other's events and no
+    lock is needed. Events get a timestamp unless they carry one.
+    
+    Args:
+        session_dir (str): Session artifacts directory
+        journal (str): "workflow" or "error"
+        event (dict): Event payload
+        
+    Returns:
+        Dict: The event as written
+    """
+    event = {"timestamp": datetime.now().isoformat(), **event}
+    line = (json.dumps(event, default=str) + "\n").encode("utf-8")
+    
+    fd = os.open(get_journal_path(session_dir, journal), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        os.write(fd, line)
+    finally:
+        os.close(fd)
+    return event
+
+def log_workflow_event(session_dir, event):
+    """
+    Append a workflow progress event (e.g. {"agent": "booking", "status": "completed"}).
+    """
+    return append_journal_event(session_dir, "workflow", event)
+
+def log_error(session_dir, error):
+    """
+    Append an error event (e.g. {"agent": "booking", "error": "query timeout"}).
+    """
+    return append_journal_event(session_dir, "error", error)
+
+def read_journal(session_dir, journal):
+    """
+    Read every event of a session journal in append order.
+    
+    A torn final line (a writer interrupted mid-append) is skipped.
+    
+    Returns:
+        List[Dict]: Events (empty if the journal does not exist)
+    """
+    events = []
+    try:
+        with open(get_journal_path(session_dir, journal), "r") as f:
+            for line in f:
+                try:
+                    events.append(json.loads(line))
+                except ValueError:
+                    continue
+    except FileNotFoundError:
+        pass
+    return events
+
+def compact_journal(session_dir, journal):
+    """
+    Rewrite a journal's legacy JSON document (e.g. workflow_execution.json as
+    {"workflows": [...]}) from its events.
+    
+    The journal itself is left untouched, so compaction can run at any time while
+    analysts keep appending.
+    
+    Returns:
+        Dict: The legacy document
+    """
+    stem, key = SESSION_JOURNALS[journal]
+    document = {key: read_journal(session_dir, journal)}
+    
+    legacy_file = os.path.join(session_dir, f"{stem}.json")
+    temp_file = legacy_file + ".tmp"
+    with open(temp_file, 'w') as f:
+        json.dump(document, f, indent=2)
+    os.replace(temp_file, legacy_file)
+    return document
+
+def read_session_context(session_id, artifacts_dir=DEFAULT_ARTIFACTS_DIR):
+    """
+    Read a session's context from the registry.
+    
+    Sessions created before the registry existed are read from their
+    session_context.json and registered on the way.
+    
+    Args:
+        session_id (str): Session identifier
+        artifacts_dir (str): Base directory for artifact storage
+        
+    Returns:
+        Dict: Session context
+        
+    Raises:
+        FileNotFoundError: If the session is neither registered nor on disk
+    """
+    # A lookup never creates a registry; a missing one just means the session is not registered
+    row = None
+    if os.path.exists(get_registry_path(artifacts_dir)):
+        conn = connect_session_registry(artifacts_dir)
+        try:
+            row = conn.execute("SELECT context FROM sessions WHERE session_id = ?", (session_id,)).fetchone()
+        finally:
+            conn.close()
+    if row:
+        return json.loads(row["context"])
+    
+    context_file = os.path.join(os.path.abspath(artifacts_dir), session_id, "session_context.json")
+    if not os.path.exists(context_file):
+        raise FileNotFoundError(f"Session {session_id} not found in {artifacts_dir}")
+    with open(context_file, "r") as f:
+        session_context = json.load(f)
+    register_session(session_context, artifacts_dir)
+    return session_context
+
+def list_sessions(artifacts_dir=DEFAULT_ARTIFACTS_DIR, restaurant_id=None, status=None, limit=None):
+    """
+    List registered sessions, newest first.
+    
+    Args:
+        artifacts_dir (str): Base directory for artifact storage
+        restaurant_id (str): Only sessions for this restaurant
+        status (str): Only sessions with this status (e.g. "completed")
+        limit (int): Maximum number of sessions to return
+        
+    Returns:
+        List[Dict]: Registry rows (session_id, restaurant_id, workflow, status,
+            created_at, updated_at, artifacts_directory)
+    """
+    conditions = []
+    params = []
+    if restaurant_id:
+        conditions.append("restaurant_id = ?")
+        params.append(restaurant_id)
+    if status:
+        conditions.append("status = ?")
+        params.append(status)
+    
+    sql = f"SELECT {', '.join(SESSION_COLUMNS)} FROM sessions"
+    if conditions:
+        sql += " WHERE " + " AND ".join(conditions)
+    sql += " ORDER BY created_at DESC"
+    if limit:
+        sql += " LIMIT ?"
+        params.append(limit)
+    
+    conn = connect_session_registry(artifacts_dir)
+    try:
+        return [dict(row) for row in conn.execute(sql, params)]
+    finally:
+        conn.close()
+
+def latest_session(restaurant_id, artifacts_dir=DEFAULT_ARTIFACTS_DIR, status=None):
+    """
+    Most recent session for a restaurant (optionally with a given status), or None.
+    """
+    sessions = list_sessions(artifacts_dir, restaurant_id=restaurant_id, status=status, limit=1)
+    return sessions[0] if sessions else None
+
+def update_session_status(session_id, status, artifacts_dir=DEFAULT_ARTIFACTS_DIR):
+    """
+    Set a session's status in the registry and refresh its session_context.json export.
+    
+    Args:
+        session_id (str): Session identifier
+        status (str): New status (e.g. "running", "completed", "failed")
+        artifacts_dir (str): Base directory for artifact storage
+        
+    Returns:
+        Dict: Updated session context
+    """
+    session_context = read_session_context(session_id, artifacts_dir)
+    session_context["status"] = status
+    
+    conn = connect_session_registry(artifacts_dir)
+    try:
+        with conn:
+            conn.execute(
+                "UPDATE sessions SET status = ?, updated_at = ?, context = ? WHERE session_id = ?",
+                (status, datetime.now().isoformat(), json.dumps(session_context), session_id)
+            )
+    finally:
+        conn.close()
+    
+    export_session_context(session_context)
+    return session_context
+
+def reindex_sessions(artifacts_dir=DEFAULT_ARTIFACTS_DIR):
+    """
+    Register every session directory that has a session_context.json but no registry row.
+    
+    Returns:
+        int: Number of sessions added to the registry
+    """
+    artifacts_dir_abs = os.path.abspath(artifacts_dir)
+    conn = connect_session_registry(artifacts_dir)
+    try:
+        registered = {row["session_id"] for row in conn.execute("SELECT session_id FROM sessions")}
+    finally:
+        conn.close()
+    
+    added = 0
+    for entry in sorted(os.listdir(artifacts_dir_abs)):
+        context_file = os.path.join(artifacts_dir_abs, entry, "session_context.json")
+        if entry in registered or not os.path.exists(context_file):
+            continue
+        with open(context_file, "r") as f:
+            register_session(json.load(f), artifacts_dir)
+        added += 1
+    return added
+
+def print_sessions(sessions):
+    """
+    Print registry rows as a table.
+    """
+    if not sessions:
+        print("No sessions found.")
+        return
+    
+    print(f"{'SESSION':<10} {'RESTAURANT':<12} {'STATUS':<12} {'CREATED':<26} ARTIFACTS")
+    for session in sessions:
+        print(f"{session['session_id']:<10} {session['restaurant_id']:<12} {session['status']:<12} "
+              f"{session['created_at']:<26} {session['artifacts_directory']}")
 
 def main():
     parser = argparse.ArgumentParser(description="Initialize restaurant analysis session")
-    parser.add_argument("restaurant_id", help="Restaurant ID (e.g., R001)")
-    parser.add_argument("--artifacts-dir", default="./.artifacts", help="Directory for artifact storage")
+    parser.add_argument("restaurant_id", nargs="?", help="Restaurant ID (e.g., R001); a filter with --list")
+    parser.add_argument("--artifacts-dir", default=DEFAULT_ARTIFACTS_DIR,
+                        help="Directory for artifact storage (default: .artifacts in the project root)")
     parser.add_argument("--session-id", help="Use specific session ID instead of generating one")
+    query_group = parser.add_mutually_exclusive_group()
+    query_group.add_argument("--list", action="store_true", help="List registered sessions, newest first")
+    query_group.add_argument("--latest", action="store_true", help="Show the latest session for the restaurant")
+    query_group.add_argument("--reindex", action="store_true",
+                             help="Register session directories that are missing from the registry")
+    query_group.add_argument("--log-workflow", metavar="JSON", help="Append a workflow event to --session-id's journal")
+    query_group.add_argument("--log-error", metavar="JSON", help="Append an error event to --session-id's journal")
+    query_group.add_argument("--compact", action="store_true",
+                             help="Rewrite --session-id's workflow_execution.json and error_log.json from the journals")
+    parser.add_argument("--status", help="Only sessions with this status (with --list/--latest)")
+    parser.add_argument("--limit", type=int, default=50, help="Maximum sessions listed (default: 50)")
     
     args = parser.parse_args()
     
+    if args.reindex:
+        added = reindex_sessions(args.artifacts_dir)
+        print(f"✅ Registered {added} session(s) in {get_registry_path(args.artifacts_dir)}")
+        return {"registered": added}
+    
+    if args.log_workflow or args.log_error or args.compact:
+        if not args.session_id:
+            parser.error("--log-workflow, --log-error and --compact require --session-id")
+        try:
+            session_dir = read_session_context(args.session_id, args.artifacts_dir)["artifacts_directory"]
+            if args.compact:
+                counts = {journal: len(next(iter(compact_journal(session_dir, journal).values())))
+                          for journal in SESSION_JOURNALS}
+                print(f"✅ Compacted journals for session {args.session_id}: "
+                      f"{counts['workflow']} workflow event(s), {counts['error']} error(s)")
+                return counts
+            
+            journal, payload = ("workflow", args.log_workflow) if args.log_workflow else ("error", args.log_error)
+            event = json.loads(payload)
+            if not isinstance(event, dict):
+                raise ValueError("event must be a JSON object")
+            return append_journal_event(session_dir, journal, event)
+        except (FileNotFoundError, ValueError) as e:
+            print(f"❌ Error: {str(e)}")
+            return None
+    
+    if args.list:
+        sessions = list_sessions(args.artifacts_dir, args.restaurant_id, args.status, args.limit)
+        print_sessions(sessions)
+        return {"sessions": sessions}
+    
+    if not args.restaurant_id:
+        parser.error("restaurant_id is required unless --list or --reindex is given")
+    
+    if args.latest:
+        session = latest_session(args.restaurant_id, args.artifacts_dir, args.status)
+        if not session:
+            print(f"❌ No sessions found for restaurant {args.restaurant_id}")
+            return None
+        print_sessions([session])
+        return session
+    
     # Generate or use provided session ID
     session_id = args.session_id if args.session_id else generate_session_id()
     
@@ -168,6 +575,8 @@ def main():
 
 if __name__ == "__main__":
     result = main()
+    if result is None:
+        exit(1)
     if result:
         # Print JSON output for script chaining
         print("\n" + json.dumps(result, indent=2))
\ No newline at end of file